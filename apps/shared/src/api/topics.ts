@@ -38,7 +38,15 @@ export const fetchTopics = async (baseUrl: string): Promise<Topic[]> => {
     });
     const api = new DefaultApi(config);
 
-    const response = await api.getTopics({ cache: 'no-store' });
+    // /topics is paged; follow next_cursor until the last page. Each page is
+    // revalidated with the server's ETag instead of re-downloading it.
+    const topics: Topic[] = [];
+    let cursor: string | undefined;
+    do {
+        const response = await api.getTopics({ cursor, limit: 200 }, { cache: 'no-cache' });
+        topics.push(...response.topics.map(mapTopic));
+        cursor = response.nextCursor ?? undefined;
+    } while (cursor);
 
-    return response.topics.map(mapTopic);
+    return topics;
 };
@@ -16,18 +16,59 @@
 import * as runtime from '../runtime';
 import type {
   PlaybackContentSchema,
+  ProcessedInputBatchSchema,
   ProcessedInputSchema,
+  QueueAdvanceSchema,
+  QueueLeaseListSchema,
+  QueueLeaseRequestSchema,
+  QueueLeaseResultSchema,
+  QueueLeaseSchema,
+  QueueNackSchema,
+  QueueStatsSchema,
+  TopicChangesSchema,
   TopicListSchema,
+  TopicSchema,
+  TopicSummaryListSchema,
 } from '../models/index';
 import {
     PlaybackContentSchemaFromJSON,
     PlaybackContentSchemaToJSON,
+    ProcessedInputBatchSchemaFromJSON,
+    ProcessedInputBatchSchemaToJSON,
     ProcessedInputSchemaFromJSON,
     ProcessedInputSchemaToJSON,
+    QueueAdvanceSchemaFromJSON,
+    QueueAdvanceSchemaToJSON,
+    QueueLeaseListSchemaFromJSON,
+    QueueLeaseListSchemaToJSON,
+    QueueLeaseRequestSchemaFromJSON,
+    QueueLeaseRequestSchemaToJSON,
+    QueueLeaseResultSchemaFromJSON,
+    QueueLeaseResultSchemaToJSON,
+    QueueLeaseSchemaFromJSON,
+    QueueLeaseSchemaToJSON,
+    QueueNackSchemaFromJSON,
+    QueueNackSchemaToJSON,
+    QueueStatsSchemaFromJSON,
+    QueueStatsSchemaToJSON,
+    TopicChangesSchemaFromJSON,
+    TopicChangesSchemaToJSON,
     TopicListSchemaFromJSON,
     TopicListSchemaToJSON,
+    TopicSchemaFromJSON,
+    TopicSchemaToJSON,
+    TopicSummaryListSchemaFromJSON,
+    TopicSummaryListSchemaToJSON,
 } from '../models/index';
 
+export interface AckQueueLeaseRequest {
+    queueLeaseSchema: QueueLeaseSchema;
+}
+
+export interface AdvanceQueueLeaseRequest {
+    queueAdvanceSchema: QueueAdvanceSchema;
+}
+
 export interface CreatePlaybackContentRequest {
     playbackContentSchema: PlaybackContentSchema;
 }
@@ -36,15 +77,130 @@ export interface CreateProcessedInputRequest {
     processedInputSchema: ProcessedInputSchema;
 }
 
+export interface CreateProcessedInputsBatchRequest {
+    processedInputBatchSchema: ProcessedInputBatchSchema;
+}
+
 export interface GetProcessedInputRequest {
     inputId: string;
 }
 
+export interface GetTopicRequest {
+    topicId: string;
+}
+
+export interface GetTopicChangesRequest {
+    since: number;
+    limit?: number;
+}
+
+export interface GetTopicEventsRequest {
+    since?: number;
+}
+
+export interface GetTopicSummariesRequest {
+    cursor?: string;
+    limit?: number;
+}
+
+export interface GetTopicsRequest {
+    cursor?: string;
+    limit?: number;
+}
+
+export interface LeaseQueueJobsRequest {
+    queueLeaseRequestSchema: QueueLeaseRequestSchema;
+}
+
+export interface NackQueueLeaseRequest {
+    queueNackSchema: QueueNackSchema;
+}
+
+export interface SearchTopicsRequest {
+    q: string;
+    cursor?: string;
+    limit?: number;
+}
+
 /**
  * 
  */
 export class DefaultApi extends runtime.BaseAPI {
 
+    /**
+     */
+    async ackQueueLeaseRaw(requestParameters: AckQueueLeaseRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<QueueLeaseResultSchema>> {
+        if (requestParameters['queueLeaseSchema'] == null) {
+            throw new runtime.RequiredError(
+                'queueLeaseSchema',
+                'Required parameter "queueLeaseSchema" was null or undefined when calling ackQueueLease().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        headerParameters['Content-Type'] = 'application/json';
+
+
+        let urlPath = `/queue/ack`;
+
+        const response = await this.request({
+            path: urlPath,
+            method: 'POST',
+            headers: headerParameters,
+            query: queryParameters,
+            body: QueueLeaseSchemaToJSON(requestParameters['queueLeaseSchema']),
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => QueueLeaseResultSchemaFromJSON(jsonValue));
+    }
+
+    /**
+     */
+    async ackQueueLease(requestParameters: AckQueueLeaseRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<QueueLeaseResultSchema> {
+        const response = await this.ackQueueLeaseRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
+    /**
+     */
+    async advanceQueueLeaseRaw(requestParameters: AdvanceQueueLeaseRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<QueueLeaseResultSchema>> {
+        if (requestParameters['queueAdvanceSchema'] == null) {
+            throw new runtime.RequiredError(
+                'queueAdvanceSchema',
+                'Required parameter "queueAdvanceSchema" was null or undefined when calling advanceQueueLease().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        headerParameters['Content-Type'] = 'application/json';
+
+
+        let urlPath = `/queue/advance`;
+
+        const response = await this.request({
+            path: urlPath,
+            method: 'POST',
+            headers: headerParameters,
+            query: queryParameters,
+            body: QueueAdvanceSchemaToJSON(requestParameters['queueAdvanceSchema']),
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => QueueLeaseResultSchemaFromJSON(jsonValue));
+    }
+
+    /**
+     */
+    async advanceQueueLease(requestParameters: AdvanceQueueLeaseRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<QueueLeaseResultSchema> {
+        const response = await this.advanceQueueLeaseRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
     /**
      */
     async createPlaybackContentRaw(requestParameters: CreatePlaybackContentRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<PlaybackContentSchema>> {
@@ -119,6 +275,43 @@ export class DefaultApi extends runtime.BaseAPI {
         return await response.value();
     }
 
+    /**
+     */
+    async createProcessedInputsBatchRaw(requestParameters: CreateProcessedInputsBatchRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<ProcessedInputBatchSchema>> {
+        if (requestParameters['processedInputBatchSchema'] == null) {
+            throw new runtime.RequiredError(
+                'processedInputBatchSchema',
+                'Required parameter "processedInputBatchSchema" was null or undefined when calling createProcessedInputsBatch().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        headerParameters['Content-Type'] = 'application/json';
+
+
+        let urlPath = `/processed-inputs/batch`;
+
+        const response = await this.request({
+            path: urlPath,
+            method: 'POST',
+            headers: headerParameters,
+            query: queryParameters,
+            body: ProcessedInputBatchSchemaToJSON(requestParameters['processedInputBatchSchema']),
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => ProcessedInputBatchSchemaFromJSON(jsonValue));
+    }
+
+    /**
+     */
+    async createProcessedInputsBatch(requestParameters: CreateProcessedInputsBatchRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<ProcessedInputBatchSchema> {
+        const response = await this.createProcessedInputsBatchRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
     /**
      */
     async getProcessedInputRaw(requestParameters: GetProcessedInputRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<ProcessedInputSchema>> {
@@ -156,9 +349,195 @@ export class DefaultApi extends runtime.BaseAPI {
 
     /**
      */
-    async getTopicsRaw(initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<TopicListSchema>> {
+    async getQueueStatsRaw(initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<QueueStatsSchema>> {
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+
+        let urlPath = `/queue/stats`;
+
+        const response = await this.request({
+            path: urlPath,
+            method: 'GET',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => QueueStatsSchemaFromJSON(jsonValue));
+    }
+
+    /**
+     */
+    async getQueueStats(initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<QueueStatsSchema> {
+        const response = await this.getQueueStatsRaw(initOverrides);
+        return await response.value();
+    }
+
+    /**
+     */
+    async getTopicRaw(requestParameters: GetTopicRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<TopicSchema>> {
+        if (requestParameters['topicId'] == null) {
+            throw new runtime.RequiredError(
+                'topicId',
+                'Required parameter "topicId" was null or undefined when calling getTopic().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+
+        let urlPath = `/topics/{topic_id}`;
+        urlPath = urlPath.replace(`{${"topic_id"}}`, encodeURIComponent(String(requestParameters['topicId'])));
+
+        const response = await this.request({
+            path: urlPath,
+            method: 'GET',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => TopicSchemaFromJSON(jsonValue));
+    }
+
+    /**
+     */
+    async getTopic(requestParameters: GetTopicRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<TopicSchema> {
+        const response = await this.getTopicRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
+    /**
+     */
+    async getTopicChangesRaw(requestParameters: GetTopicChangesRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<TopicChangesSchema>> {
+        if (requestParameters['since'] == null) {
+            throw new runtime.RequiredError(
+                'since',
+                'Required parameter "since" was null or undefined when calling getTopicChanges().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        if (requestParameters['limit'] != null) {
+            queryParameters['limit'] = requestParameters['limit'];
+        }
+
+        if (requestParameters['since'] != null) {
+            queryParameters['since'] = requestParameters['since'];
+        }
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+
+        let urlPath = `/topics/changes`;
+
+        const response = await this.request({
+            path: urlPath,
+            method: 'GET',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => TopicChangesSchemaFromJSON(jsonValue));
+    }
+
+    /**
+     */
+    async getTopicChanges(requestParameters: GetTopicChangesRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<TopicChangesSchema> {
+        const response = await this.getTopicChangesRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
+    /**
+     *      Streams server-sent events as topics are stored: \"topic-created\" while a     topic has no audio yet and \"playback-ready\" once its playback content is     saved, each carrying the topic as TopicSchema JSON.      Event ids are database revisions, so a reconnecting EventSource resumes     where it left off through Last-Event-ID. Without one the stream starts     from `since`, or from now. Past TOPIC_EVENTS_MAX_STREAMS open streams,     the stream ends at once and asks the client to reconnect later.     
+     */
+    async getTopicEventsRaw(requestParameters: GetTopicEventsRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<Error>> {
+        const queryParameters: any = {};
+
+        if (requestParameters['since'] != null) {
+            queryParameters['since'] = requestParameters['since'];
+        }
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+
+        let urlPath = `/topics/events`;
+
+        const response = await this.request({
+            path: urlPath,
+            method: 'GET',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        if (this.isJsonMime(response.headers.get('content-type'))) {
+            return new runtime.JSONApiResponse<Error>(response);
+        } else {
+            return new runtime.TextApiResponse(response) as any;
+        }
+    }
+
+    /**
+     *      Streams server-sent events as topics are stored: \"topic-created\" while a     topic has no audio yet and \"playback-ready\" once its playback content is     saved, each carrying the topic as TopicSchema JSON.      Event ids are database revisions, so a reconnecting EventSource resumes     where it left off through Last-Event-ID. Without one the stream starts     from `since`, or from now. Past TOPIC_EVENTS_MAX_STREAMS open streams,     the stream ends at once and asks the client to reconnect later.     
+     */
+    async getTopicEvents(requestParameters: GetTopicEventsRequest = {}, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<Error> {
+        const response = await this.getTopicEventsRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
+    /**
+     *      Lists topics like /topics, but leaves out the processed input\'s content,     which list views don\'t show. Fetch /topics/<topic_id> for the full record.     
+     */
+    async getTopicSummariesRaw(requestParameters: GetTopicSummariesRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<TopicSummaryListSchema>> {
         const queryParameters: any = {};
 
+        if (requestParameters['cursor'] != null) {
+            queryParameters['cursor'] = requestParameters['cursor'];
+        }
+
+        if (requestParameters['limit'] != null) {
+            queryParameters['limit'] = requestParameters['limit'];
+        }
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+
+        let urlPath = `/topics/summaries`;
+
+        const response = await this.request({
+            path: urlPath,
+            method: 'GET',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => TopicSummaryListSchemaFromJSON(jsonValue));
+    }
+
+    /**
+     *      Lists topics like /topics, but leaves out the processed input\'s content,     which list views don\'t show. Fetch /topics/<topic_id> for the full record.     
+     */
+    async getTopicSummaries(requestParameters: GetTopicSummariesRequest = {}, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<TopicSummaryListSchema> {
+        const response = await this.getTopicSummariesRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
+    /**
+     */
+    async getTopicsRaw(requestParameters: GetTopicsRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<TopicListSchema>> {
+        const queryParameters: any = {};
+
+        if (requestParameters['cursor'] != null) {
+            queryParameters['cursor'] = requestParameters['cursor'];
+        }
+
+        if (requestParameters['limit'] != null) {
+            queryParameters['limit'] = requestParameters['limit'];
+        }
+
         const headerParameters: runtime.HTTPHeaders = {};
 
 
@@ -176,8 +555,128 @@ export class DefaultApi extends runtime.BaseAPI {
 
     /**
      */
-    async getTopics(initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<TopicListSchema> {
-        const response = await this.getTopicsRaw(initOverrides);
+    async getTopics(requestParameters: GetTopicsRequest = {}, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<TopicListSchema> {
+        const response = await this.getTopicsRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
+    /**
+     */
+    async leaseQueueJobsRaw(requestParameters: LeaseQueueJobsRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<QueueLeaseListSchema>> {
+        if (requestParameters['queueLeaseRequestSchema'] == null) {
+            throw new runtime.RequiredError(
+                'queueLeaseRequestSchema',
+                'Required parameter "queueLeaseRequestSchema" was null or undefined when calling leaseQueueJobs().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        headerParameters['Content-Type'] = 'application/json';
+
+
+        let urlPath = `/queue/lease`;
+
+        const response = await this.request({
+            path: urlPath,
+            method: 'POST',
+            headers: headerParameters,
+            query: queryParameters,
+            body: QueueLeaseRequestSchemaToJSON(requestParameters['queueLeaseRequestSchema']),
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => QueueLeaseListSchemaFromJSON(jsonValue));
+    }
+
+    /**
+     */
+    async leaseQueueJobs(requestParameters: LeaseQueueJobsRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<QueueLeaseListSchema> {
+        const response = await this.leaseQueueJobsRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
+    /**
+     */
+    async nackQueueLeaseRaw(requestParameters: NackQueueLeaseRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<QueueLeaseResultSchema>> {
+        if (requestParameters['queueNackSchema'] == null) {
+            throw new runtime.RequiredError(
+                'queueNackSchema',
+                'Required parameter "queueNackSchema" was null or undefined when calling nackQueueLease().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        headerParameters['Content-Type'] = 'application/json';
+
+
+        let urlPath = `/queue/nack`;
+
+        const response = await this.request({
+            path: urlPath,
+            method: 'POST',
+            headers: headerParameters,
+            query: queryParameters,
+            body: QueueNackSchemaToJSON(requestParameters['queueNackSchema']),
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => QueueLeaseResultSchemaFromJSON(jsonValue));
+    }
+
+    /**
+     */
+    async nackQueueLease(requestParameters: NackQueueLeaseRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<QueueLeaseResultSchema> {
+        const response = await this.nackQueueLeaseRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
+    /**
+     */
+    async searchTopicsRaw(requestParameters: SearchTopicsRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<TopicListSchema>> {
+        if (requestParameters['q'] == null) {
+            throw new runtime.RequiredError(
+                'q',
+                'Required parameter "q" was null or undefined when calling searchTopics().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        if (requestParameters['cursor'] != null) {
+            queryParameters['cursor'] = requestParameters['cursor'];
+        }
+
+        if (requestParameters['limit'] != null) {
+            queryParameters['limit'] = requestParameters['limit'];
+        }
+
+        if (requestParameters['q'] != null) {
+            queryParameters['q'] = requestParameters['q'];
+        }
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+
+        let urlPath = `/topics/search`;
+
+        const response = await this.request({
+            path: urlPath,
+            method: 'GET',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => TopicListSchemaFromJSON(jsonValue));
+    }
+
+    /**
+     */
+    async searchTopics(requestParameters: SearchTopicsRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<TopicListSchema> {
+        const response = await this.searchTopicsRaw(requestParameters, initOverrides);
         return await response.value();
     }
 
@@ -0,0 +1,74 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * My API
+ * No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+import type { ProcessedInputSchema } from './ProcessedInputSchema';
+import {
+    ProcessedInputSchemaFromJSON,
+    ProcessedInputSchemaFromJSONTyped,
+    ProcessedInputSchemaToJSON,
+    ProcessedInputSchemaToJSONTyped,
+} from './ProcessedInputSchema';
+
+/**
+ * 
+ * @export
+ * @interface ProcessedInputBatchSchema
+ */
+export interface ProcessedInputBatchSchema {
+    /**
+     * 
+     * @type {Array<ProcessedInputSchema>}
+     * @memberof ProcessedInputBatchSchema
+     */
+    processedInputs: Array<ProcessedInputSchema>;
+}
+
+/**
+ * Check if a given object implements the ProcessedInputBatchSchema interface.
+ */
+export function instanceOfProcessedInputBatchSchema(value: object): value is ProcessedInputBatchSchema {
+    if (!('processedInputs' in value) || value['processedInputs'] === undefined) return false;
+    return true;
+}
+
+export function ProcessedInputBatchSchemaFromJSON(json: any): ProcessedInputBatchSchema {
+    return ProcessedInputBatchSchemaFromJSONTyped(json, false);
+}
+
+export function ProcessedInputBatchSchemaFromJSONTyped(json: any, ignoreDiscriminator: boolean): ProcessedInputBatchSchema {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'processedInputs': ((json['processed_inputs'] as Array<any>).map(ProcessedInputSchemaFromJSON)),
+    };
+}
+
+export function ProcessedInputBatchSchemaToJSON(json: any): ProcessedInputBatchSchema {
+    return ProcessedInputBatchSchemaToJSONTyped(json, false);
+}
+
+export function ProcessedInputBatchSchemaToJSONTyped(value?: ProcessedInputBatchSchema | null, ignoreDiscriminator: boolean = false): any {
+    if (value == null) {
+        return value;
+    }
+
+    return {
+        
+        'processed_inputs': ((value['processedInputs'] as Array<any>).map(ProcessedInputSchemaToJSON)),
+    };
+}
+
@@ -0,0 +1,96 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * My API
+ * No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+import type { QueueLeaseSchema } from './QueueLeaseSchema';
+import {
+    QueueLeaseSchemaFromJSON,
+    QueueLeaseSchemaFromJSONTyped,
+    QueueLeaseSchemaToJSON,
+    QueueLeaseSchemaToJSONTyped,
+} from './QueueLeaseSchema';
+
+/**
+ * 
+ * @export
+ * @interface QueueAdvanceSchema
+ */
+export interface QueueAdvanceSchema {
+    /**
+     * 
+     * @type {QueueLeaseSchema}
+     * @memberof QueueAdvanceSchema
+     */
+    lease: QueueLeaseSchema;
+    /**
+     * 
+     * @type {string}
+     * @memberof QueueAdvanceSchema
+     */
+    stage: QueueAdvanceSchemaStageEnum;
+}
+
+
+/**
+ * @export
+ */
+export const QueueAdvanceSchemaStageEnum = {
+    Fetch: 'fetch',
+    Script: 'script',
+    Tts: 'tts',
+    Transcribe: 'transcribe'
+} as const;
+export type QueueAdvanceSchemaStageEnum = typeof QueueAdvanceSchemaStageEnum[keyof typeof QueueAdvanceSchemaStageEnum];
+
+
+/**
+ * Check if a given object implements the QueueAdvanceSchema interface.
+ */
+export function instanceOfQueueAdvanceSchema(value: object): value is QueueAdvanceSchema {
+    if (!('lease' in value) || value['lease'] === undefined) return false;
+    if (!('stage' in value) || value['stage'] === undefined) return false;
+    return true;
+}
+
+export function QueueAdvanceSchemaFromJSON(json: any): QueueAdvanceSchema {
+    return QueueAdvanceSchemaFromJSONTyped(json, false);
+}
+
+export function QueueAdvanceSchemaFromJSONTyped(json: any, ignoreDiscriminator: boolean): QueueAdvanceSchema {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'lease': QueueLeaseSchemaFromJSON(json['lease']),
+        'stage': json['stage'],
+    };
+}
+
+export function QueueAdvanceSchemaToJSON(json: any): QueueAdvanceSchema {
+    return QueueAdvanceSchemaToJSONTyped(json, false);
+}
+
+export function QueueAdvanceSchemaToJSONTyped(value?: QueueAdvanceSchema | null, ignoreDiscriminator: boolean = false): any {
+    if (value == null) {
+        return value;
+    }
+
+    return {
+        
+        'lease': QueueLeaseSchemaToJSON(value['lease']),
+        'stage': value['stage'],
+    };
+}
+
@@ -0,0 +1,74 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * My API
+ * No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+import type { QueueLeaseSchema } from './QueueLeaseSchema';
+import {
+    QueueLeaseSchemaFromJSON,
+    QueueLeaseSchemaFromJSONTyped,
+    QueueLeaseSchemaToJSON,
+    QueueLeaseSchemaToJSONTyped,
+} from './QueueLeaseSchema';
+
+/**
+ * 
+ * @export
+ * @interface QueueLeaseListSchema
+ */
+export interface QueueLeaseListSchema {
+    /**
+     * 
+     * @type {Array<QueueLeaseSchema>}
+     * @memberof QueueLeaseListSchema
+     */
+    leases: Array<QueueLeaseSchema>;
+}
+
+/**
+ * Check if a given object implements the QueueLeaseListSchema interface.
+ */
+export function instanceOfQueueLeaseListSchema(value: object): value is QueueLeaseListSchema {
+    if (!('leases' in value) || value['leases'] === undefined) return false;
+    return true;
+}
+
+export function QueueLeaseListSchemaFromJSON(json: any): QueueLeaseListSchema {
+    return QueueLeaseListSchemaFromJSONTyped(json, false);
+}
+
+export function QueueLeaseListSchemaFromJSONTyped(json: any, ignoreDiscriminator: boolean): QueueLeaseListSchema {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'leases': ((json['leases'] as Array<any>).map(QueueLeaseSchemaFromJSON)),
+    };
+}
+
+export function QueueLeaseListSchemaToJSON(json: any): QueueLeaseListSchema {
+    return QueueLeaseListSchemaToJSONTyped(json, false);
+}
+
+export function QueueLeaseListSchemaToJSONTyped(value?: QueueLeaseListSchema | null, ignoreDiscriminator: boolean = false): any {
+    if (value == null) {
+        return value;
+    }
+
+    return {
+        
+        'leases': ((value['leases'] as Array<any>).map(QueueLeaseSchemaToJSON)),
+    };
+}
+
@@ -0,0 +1,103 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * My API
+ * No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+/**
+ * 
+ * @export
+ * @interface QueueLeaseRequestSchema
+ */
+export interface QueueLeaseRequestSchema {
+    /**
+     * 
+     * @type {number}
+     * @memberof QueueLeaseRequestSchema
+     */
+    maxJobs?: number;
+    /**
+     * 
+     * @type {Array<string>}
+     * @memberof QueueLeaseRequestSchema
+     */
+    stages?: Array<QueueLeaseRequestSchemaStagesEnum>;
+    /**
+     * 
+     * @type {number}
+     * @memberof QueueLeaseRequestSchema
+     */
+    waitSeconds?: number;
+    /**
+     * 
+     * @type {string}
+     * @memberof QueueLeaseRequestSchema
+     */
+    workerId: string;
+}
+
+
+/**
+ * @export
+ */
+export const QueueLeaseRequestSchemaStagesEnum = {
+    Fetch: 'fetch',
+    Script: 'script',
+    Tts: 'tts',
+    Transcribe: 'transcribe'
+} as const;
+export type QueueLeaseRequestSchemaStagesEnum = typeof QueueLeaseRequestSchemaStagesEnum[keyof typeof QueueLeaseRequestSchemaStagesEnum];
+
+
+/**
+ * Check if a given object implements the QueueLeaseRequestSchema interface.
+ */
+export function instanceOfQueueLeaseRequestSchema(value: object): value is QueueLeaseRequestSchema {
+    if (!('workerId' in value) || value['workerId'] === undefined) return false;
+    return true;
+}
+
+export function QueueLeaseRequestSchemaFromJSON(json: any): QueueLeaseRequestSchema {
+    return QueueLeaseRequestSchemaFromJSONTyped(json, false);
+}
+
+export function QueueLeaseRequestSchemaFromJSONTyped(json: any, ignoreDiscriminator: boolean): QueueLeaseRequestSchema {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'maxJobs': json['max_jobs'] == null ? undefined : json['max_jobs'],
+        'stages': json['stages'] == null ? undefined : json['stages'],
+        'waitSeconds': json['wait_seconds'] == null ? undefined : json['wait_seconds'],
+        'workerId': json['worker_id'],
+    };
+}
+
+export function QueueLeaseRequestSchemaToJSON(json: any): QueueLeaseRequestSchema {
+    return QueueLeaseRequestSchemaToJSONTyped(json, false);
+}
+
+export function QueueLeaseRequestSchemaToJSONTyped(value?: QueueLeaseRequestSchema | null, ignoreDiscriminator: boolean = false): any {
+    if (value == null) {
+        return value;
+    }
+
+    return {
+        
+        'max_jobs': value['maxJobs'],
+        'stages': value['stages'],
+        'wait_seconds': value['waitSeconds'],
+        'worker_id': value['workerId'],
+    };
+}
+
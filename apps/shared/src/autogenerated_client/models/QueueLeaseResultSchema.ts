@@ -0,0 +1,66 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * My API
+ * No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+/**
+ * 
+ * @export
+ * @interface QueueLeaseResultSchema
+ */
+export interface QueueLeaseResultSchema {
+    /**
+     * 
+     * @type {boolean}
+     * @memberof QueueLeaseResultSchema
+     */
+    ok: boolean;
+}
+
+/**
+ * Check if a given object implements the QueueLeaseResultSchema interface.
+ */
+export function instanceOfQueueLeaseResultSchema(value: object): value is QueueLeaseResultSchema {
+    if (!('ok' in value) || value['ok'] === undefined) return false;
+    return true;
+}
+
+export function QueueLeaseResultSchemaFromJSON(json: any): QueueLeaseResultSchema {
+    return QueueLeaseResultSchemaFromJSONTyped(json, false);
+}
+
+export function QueueLeaseResultSchemaFromJSONTyped(json: any, ignoreDiscriminator: boolean): QueueLeaseResultSchema {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'ok': json['ok'],
+    };
+}
+
+export function QueueLeaseResultSchemaToJSON(json: any): QueueLeaseResultSchema {
+    return QueueLeaseResultSchemaToJSONTyped(json, false);
+}
+
+export function QueueLeaseResultSchemaToJSONTyped(value?: QueueLeaseResultSchema | null, ignoreDiscriminator: boolean = false): any {
+    if (value == null) {
+        return value;
+    }
+
+    return {
+        
+        'ok': value['ok'],
+    };
+}
+
@@ -0,0 +1,127 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * My API
+ * No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+import type { ProcessedInputSchema } from './ProcessedInputSchema';
+import {
+    ProcessedInputSchemaFromJSON,
+    ProcessedInputSchemaFromJSONTyped,
+    ProcessedInputSchemaToJSON,
+    ProcessedInputSchemaToJSONTyped,
+} from './ProcessedInputSchema';
+
+/**
+ * 
+ * @export
+ * @interface QueueLeaseSchema
+ */
+export interface QueueLeaseSchema {
+    /**
+     * 
+     * @type {number}
+     * @memberof QueueLeaseSchema
+     */
+    attempts: number;
+    /**
+     * 
+     * @type {number}
+     * @memberof QueueLeaseSchema
+     */
+    id: number;
+    /**
+     * 
+     * @type {number}
+     * @memberof QueueLeaseSchema
+     */
+    leasedUntil: number;
+    /**
+     * 
+     * @type {ProcessedInputSchema}
+     * @memberof QueueLeaseSchema
+     */
+    processedInput?: ProcessedInputSchema;
+    /**
+     * 
+     * @type {string}
+     * @memberof QueueLeaseSchema
+     */
+    stage: string;
+    /**
+     * 
+     * @type {string}
+     * @memberof QueueLeaseSchema
+     */
+    topicId: string;
+    /**
+     * 
+     * @type {string}
+     * @memberof QueueLeaseSchema
+     */
+    workerId: string;
+}
+
+/**
+ * Check if a given object implements the QueueLeaseSchema interface.
+ */
+export function instanceOfQueueLeaseSchema(value: object): value is QueueLeaseSchema {
+    if (!('attempts' in value) || value['attempts'] === undefined) return false;
+    if (!('id' in value) || value['id'] === undefined) return false;
+    if (!('leasedUntil' in value) || value['leasedUntil'] === undefined) return false;
+    if (!('stage' in value) || value['stage'] === undefined) return false;
+    if (!('topicId' in value) || value['topicId'] === undefined) return false;
+    if (!('workerId' in value) || value['workerId'] === undefined) return false;
+    return true;
+}
+
+export function QueueLeaseSchemaFromJSON(json: any): QueueLeaseSchema {
+    return QueueLeaseSchemaFromJSONTyped(json, false);
+}
+
+export function QueueLeaseSchemaFromJSONTyped(json: any, ignoreDiscriminator: boolean): QueueLeaseSchema {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'attempts': json['attempts'],
+        'id': json['id'],
+        'leasedUntil': json['leased_until'],
+        'processedInput': json['processed_input'] == null ? undefined : ProcessedInputSchemaFromJSON(json['processed_input']),
+        'stage': json['stage'],
+        'topicId': json['topic_id'],
+        'workerId': json['worker_id'],
+    };
+}
+
+export function QueueLeaseSchemaToJSON(json: any): QueueLeaseSchema {
+    return QueueLeaseSchemaToJSONTyped(json, false);
+}
+
+export function QueueLeaseSchemaToJSONTyped(value?: QueueLeaseSchema | null, ignoreDiscriminator: boolean = false): any {
+    if (value == null) {
+        return value;
+    }
+
+    return {
+        
+        'attempts': value['attempts'],
+        'id': value['id'],
+        'leased_until': value['leasedUntil'],
+        'processed_input': ProcessedInputSchemaToJSON(value['processedInput']),
+        'stage': value['stage'],
+        'topic_id': value['topicId'],
+        'worker_id': value['workerId'],
+    };
+}
+
@@ -0,0 +1,82 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * My API
+ * No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+import type { QueueLeaseSchema } from './QueueLeaseSchema';
+import {
+    QueueLeaseSchemaFromJSON,
+    QueueLeaseSchemaFromJSONTyped,
+    QueueLeaseSchemaToJSON,
+    QueueLeaseSchemaToJSONTyped,
+} from './QueueLeaseSchema';
+
+/**
+ * 
+ * @export
+ * @interface QueueNackSchema
+ */
+export interface QueueNackSchema {
+    /**
+     * 
+     * @type {string}
+     * @memberof QueueNackSchema
+     */
+    error?: string | null;
+    /**
+     * 
+     * @type {QueueLeaseSchema}
+     * @memberof QueueNackSchema
+     */
+    lease: QueueLeaseSchema;
+}
+
+/**
+ * Check if a given object implements the QueueNackSchema interface.
+ */
+export function instanceOfQueueNackSchema(value: object): value is QueueNackSchema {
+    if (!('lease' in value) || value['lease'] === undefined) return false;
+    return true;
+}
+
+export function QueueNackSchemaFromJSON(json: any): QueueNackSchema {
+    return QueueNackSchemaFromJSONTyped(json, false);
+}
+
+export function QueueNackSchemaFromJSONTyped(json: any, ignoreDiscriminator: boolean): QueueNackSchema {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'error': json['error'] == null ? undefined : json['error'],
+        'lease': QueueLeaseSchemaFromJSON(json['lease']),
+    };
+}
+
+export function QueueNackSchemaToJSON(json: any): QueueNackSchema {
+    return QueueNackSchemaToJSONTyped(json, false);
+}
+
+export function QueueNackSchemaToJSONTyped(value?: QueueNackSchema | null, ignoreDiscriminator: boolean = false): any {
+    if (value == null) {
+        return value;
+    }
+
+    return {
+        
+        'error': value['error'],
+        'lease': QueueLeaseSchemaToJSON(value['lease']),
+    };
+}
+
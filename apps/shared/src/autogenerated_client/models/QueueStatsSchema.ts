@@ -0,0 +1,127 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * My API
+ * No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+import type { StageStatsSchema } from './StageStatsSchema';
+import {
+    StageStatsSchemaFromJSON,
+    StageStatsSchemaFromJSONTyped,
+    StageStatsSchemaToJSON,
+    StageStatsSchemaToJSONTyped,
+} from './StageStatsSchema';
+
+/**
+ * 
+ * @export
+ * @interface QueueStatsSchema
+ */
+export interface QueueStatsSchema {
+    /**
+     * 
+     * @type {number}
+     * @memberof QueueStatsSchema
+     */
+    completedPerMinute: number;
+    /**
+     * 
+     * @type {number}
+     * @memberof QueueStatsSchema
+     */
+    deadLetter: number;
+    /**
+     * 
+     * @type {number}
+     * @memberof QueueStatsSchema
+     */
+    leased: number;
+    /**
+     * 
+     * @type {number}
+     * @memberof QueueStatsSchema
+     */
+    oldestPendingAgeSeconds?: number | null;
+    /**
+     * 
+     * @type {number}
+     * @memberof QueueStatsSchema
+     */
+    pending: number;
+    /**
+     * 
+     * @type {number}
+     * @memberof QueueStatsSchema
+     */
+    retrying: number;
+    /**
+     * 
+     * @type {{ [key: string]: StageStatsSchema; }}
+     * @memberof QueueStatsSchema
+     */
+    stages: { [key: string]: StageStatsSchema; };
+}
+
+/**
+ * Check if a given object implements the QueueStatsSchema interface.
+ */
+export function instanceOfQueueStatsSchema(value: object): value is QueueStatsSchema {
+    if (!('completedPerMinute' in value) || value['completedPerMinute'] === undefined) return false;
+    if (!('deadLetter' in value) || value['deadLetter'] === undefined) return false;
+    if (!('leased' in value) || value['leased'] === undefined) return false;
+    if (!('pending' in value) || value['pending'] === undefined) return false;
+    if (!('retrying' in value) || value['retrying'] === undefined) return false;
+    if (!('stages' in value) || value['stages'] === undefined) return false;
+    return true;
+}
+
+export function QueueStatsSchemaFromJSON(json: any): QueueStatsSchema {
+    return QueueStatsSchemaFromJSONTyped(json, false);
+}
+
+export function QueueStatsSchemaFromJSONTyped(json: any, ignoreDiscriminator: boolean): QueueStatsSchema {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'completedPerMinute': json['completed_per_minute'],
+        'deadLetter': json['dead_letter'],
+        'leased': json['leased'],
+        'oldestPendingAgeSeconds': json['oldest_pending_age_seconds'] == null ? undefined : json['oldest_pending_age_seconds'],
+        'pending': json['pending'],
+        'retrying': json['retrying'],
+        'stages': (mapValues(json['stages'], StageStatsSchemaFromJSON)),
+    };
+}
+
+export function QueueStatsSchemaToJSON(json: any): QueueStatsSchema {
+    return QueueStatsSchemaToJSONTyped(json, false);
+}
+
+export function QueueStatsSchemaToJSONTyped(value?: QueueStatsSchema | null, ignoreDiscriminator: boolean = false): any {
+    if (value == null) {
+        return value;
+    }
+
+    return {
+        
+        'completed_per_minute': value['completedPerMinute'],
+        'dead_letter': value['deadLetter'],
+        'leased': value['leased'],
+        'oldest_pending_age_seconds': value['oldestPendingAgeSeconds'],
+        'pending': value['pending'],
+        'retrying': value['retrying'],
+        'stages': (mapValues(value['stages'], StageStatsSchemaToJSON)),
+    };
+}
+
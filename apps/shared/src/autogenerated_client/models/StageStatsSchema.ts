@@ -0,0 +1,93 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * My API
+ * No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+/**
+ * 
+ * @export
+ * @interface StageStatsSchema
+ */
+export interface StageStatsSchema {
+    /**
+     * 
+     * @type {number}
+     * @memberof StageStatsSchema
+     */
+    completedPerMinute: number;
+    /**
+     * 
+     * @type {number}
+     * @memberof StageStatsSchema
+     */
+    leased: number;
+    /**
+     * 
+     * @type {number}
+     * @memberof StageStatsSchema
+     */
+    pending: number;
+    /**
+     * 
+     * @type {number}
+     * @memberof StageStatsSchema
+     */
+    retrying: number;
+}
+
+/**
+ * Check if a given object implements the StageStatsSchema interface.
+ */
+export function instanceOfStageStatsSchema(value: object): value is StageStatsSchema {
+    if (!('completedPerMinute' in value) || value['completedPerMinute'] === undefined) return false;
+    if (!('leased' in value) || value['leased'] === undefined) return false;
+    if (!('pending' in value) || value['pending'] === undefined) return false;
+    if (!('retrying' in value) || value['retrying'] === undefined) return false;
+    return true;
+}
+
+export function StageStatsSchemaFromJSON(json: any): StageStatsSchema {
+    return StageStatsSchemaFromJSONTyped(json, false);
+}
+
+export function StageStatsSchemaFromJSONTyped(json: any, ignoreDiscriminator: boolean): StageStatsSchema {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'completedPerMinute': json['completed_per_minute'],
+        'leased': json['leased'],
+        'pending': json['pending'],
+        'retrying': json['retrying'],
+    };
+}
+
+export function StageStatsSchemaToJSON(json: any): StageStatsSchema {
+    return StageStatsSchemaToJSONTyped(json, false);
+}
+
+export function StageStatsSchemaToJSONTyped(value?: StageStatsSchema | null, ignoreDiscriminator: boolean = false): any {
+    if (value == null) {
+        return value;
+    }
+
+    return {
+        
+        'completed_per_minute': value['completedPerMinute'],
+        'leased': value['leased'],
+        'pending': value['pending'],
+        'retrying': value['retrying'],
+    };
+}
+
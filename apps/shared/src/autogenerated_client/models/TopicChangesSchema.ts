@@ -0,0 +1,92 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * My API
+ * No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+import type { TopicSchema } from './TopicSchema';
+import {
+    TopicSchemaFromJSON,
+    TopicSchemaFromJSONTyped,
+    TopicSchemaToJSON,
+    TopicSchemaToJSONTyped,
+} from './TopicSchema';
+
+/**
+ * 
+ * @export
+ * @interface TopicChangesSchema
+ */
+export interface TopicChangesSchema {
+    /**
+     * 
+     * @type {boolean}
+     * @memberof TopicChangesSchema
+     */
+    hasMore: boolean;
+    /**
+     * 
+     * @type {number}
+     * @memberof TopicChangesSchema
+     */
+    revision: number;
+    /**
+     * 
+     * @type {Array<TopicSchema>}
+     * @memberof TopicChangesSchema
+     */
+    topics: Array<TopicSchema>;
+}
+
+/**
+ * Check if a given object implements the TopicChangesSchema interface.
+ */
+export function instanceOfTopicChangesSchema(value: object): value is TopicChangesSchema {
+    if (!('hasMore' in value) || value['hasMore'] === undefined) return false;
+    if (!('revision' in value) || value['revision'] === undefined) return false;
+    if (!('topics' in value) || value['topics'] === undefined) return false;
+    return true;
+}
+
+export function TopicChangesSchemaFromJSON(json: any): TopicChangesSchema {
+    return TopicChangesSchemaFromJSONTyped(json, false);
+}
+
+export function TopicChangesSchemaFromJSONTyped(json: any, ignoreDiscriminator: boolean): TopicChangesSchema {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'hasMore': json['has_more'],
+        'revision': json['revision'],
+        'topics': ((json['topics'] as Array<any>).map(TopicSchemaFromJSON)),
+    };
+}
+
+export function TopicChangesSchemaToJSON(json: any): TopicChangesSchema {
+    return TopicChangesSchemaToJSONTyped(json, false);
+}
+
+export function TopicChangesSchemaToJSONTyped(value?: TopicChangesSchema | null, ignoreDiscriminator: boolean = false): any {
+    if (value == null) {
+        return value;
+    }
+
+    return {
+        
+        'has_more': value['hasMore'],
+        'revision': value['revision'],
+        'topics': ((value['topics'] as Array<any>).map(TopicSchemaToJSON)),
+    };
+}
+
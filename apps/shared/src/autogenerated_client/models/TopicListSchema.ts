@@ -27,6 +27,12 @@ import {
  * @interface TopicListSchema
  */
 export interface TopicListSchema {
+    /**
+     * 
+     * @type {string}
+     * @memberof TopicListSchema
+     */
+    nextCursor?: string | null;
     /**
      * 
      * @type {Array<TopicSchema>}
@@ -53,6 +59,7 @@ export function TopicListSchemaFromJSONTyped(json: any, ignoreDiscriminator: boo
     }
     return {
         
+        'nextCursor': json['next_cursor'] == null ? undefined : json['next_cursor'],
         'topics': ((json['topics'] as Array<any>).map(TopicSchemaFromJSON)),
     };
 }
@@ -68,6 +75,7 @@ export function TopicListSchemaToJSONTyped(value?: TopicListSchema | null, ignor
 
     return {
         
+        'next_cursor': value['nextCursor'],
         'topics': ((value['topics'] as Array<any>).map(TopicSchemaToJSON)),
     };
 }
@@ -0,0 +1,82 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * My API
+ * No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+import type { TopicSummarySchema } from './TopicSummarySchema';
+import {
+    TopicSummarySchemaFromJSON,
+    TopicSummarySchemaFromJSONTyped,
+    TopicSummarySchemaToJSON,
+    TopicSummarySchemaToJSONTyped,
+} from './TopicSummarySchema';
+
+/**
+ * 
+ * @export
+ * @interface TopicSummaryListSchema
+ */
+export interface TopicSummaryListSchema {
+    /**
+     * 
+     * @type {string}
+     * @memberof TopicSummaryListSchema
+     */
+    nextCursor?: string | null;
+    /**
+     * 
+     * @type {Array<TopicSummarySchema>}
+     * @memberof TopicSummaryListSchema
+     */
+    topics: Array<TopicSummarySchema>;
+}
+
+/**
+ * Check if a given object implements the TopicSummaryListSchema interface.
+ */
+export function instanceOfTopicSummaryListSchema(value: object): value is TopicSummaryListSchema {
+    if (!('topics' in value) || value['topics'] === undefined) return false;
+    return true;
+}
+
+export function TopicSummaryListSchemaFromJSON(json: any): TopicSummaryListSchema {
+    return TopicSummaryListSchemaFromJSONTyped(json, false);
+}
+
+export function TopicSummaryListSchemaFromJSONTyped(json: any, ignoreDiscriminator: boolean): TopicSummaryListSchema {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'nextCursor': json['next_cursor'] == null ? undefined : json['next_cursor'],
+        'topics': ((json['topics'] as Array<any>).map(TopicSummarySchemaFromJSON)),
+    };
+}
+
+export function TopicSummaryListSchemaToJSON(json: any): TopicSummaryListSchema {
+    return TopicSummaryListSchemaToJSONTyped(json, false);
+}
+
+export function TopicSummaryListSchemaToJSONTyped(value?: TopicSummaryListSchema | null, ignoreDiscriminator: boolean = false): any {
+    if (value == null) {
+        return value;
+    }
+
+    return {
+        
+        'next_cursor': value['nextCursor'],
+        'topics': ((value['topics'] as Array<any>).map(TopicSummarySchemaToJSON)),
+    };
+}
+
@@ -0,0 +1,116 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * My API
+ * No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+import type { PlaybackContentSchema } from './PlaybackContentSchema';
+import {
+    PlaybackContentSchemaFromJSON,
+    PlaybackContentSchemaFromJSONTyped,
+    PlaybackContentSchemaToJSON,
+    PlaybackContentSchemaToJSONTyped,
+} from './PlaybackContentSchema';
+
+/**
+ * 
+ * @export
+ * @interface TopicSummarySchema
+ */
+export interface TopicSummarySchema {
+    /**
+     * 
+     * @type {string}
+     * @memberof TopicSummarySchema
+     */
+    extractedLink?: string | null;
+    /**
+     * 
+     * @type {string}
+     * @memberof TopicSummarySchema
+     */
+    id: string;
+    /**
+     * 
+     * @type {PlaybackContentSchema}
+     * @memberof TopicSummarySchema
+     */
+    playbackContent?: PlaybackContentSchema;
+    /**
+     * 
+     * @type {string}
+     * @memberof TopicSummarySchema
+     */
+    sender?: string | null;
+    /**
+     * 
+     * @type {string}
+     * @memberof TopicSummarySchema
+     */
+    timestamp: string;
+    /**
+     * 
+     * @type {string}
+     * @memberof TopicSummarySchema
+     */
+    title: string;
+}
+
+/**
+ * Check if a given object implements the TopicSummarySchema interface.
+ */
+export function instanceOfTopicSummarySchema(value: object): value is TopicSummarySchema {
+    if (!('id' in value) || value['id'] === undefined) return false;
+    if (!('timestamp' in value) || value['timestamp'] === undefined) return false;
+    if (!('title' in value) || value['title'] === undefined) return false;
+    return true;
+}
+
+export function TopicSummarySchemaFromJSON(json: any): TopicSummarySchema {
+    return TopicSummarySchemaFromJSONTyped(json, false);
+}
+
+export function TopicSummarySchemaFromJSONTyped(json: any, ignoreDiscriminator: boolean): TopicSummarySchema {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'extractedLink': json['extracted_link'] == null ? undefined : json['extracted_link'],
+        'id': json['id'],
+        'playbackContent': json['playback_content'] == null ? undefined : PlaybackContentSchemaFromJSON(json['playback_content']),
+        'sender': json['sender'] == null ? undefined : json['sender'],
+        'timestamp': json['timestamp'],
+        'title': json['title'],
+    };
+}
+
+export function TopicSummarySchemaToJSON(json: any): TopicSummarySchema {
+    return TopicSummarySchemaToJSONTyped(json, false);
+}
+
+export function TopicSummarySchemaToJSONTyped(value?: TopicSummarySchema | null, ignoreDiscriminator: boolean = false): any {
+    if (value == null) {
+        return value;
+    }
+
+    return {
+        
+        'extracted_link': value['extractedLink'],
+        'id': value['id'],
+        'playback_content': PlaybackContentSchemaToJSON(value['playbackContent']),
+        'sender': value['sender'],
+        'timestamp': value['timestamp'],
+        'title': value['title'],
+    };
+}
+
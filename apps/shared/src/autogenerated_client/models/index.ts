@@ -2,6 +2,18 @@
 /* eslint-disable */
 export * from './ModelError';
 export * from './PlaybackContentSchema';
+export * from './ProcessedInputBatchSchema';
 export * from './ProcessedInputSchema';
+export * from './QueueAdvanceSchema';
+export * from './QueueLeaseListSchema';
+export * from './QueueLeaseRequestSchema';
+export * from './QueueLeaseResultSchema';
+export * from './QueueLeaseSchema';
+export * from './QueueNackSchema';
+export * from './QueueStatsSchema';
+export * from './StageStatsSchema';
+export * from './TopicChangesSchema';
 export * from './TopicListSchema';
 export * from './TopicSchema';
+export * from './TopicSummaryListSchema';
+export * from './TopicSummarySchema';
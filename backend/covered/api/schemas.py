@@ -1,4 +1,16 @@
-from marshmallow import Schema, fields
+from marshmallow import Schema, fields, validate
+
+from covered.config import (
+    INGEST_BATCH_SIZE_MAX,
+    PIPELINE_STAGES,
+    QUEUE_HTTP_LEASE_MAX,
+    QUEUE_HTTP_WAIT_MAX,
+    TOPICS_PAGE_SIZE_DEFAULT,
+    TOPICS_PAGE_SIZE_MAX,
+)
+
+# Largest value an SQLite INTEGER column holds, e.g. a revision
+SQLITE_INTEGER_MAX = 2**63 - 1
 
 
 class ProcessedInputSchema(Schema):
@@ -10,6 +22,14 @@ class ProcessedInputSchema(Schema):
     sender = fields.Str(allow_none=True)
 
 
+class ProcessedInputBatchSchema(Schema):
+    processed_inputs = fields.List(
+        fields.Nested(ProcessedInputSchema),
+        required=True,
+        validate=validate.Length(min=1, max=INGEST_BATCH_SIZE_MAX),
+    )
+
+
 class PlaybackContentSchema(Schema):
     id = fields.Str(required=True)
     processed_input_id = fields.Str(required=True)
@@ -28,3 +48,116 @@ class TopicSchema(Schema):
 
 class TopicListSchema(Schema):
     topics = fields.List(fields.Nested(TopicSchema), required=True)
+    next_cursor = fields.Str(allow_none=True)
+
+
+class TopicSummarySchema(Schema):
+    id = fields.Str(required=True)
+    timestamp = fields.Str(required=True)
+    title = fields.Str(required=True)
+    extracted_link = fields.Str(allow_none=True)
+    sender = fields.Str(allow_none=True)
+    playback_content = fields.Nested(PlaybackContentSchema, allow_none=True)
+
+
+class TopicSummaryListSchema(Schema):
+    topics = fields.List(fields.Nested(TopicSummarySchema), required=True)
+    next_cursor = fields.Str(allow_none=True)
+
+
+class TopicListQuerySchema(Schema):
+    limit = fields.Int(validate=validate.Range(min=1, max=TOPICS_PAGE_SIZE_MAX))
+    cursor = fields.Str()
+
+
+class TopicSearchQuerySchema(Schema):
+    q = fields.Str(required=True, validate=validate.Length(min=1))
+    limit = fields.Int(
+        load_default=TOPICS_PAGE_SIZE_DEFAULT,
+        validate=validate.Range(min=1, max=TOPICS_PAGE_SIZE_MAX),
+    )
+    # The offset of the page, kept a string like the cursors of /topics. At
+    # most 18 ASCII digits, so it always fits an SQLite INTEGER.
+    cursor = fields.Str(
+        validate=validate.Regexp(r"[0-9]{1,18}\Z", error="Invalid cursor.")
+    )
+
+
+class TopicChangesSchema(Schema):
+    topics = fields.List(fields.Nested(TopicSchema), required=True)
+    revision = fields.Int(required=True)
+    has_more = fields.Bool(required=True)
+
+
+class TopicChangesQuerySchema(Schema):
+    since = fields.Int(
+        required=True, validate=validate.Range(min=0, max=SQLITE_INTEGER_MAX)
+    )
+    limit = fields.Int(
+        load_default=TOPICS_PAGE_SIZE_MAX,
+        validate=validate.Range(min=1, max=TOPICS_PAGE_SIZE_MAX),
+    )
+
+
+class TopicEventsQuerySchema(Schema):
+    # Revision to resume from; a Last-Event-ID header takes precedence
+    since = fields.Int(validate=validate.Range(min=0, max=SQLITE_INTEGER_MAX))
+
+
+class StageStatsSchema(Schema):
+    pending = fields.Int(required=True)
+    retrying = fields.Int(required=True)
+    leased = fields.Int(required=True)
+    completed_per_minute = fields.Float(required=True)
+
+
+class QueueStatsSchema(Schema):
+    pending = fields.Int(required=True)
+    retrying = fields.Int(required=True)
+    leased = fields.Int(required=True)
+    dead_letter = fields.Int(required=True)
+    oldest_pending_age_seconds = fields.Float(allow_none=True)
+    completed_per_minute = fields.Float(required=True)
+    stages = fields.Dict(
+        keys=fields.Str(), values=fields.Nested(StageStatsSchema), required=True
+    )
+
+
+class QueueLeaseSchema(Schema):
+    id = fields.Int(required=True)
+    topic_id = fields.Str(required=True)
+    stage = fields.Str(required=True)
+    worker_id = fields.Str(required=True)
+    attempts = fields.Int(required=True)
+    leased_until = fields.Float(required=True)
+    processed_input = fields.Nested(ProcessedInputSchema, allow_none=True)
+
+
+class QueueLeaseRequestSchema(Schema):
+    worker_id = fields.Str(required=True)
+    stages = fields.List(fields.Str(validate=validate.OneOf(PIPELINE_STAGES)))
+    max_jobs = fields.Int(
+        load_default=1, validate=validate.Range(min=1, max=QUEUE_HTTP_LEASE_MAX)
+    )
+    wait_seconds = fields.Float(
+        load_default=0, validate=validate.Range(min=0, max=QUEUE_HTTP_WAIT_MAX)
+    )
+
+
+class QueueLeaseListSchema(Schema):
+    leases = fields.List(fields.Nested(QueueLeaseSchema), required=True)
+
+
+class QueueNackSchema(Schema):
+    lease = fields.Nested(QueueLeaseSchema, required=True)
+    error = fields.Str(allow_none=True)
+
+
+class QueueAdvanceSchema(Schema):
+    lease = fields.Nested(QueueLeaseSchema, required=True)
+    stage = fields.Str(required=True, validate=validate.OneOf(PIPELINE_STAGES))
+
+
+class QueueLeaseResultSchema(Schema):
+    # False when the lease had expired and another worker took the job over
+    ok = fields.Bool(required=True)
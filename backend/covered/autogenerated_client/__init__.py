@@ -29,9 +29,21 @@ __all__ = [
     "ApiException",
     "Error",
     "PlaybackContentSchema",
+    "ProcessedInputBatchSchema",
     "ProcessedInputSchema",
+    "QueueAdvanceSchema",
+    "QueueLeaseListSchema",
+    "QueueLeaseRequestSchema",
+    "QueueLeaseResultSchema",
+    "QueueLeaseSchema",
+    "QueueNackSchema",
+    "QueueStatsSchema",
+    "StageStatsSchema",
+    "TopicChangesSchema",
     "TopicListSchema",
     "TopicSchema",
+    "TopicSummaryListSchema",
+    "TopicSummarySchema",
 ]
 
 # import apis into sdk package
@@ -55,10 +67,46 @@ from covered.autogenerated_client.models.error import Error as Error
 from covered.autogenerated_client.models.playback_content_schema import (
     PlaybackContentSchema as PlaybackContentSchema,
 )
+from covered.autogenerated_client.models.processed_input_batch_schema import (
+    ProcessedInputBatchSchema as ProcessedInputBatchSchema,
+)
 from covered.autogenerated_client.models.processed_input_schema import (
     ProcessedInputSchema as ProcessedInputSchema,
 )
+from covered.autogenerated_client.models.queue_advance_schema import (
+    QueueAdvanceSchema as QueueAdvanceSchema,
+)
+from covered.autogenerated_client.models.queue_lease_list_schema import (
+    QueueLeaseListSchema as QueueLeaseListSchema,
+)
+from covered.autogenerated_client.models.queue_lease_request_schema import (
+    QueueLeaseRequestSchema as QueueLeaseRequestSchema,
+)
+from covered.autogenerated_client.models.queue_lease_result_schema import (
+    QueueLeaseResultSchema as QueueLeaseResultSchema,
+)
+from covered.autogenerated_client.models.queue_lease_schema import (
+    QueueLeaseSchema as QueueLeaseSchema,
+)
+from covered.autogenerated_client.models.queue_nack_schema import (
+    QueueNackSchema as QueueNackSchema,
+)
+from covered.autogenerated_client.models.queue_stats_schema import (
+    QueueStatsSchema as QueueStatsSchema,
+)
+from covered.autogenerated_client.models.stage_stats_schema import (
+    StageStatsSchema as StageStatsSchema,
+)
+from covered.autogenerated_client.models.topic_changes_schema import (
+    TopicChangesSchema as TopicChangesSchema,
+)
 from covered.autogenerated_client.models.topic_list_schema import (
     TopicListSchema as TopicListSchema,
 )
 from covered.autogenerated_client.models.topic_schema import TopicSchema as TopicSchema
+from covered.autogenerated_client.models.topic_summary_list_schema import (
+    TopicSummaryListSchema as TopicSummaryListSchema,
+)
+from covered.autogenerated_client.models.topic_summary_schema import (
+    TopicSummarySchema as TopicSummarySchema,
+)
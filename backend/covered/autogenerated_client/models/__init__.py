@@ -17,8 +17,30 @@ from covered.autogenerated_client.models.error import Error
 from covered.autogenerated_client.models.playback_content_schema import (
     PlaybackContentSchema,
 )
+from covered.autogenerated_client.models.processed_input_batch_schema import (
+    ProcessedInputBatchSchema,
+)
 from covered.autogenerated_client.models.processed_input_schema import (
     ProcessedInputSchema,
 )
+from covered.autogenerated_client.models.queue_advance_schema import QueueAdvanceSchema
+from covered.autogenerated_client.models.queue_lease_list_schema import (
+    QueueLeaseListSchema,
+)
+from covered.autogenerated_client.models.queue_lease_request_schema import (
+    QueueLeaseRequestSchema,
+)
+from covered.autogenerated_client.models.queue_lease_result_schema import (
+    QueueLeaseResultSchema,
+)
+from covered.autogenerated_client.models.queue_lease_schema import QueueLeaseSchema
+from covered.autogenerated_client.models.queue_nack_schema import QueueNackSchema
+from covered.autogenerated_client.models.queue_stats_schema import QueueStatsSchema
+from covered.autogenerated_client.models.stage_stats_schema import StageStatsSchema
+from covered.autogenerated_client.models.topic_changes_schema import TopicChangesSchema
 from covered.autogenerated_client.models.topic_list_schema import TopicListSchema
 from covered.autogenerated_client.models.topic_schema import TopicSchema
+from covered.autogenerated_client.models.topic_summary_list_schema import (
+    TopicSummaryListSchema,
+)
+from covered.autogenerated_client.models.topic_summary_schema import TopicSummarySchema
@@ -0,0 +1,104 @@
+# coding: utf-8
+
+"""
+My API
+
+No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+
+The version of the OpenAPI document: 1.0.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, ClassVar, Dict, List
+from typing_extensions import Annotated
+from covered.autogenerated_client.models.processed_input_schema import (
+    ProcessedInputSchema,
+)
+from typing import Optional, Set
+from typing_extensions import Self
+
+
+class ProcessedInputBatchSchema(BaseModel):
+    """
+    ProcessedInputBatchSchema
+    """  # noqa: E501
+
+    processed_inputs: Annotated[
+        List[ProcessedInputSchema], Field(min_length=1, max_length=500)
+    ]
+    __properties: ClassVar[List[str]] = ["processed_inputs"]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Optional[Self]:
+        """Create an instance of ProcessedInputBatchSchema from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: Set[str] = set([])
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        # override the default output from pydantic by calling `to_dict()` of each item in processed_inputs (list)
+        _items = []
+        if self.processed_inputs:
+            for _item_processed_inputs in self.processed_inputs:
+                if _item_processed_inputs:
+                    _items.append(_item_processed_inputs.to_dict())
+            _dict["processed_inputs"] = _items
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
+        """Create an instance of ProcessedInputBatchSchema from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate(
+            {
+                "processed_inputs": [
+                    ProcessedInputSchema.from_dict(_item)
+                    for _item in obj["processed_inputs"]
+                ]
+                if obj.get("processed_inputs") is not None
+                else None
+            }
+        )
+        return _obj
@@ -0,0 +1,103 @@
+# coding: utf-8
+
+"""
+My API
+
+No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+
+The version of the OpenAPI document: 1.0.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+from pydantic import BaseModel, ConfigDict, StrictStr, field_validator
+from typing import Any, ClassVar, Dict, List
+from covered.autogenerated_client.models.queue_lease_schema import QueueLeaseSchema
+from typing import Optional, Set
+from typing_extensions import Self
+
+
+class QueueAdvanceSchema(BaseModel):
+    """
+    QueueAdvanceSchema
+    """  # noqa: E501
+
+    lease: QueueLeaseSchema
+    stage: StrictStr
+    __properties: ClassVar[List[str]] = ["lease", "stage"]
+
+    @field_validator("stage")
+    def stage_validate_enum(cls, value):
+        """Validates the enum"""
+        if value not in set(["fetch", "script", "tts", "transcribe"]):
+            raise ValueError(
+                "must be one of enum values ('fetch', 'script', 'tts', 'transcribe')"
+            )
+        return value
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Optional[Self]:
+        """Create an instance of QueueAdvanceSchema from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: Set[str] = set([])
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        # override the default output from pydantic by calling `to_dict()` of lease
+        if self.lease:
+            _dict["lease"] = self.lease.to_dict()
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
+        """Create an instance of QueueAdvanceSchema from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate(
+            {
+                "lease": QueueLeaseSchema.from_dict(obj["lease"])
+                if obj.get("lease") is not None
+                else None,
+                "stage": obj.get("stage"),
+            }
+        )
+        return _obj
@@ -0,0 +1,120 @@
+# coding: utf-8
+
+"""
+My API
+
+No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+
+The version of the OpenAPI document: 1.0.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, field_validator
+from typing import Any, ClassVar, Dict, List, Optional, Union
+from typing_extensions import Annotated
+from typing import Optional, Set
+from typing_extensions import Self
+
+
+class QueueLeaseRequestSchema(BaseModel):
+    """
+    QueueLeaseRequestSchema
+    """  # noqa: E501
+
+    max_jobs: Optional[Annotated[int, Field(le=32, strict=True, ge=1)]] = 1
+    stages: Optional[List[StrictStr]] = None
+    wait_seconds: Optional[
+        Union[
+            Annotated[float, Field(le=20.0, strict=True, ge=0)],
+            Annotated[int, Field(le=20, strict=True, ge=0)],
+        ]
+    ] = 0
+    worker_id: StrictStr
+    __properties: ClassVar[List[str]] = [
+        "max_jobs",
+        "stages",
+        "wait_seconds",
+        "worker_id",
+    ]
+
+    @field_validator("stages")
+    def stages_validate_enum(cls, value):
+        """Validates the enum"""
+        if value is None:
+            return value
+
+        for i in value:
+            if i not in set(["fetch", "script", "tts", "transcribe"]):
+                raise ValueError(
+                    "each list item must be one of ('fetch', 'script', 'tts', 'transcribe')"
+                )
+        return value
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Optional[Self]:
+        """Create an instance of QueueLeaseRequestSchema from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: Set[str] = set([])
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
+        """Create an instance of QueueLeaseRequestSchema from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate(
+            {
+                "max_jobs": obj.get("max_jobs")
+                if obj.get("max_jobs") is not None
+                else 1,
+                "stages": obj.get("stages"),
+                "wait_seconds": obj.get("wait_seconds")
+                if obj.get("wait_seconds") is not None
+                else 0,
+                "worker_id": obj.get("worker_id"),
+            }
+        )
+        return _obj
@@ -0,0 +1,116 @@
+# coding: utf-8
+
+"""
+My API
+
+No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+
+The version of the OpenAPI document: 1.0.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+from pydantic import BaseModel, ConfigDict, StrictFloat, StrictInt, StrictStr
+from typing import Any, ClassVar, Dict, List, Optional, Union
+from covered.autogenerated_client.models.processed_input_schema import (
+    ProcessedInputSchema,
+)
+from typing import Optional, Set
+from typing_extensions import Self
+
+
+class QueueLeaseSchema(BaseModel):
+    """
+    QueueLeaseSchema
+    """  # noqa: E501
+
+    attempts: StrictInt
+    id: StrictInt
+    leased_until: Union[StrictFloat, StrictInt]
+    processed_input: Optional[ProcessedInputSchema] = None
+    stage: StrictStr
+    topic_id: StrictStr
+    worker_id: StrictStr
+    __properties: ClassVar[List[str]] = [
+        "attempts",
+        "id",
+        "leased_until",
+        "processed_input",
+        "stage",
+        "topic_id",
+        "worker_id",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Optional[Self]:
+        """Create an instance of QueueLeaseSchema from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: Set[str] = set([])
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        # override the default output from pydantic by calling `to_dict()` of processed_input
+        if self.processed_input:
+            _dict["processed_input"] = self.processed_input.to_dict()
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
+        """Create an instance of QueueLeaseSchema from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate(
+            {
+                "attempts": obj.get("attempts"),
+                "id": obj.get("id"),
+                "leased_until": obj.get("leased_until"),
+                "processed_input": ProcessedInputSchema.from_dict(
+                    obj["processed_input"]
+                )
+                if obj.get("processed_input") is not None
+                else None,
+                "stage": obj.get("stage"),
+                "topic_id": obj.get("topic_id"),
+                "worker_id": obj.get("worker_id"),
+            }
+        )
+        return _obj
@@ -0,0 +1,143 @@
+# coding: utf-8
+
+"""
+My API
+
+No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+
+The version of the OpenAPI document: 1.0.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+from pydantic import BaseModel, ConfigDict, StrictFloat, StrictInt
+from typing import Any, ClassVar, Dict, List, Optional, Union
+from covered.autogenerated_client.models.stage_stats_schema import StageStatsSchema
+from typing import Optional, Set
+from typing_extensions import Self
+
+
+class QueueStatsSchema(BaseModel):
+    """
+    QueueStatsSchema
+    """  # noqa: E501
+
+    completed_per_minute: Union[StrictFloat, StrictInt]
+    dead_letter: StrictInt
+    leased: StrictInt
+    oldest_pending_age_seconds: Optional[Union[StrictFloat, StrictInt]] = None
+    pending: StrictInt
+    retrying: StrictInt
+    stages: Dict[str, StageStatsSchema]
+    additional_properties: Dict[str, Any] = {}
+    __properties: ClassVar[List[str]] = [
+        "completed_per_minute",
+        "dead_letter",
+        "leased",
+        "oldest_pending_age_seconds",
+        "pending",
+        "retrying",
+        "stages",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Optional[Self]:
+        """Create an instance of QueueStatsSchema from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        * Fields in `self.additional_properties` are added to the output dict.
+        """
+        excluded_fields: Set[str] = set(
+            [
+                "additional_properties",
+            ]
+        )
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        # override the default output from pydantic by calling `to_dict()` of each value in stages (dict)
+        _field_dict = {}
+        if self.stages:
+            for _key_stages in self.stages:
+                if self.stages[_key_stages]:
+                    _field_dict[_key_stages] = self.stages[_key_stages].to_dict()
+            _dict["stages"] = _field_dict
+        # puts key-value pairs in additional_properties in the top level
+        if self.additional_properties is not None:
+            for _key, _value in self.additional_properties.items():
+                _dict[_key] = _value
+
+        # set to None if oldest_pending_age_seconds (nullable) is None
+        # and model_fields_set contains the field
+        if (
+            self.oldest_pending_age_seconds is None
+            and "oldest_pending_age_seconds" in self.model_fields_set
+        ):
+            _dict["oldest_pending_age_seconds"] = None
+
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
+        """Create an instance of QueueStatsSchema from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate(
+            {
+                "completed_per_minute": obj.get("completed_per_minute"),
+                "dead_letter": obj.get("dead_letter"),
+                "leased": obj.get("leased"),
+                "oldest_pending_age_seconds": obj.get("oldest_pending_age_seconds"),
+                "pending": obj.get("pending"),
+                "retrying": obj.get("retrying"),
+                "stages": dict(
+                    (_k, StageStatsSchema.from_dict(_v))
+                    for _k, _v in obj["stages"].items()
+                )
+                if obj.get("stages") is not None
+                else None,
+            }
+        )
+        # store additional fields in additional_properties
+        for _key in obj.keys():
+            if _key not in cls.__properties:
+                _obj.additional_properties[_key] = obj.get(_key)
+
+        return _obj
@@ -16,8 +16,8 @@ import pprint
 import re  # noqa: F401
 import json
 
-from pydantic import BaseModel, ConfigDict
-from typing import Any, ClassVar, Dict, List
+from pydantic import BaseModel, ConfigDict, StrictStr
+from typing import Any, ClassVar, Dict, List, Optional
 from covered.autogenerated_client.models.topic_schema import TopicSchema
 from typing import Optional, Set
 from typing_extensions import Self
@@ -28,8 +28,9 @@ class TopicListSchema(BaseModel):
     TopicListSchema
     """  # noqa: E501
 
+    next_cursor: Optional[StrictStr] = None
     topics: List[TopicSchema]
-    __properties: ClassVar[List[str]] = ["topics"]
+    __properties: ClassVar[List[str]] = ["next_cursor", "topics"]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -75,6 +76,11 @@ class TopicListSchema(BaseModel):
                 if _item_topics:
                     _items.append(_item_topics.to_dict())
             _dict["topics"] = _items
+        # set to None if next_cursor (nullable) is None
+        # and model_fields_set contains the field
+        if self.next_cursor is None and "next_cursor" in self.model_fields_set:
+            _dict["next_cursor"] = None
+
         return _dict
 
     @classmethod
@@ -88,9 +94,10 @@ class TopicListSchema(BaseModel):
 
         _obj = cls.model_validate(
             {
+                "next_cursor": obj.get("next_cursor"),
                 "topics": [TopicSchema.from_dict(_item) for _item in obj["topics"]]
                 if obj.get("topics") is not None
-                else None
+                else None,
             }
         )
         return _obj
@@ -0,0 +1,123 @@
+# coding: utf-8
+
+"""
+My API
+
+No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+
+The version of the OpenAPI document: 1.0.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+from pydantic import BaseModel, ConfigDict, StrictStr
+from typing import Any, ClassVar, Dict, List, Optional
+from covered.autogenerated_client.models.playback_content_schema import (
+    PlaybackContentSchema,
+)
+from typing import Optional, Set
+from typing_extensions import Self
+
+
+class TopicSummarySchema(BaseModel):
+    """
+    TopicSummarySchema
+    """  # noqa: E501
+
+    extracted_link: Optional[StrictStr] = None
+    id: StrictStr
+    playback_content: Optional[PlaybackContentSchema] = None
+    sender: Optional[StrictStr] = None
+    timestamp: StrictStr
+    title: StrictStr
+    __properties: ClassVar[List[str]] = [
+        "extracted_link",
+        "id",
+        "playback_content",
+        "sender",
+        "timestamp",
+        "title",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Optional[Self]:
+        """Create an instance of TopicSummarySchema from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: Set[str] = set([])
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        # override the default output from pydantic by calling `to_dict()` of playback_content
+        if self.playback_content:
+            _dict["playback_content"] = self.playback_content.to_dict()
+        # set to None if extracted_link (nullable) is None
+        # and model_fields_set contains the field
+        if self.extracted_link is None and "extracted_link" in self.model_fields_set:
+            _dict["extracted_link"] = None
+
+        # set to None if sender (nullable) is None
+        # and model_fields_set contains the field
+        if self.sender is None and "sender" in self.model_fields_set:
+            _dict["sender"] = None
+
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
+        """Create an instance of TopicSummarySchema from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate(
+            {
+                "extracted_link": obj.get("extracted_link"),
+                "id": obj.get("id"),
+                "playback_content": PlaybackContentSchema.from_dict(
+                    obj["playback_content"]
+                )
+                if obj.get("playback_content") is not None
+                else None,
+                "sender": obj.get("sender"),
+                "timestamp": obj.get("timestamp"),
+                "title": obj.get("title"),
+            }
+        )
+        return _obj
@@ -12,6 +12,93 @@ MEDIA_DIR = os.path.join(PLAYBACK_DIR, "media")
 SERVER_HOST = "0.0.0.0"
 SERVER_PORT = 8000
 BASE_URL = f"http://192.168.1.23:{SERVER_PORT}"
+# Production server (covered-server-prod), see covered/wsgi.py
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", (os.cpu_count() or 1) * 2 + 1))
+# Per worker process. Far more than cores, since most of them are held by
+# mostly idle event streams (see TOPIC_EVENTS_MAX_STREAMS).
+SERVER_THREADS = int(os.getenv("SERVER_THREADS", 16))
+SERVER_KEEPALIVE = int(os.getenv("SERVER_KEEPALIVE", 5))  # idle seconds
+# Seconds a worker may go without a heartbeat. gthread workers send it from
+# their main loop, so long requests (event streams, long polls) don't count.
+SERVER_TIMEOUT = int(os.getenv("SERVER_TIMEOUT", 60))
+TOPICS_PAGE_SIZE_DEFAULT = 50
+TOPICS_PAGE_SIZE_MAX = 200
+INGEST_BATCH_SIZE_MAX = 500
+
+# Media Serving (/data)
+DATA_MEDIA_MAX_AGE = 365 * 24 * 60 * 60  # media/<uuid>/ files never change
+# Let a front proxy send file bytes: "x-accel-redirect" (nginx) or
+# "x-sendfile" (Apache, lighttpd). Unset serves them from Python.
+# nginx is redirected to the original file and serves the precompressed
+# .br/.gz siblings itself: enable gzip_static (and brotli_static, from
+# ngx_brotli) on the internal DATA_ACCEL_PREFIX location.
+DATA_OFFLOAD = os.getenv("DATA_OFFLOAD")
+DATA_ACCEL_PREFIX = os.getenv("DATA_ACCEL_PREFIX", "/protected-data/")
+
+# Long-polling POST /queue/lease requests a worker process holds at once, each
+# on a server thread. Past this, requests are answered without waiting.
+QUEUE_HTTP_MAX_WAITS = int(os.getenv("QUEUE_HTTP_MAX_WAITS", 2))
+
+# Topic Events (/topics/events)
+# Each open stream holds a server thread. A worker process serves at most this
+# many, keeping 4 threads (besides the lease waits) free for regular requests,
+# so the API holds SERVER_WORKERS x TOPIC_EVENTS_MAX_STREAMS streams in all (30
+# on one core). More clients are asked to retry later; raise SERVER_THREADS
+# with this.
+TOPIC_EVENTS_MAX_STREAMS = int(
+    os.getenv(
+        "TOPIC_EVENTS_MAX_STREAMS", max(SERVER_THREADS - 4 - QUEUE_HTTP_MAX_WAITS, 1)
+    )
+)
+TOPIC_EVENTS_POLL_INTERVAL = 2.0  # seconds; catches writes by other processes
+TOPIC_EVENTS_KEEPALIVE = 15.0  # seconds between comments on an idle stream
+TOPIC_EVENTS_MAX_DURATION = 5 * 60  # then the client reconnects and resumes
+TOPIC_EVENTS_RETRY_MS = 3000  # client reconnection delay
+TOPIC_EVENTS_BUSY_RETRY_MS = 30000  # reconnection delay when over the limit
+
+# Compression
+COMPRESS_MIN_SIZE = 1024  # bytes; smaller JSON bodies are sent as is
+COMPRESS_GZIP_LEVEL = 6  # per request, trades ratio for CPU
+COMPRESS_BROTLI_QUALITY = 4
+PRECOMPRESS_BROTLI_QUALITY = 11  # files compressed once, e.g. script.json
+
+# Database Configuration
+SQLITE_BUSY_TIMEOUT = 5.0  # seconds to wait on a locked database
+SQLITE_SYNCHRONOUS = "NORMAL"  # safe with WAL, skips the fsync per commit
+SQLITE_CACHE_SIZE = -64000  # negative means KiB, i.e. ~64MB page cache
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+# Topics whose script.json is read and indexed per write transaction when an
+# existing archive's scripts are added to the search index
+SEARCH_BACKFILL_BATCH_SIZE = 200
+
+# Cache Configuration
+TOPIC_CACHE_SIZE = 1024  # individual ProcessedInput / Topic objects
+TOPIC_PAGE_CACHE_SIZE = 64  # serialized /topics pages
+
+# Queue Configuration
+# Keep the queue in topics.db, so ingestion stores a topic and enqueues it in
+# one transaction (outbox pattern). API and workers must agree on this.
+QUEUE_IN_TOPICS_DB = os.getenv("QUEUE_IN_TOPICS_DB", "false").lower() == "true"
+# Processing stages, in order. Each has its own queue so workers can be
+# dedicated to (and scaled for) the stages matching their resources.
+PIPELINE_STAGES = ("fetch", "script", "tts", "transcribe")
+PIPELINE_DIR = os.path.join(DATA_DIR, "pipeline")  # state between stages
+# Workers keep pipeline state and write media under DATA_DIR, which the API
+# serves /data from. Remote workers (processing-worker --remote) therefore
+# need DATA_DIR on storage shared by the API and every worker host, mounted
+# at the same path; set this once it is.
+SHARED_DATA_DIR = os.getenv("SHARED_DATA_DIR", "false").lower() == "true"
+QUEUE_LEASE_SECONDS = 30 * 60  # a leased job is redelivered after this long
+QUEUE_POP_TIMEOUT = 30.0  # longest a blocking pop waits between queue checks
+QUEUE_MAX_ATTEMPTS = 5  # deliveries before a job is moved to dead_letter
+QUEUE_RETRY_BASE_DELAY = 30.0  # seconds before the first retry, doubling after
+QUEUE_RETRY_MAX_DELAY = 60 * 60
+QUEUE_STATS_WINDOW = 15 * 60  # seconds of completions behind the throughput
+QUEUE_HTTP_LEASE_MAX = 32  # most jobs one POST /queue/lease can take
+QUEUE_HTTP_WAIT_MAX = 20.0  # longest POST /queue/lease holds the request
+# UDP port that wakes idle workers of the first stage; the next ports are for
+# the later stages, so only workers that handle a job's stage are woken
+QUEUE_NOTIFY_ADDRESS = ("127.0.0.1", 8765)
 
 # TTS Configuration
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
@@ -1,18 +1,72 @@
-from flask import Flask, send_from_directory
-from flask_rebar import Rebar, errors
+from flask import (
+    Flask,
+    abort,
+    current_app,
+    request,
+    send_from_directory,
+    stream_with_context,
+)
+from flask_rebar import Rebar, errors, get_validated_args
 from flask_cors import CORS
 import logging
+import mimetypes
 import os
+import threading
+import time
+from typing import List, Optional
+from urllib.parse import quote
+from werkzeug.security import safe_join
 
-from covered.config import DATA_DIR, SERVER_HOST, SERVER_PORT, configure_logging
-from covered.models.database import Database
-from covered.models.data import ProcessedInput, PlaybackContent, Topic
+from covered.config import (
+    DATA_ACCEL_PREFIX,
+    DATA_DIR,
+    DATA_MEDIA_MAX_AGE,
+    DATA_OFFLOAD,
+    MEDIA_DIR,
+    QUEUE_HTTP_MAX_WAITS,
+    QUEUE_IN_TOPICS_DB,
+    SERVER_HOST,
+    SERVER_PORT,
+    TOPICS_PAGE_SIZE_DEFAULT,
+    TOPICS_PAGE_SIZE_MAX,
+    TOPIC_EVENTS_BUSY_RETRY_MS,
+    TOPIC_EVENTS_KEEPALIVE,
+    TOPIC_EVENTS_MAX_DURATION,
+    TOPIC_EVENTS_MAX_STREAMS,
+    TOPIC_EVENTS_POLL_INTERVAL,
+    TOPIC_EVENTS_RETRY_MS,
+    configure_logging,
+)
+from covered.models.database import Database, topic_page_cache
+from covered.models.data import ProcessedInput, PlaybackContent, QueueLease, Topic
+from covered.utils.events import topic_changes
 from covered.utils.queue import QueueService
+from covered.utils.compression import (
+    ENCODING_SUFFIXES,
+    compress_response,
+    precompressed_encodings,
+)
 from covered.api.schemas import (
     ProcessedInputSchema,
+    ProcessedInputBatchSchema,
     PlaybackContentSchema,
     TopicSchema,
     TopicListSchema,
+    TopicSummarySchema,
+    TopicSummaryListSchema,
+    TopicListQuerySchema,
+    TopicSearchQuerySchema,
+    TopicChangesSchema,
+    TopicChangesQuerySchema,
+    TopicEventsQuerySchema,
+    QueueStatsSchema,
+    QueueLeaseSchema,
+    QueueLeaseRequestSchema,
+    QueueLeaseListSchema,
+    QueueNackSchema,
+    QueueAdvanceSchema,
+    QueueLeaseResultSchema,
+    SQLITE_INTEGER_MAX,
 )
 
 configure_logging()
@@ -21,14 +75,66 @@ logger = logging.getLogger("MAIN_SERVICE")
 rebar = Rebar()
 registry = rebar.create_handler_registry()
 
+# Open /topics/events streams in this process, each holding a server thread
+topic_event_streams = threading.BoundedSemaphore(TOPIC_EVENTS_MAX_STREAMS)
+# Waiting POST /queue/lease requests in this process, likewise
+queue_lease_waits = threading.BoundedSemaphore(QUEUE_HTTP_MAX_WAITS)
 
-def create_app():
+
+def create_app(migrate: bool = True):
+    """Creates the API app. Pass migrate=False when the schemas were already
+    brought up to date, e.g. by the process that forked this one."""
     app = Flask(__name__)
     CORS(app)  # Enable CORS for all routes
 
+    # Schema migrations run once per process, not on every request
+    if migrate:
+        Database().initialize()
+        QueueService().initialize()
+
+    app.config["USE_X_SENDFILE"] = DATA_OFFLOAD == "x-sendfile"
+
+    app.register_error_handler(_UnvalidatedResponse, lambda e: e.response)
+
+    @app.after_request
+    def compress_json(response):
+        return compress_response(response, request.accept_encodings)
+
     @app.route("/data/<path:filename>")
     def serve_data(filename):
-        return send_from_directory(DATA_DIR, filename)
+        mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+        if DATA_OFFLOAD == "x-accel-redirect":
+            # nginx does not pass our Content-Encoding on through the
+            # redirect, so it picks precompressed siblings itself (see
+            # DATA_OFFLOAD)
+            response = _accel_redirect(filename, mimetype)
+        else:
+            # Serve a precompressed sibling (script.json.br, ...) if accepted
+            path = safe_join(DATA_DIR, filename)
+            available = precompressed_encodings(path) if path else []
+            encoding = request.accept_encodings.best_match(available)
+            if encoding:
+                filename_sent = filename + ENCODING_SUFFIXES[encoding]
+            else:
+                filename_sent = filename
+
+            # Conditional: answers If-None-Match with 304 and Range with 206
+            response = send_from_directory(
+                DATA_DIR, filename_sent, mimetype=mimetype, conditional=True
+            )
+            if encoding:
+                response.headers["Content-Encoding"] = encoding
+            if available:
+                response.vary.add("Accept-Encoding")
+
+        if _is_media(filename):
+            response.headers["Cache-Control"] = (
+                f"public, max-age={DATA_MEDIA_MAX_AGE}, immutable"
+            )
+        else:
+            response.headers["Cache-Control"] = "no-cache"
+        return response
 
     rebar.init_app(app)
     return app
@@ -45,27 +151,64 @@ def create_processed_input():
 
     p_input = ProcessedInput(**body)
 
-    db = Database()
-    db.upsert_processed_input(p_input)
+    _store_and_enqueue(Database(), [p_input])
+
+    return body
 
-    queue = QueueService()
-    queue.push(p_input.id)
+
+@registry.handles(
+    rule="/processed-inputs/batch",
+    method="POST",
+    request_body_schema=ProcessedInputBatchSchema(),
+    response_body_schema=ProcessedInputBatchSchema(),
+)
+def create_processed_inputs_batch():
+    body = rebar.validated_body
+
+    p_inputs = [ProcessedInput(**item) for item in body["processed_inputs"]]
+
+    _store_and_enqueue(Database(), p_inputs)
 
     return body
 
 
+def _store_and_enqueue(db: Database, p_inputs: List[ProcessedInput]):
+    """Stores inputs and queues those without audio yet for processing.
+
+    Re-posting a topic that is still queued is a no-op as well, since the
+    queue holds at most one active job per topic.
+    """
+    if QUEUE_IN_TOPICS_DB:
+        # Outbox: the topics and their jobs commit together
+        db.upsert_processed_inputs_many(p_inputs, enqueue=True)
+    else:
+        db.upsert_processed_inputs_many(p_inputs)
+
+        processed = db.get_topic_ids_with_playback([p.id for p in p_inputs])
+        pending = [p_input for p_input in p_inputs if p_input.id not in processed]
+        if pending:
+            QueueService().push_many(pending)
+
+    topic_changes.notify()
+
+
 @registry.handles(
     rule="/processed-inputs/<input_id>",
     method="GET",
-    response_body_schema=ProcessedInputSchema(),
+    response_body_schema={200: ProcessedInputSchema(), 304: None},
 )
 def get_processed_input(input_id):
     db = Database()
-    p_input = db.get_processed_input(input_id)
+    revision = db.get_revision()
+    etag = _revision_etag(revision)
+    if request.if_none_match.contains_weak(etag):
+        return _not_modified(etag)
+
+    p_input = db.get_processed_input(input_id, revision)
     if not p_input:
         raise errors.NotFound()
 
-    return p_input.model_dump()
+    return p_input.model_dump(), 200, _etag_headers(etag)
 
 
 @registry.handles(
@@ -81,6 +224,7 @@ def create_playback_content():
 
     db = Database()
     db.upsert_topic_playback(playback.processed_input_id, playback)
+    topic_changes.notify()
 
     return body
 
@@ -88,14 +232,404 @@ def create_playback_content():
 @registry.handles(
     rule="/topics",
     method="GET",
-    response_body_schema=TopicListSchema(),
+    query_string_schema=TopicListQuerySchema(),
+    response_body_schema={200: TopicListSchema(), 304: None},
 )
 def get_topics():
+    return _list_topics(summary=False)
+
+
+@registry.handles(
+    rule="/topics/summaries",
+    method="GET",
+    query_string_schema=TopicListQuerySchema(),
+    response_body_schema={200: TopicSummaryListSchema(), 304: None},
+)
+def get_topic_summaries():
+    """
+    Lists topics like /topics, but leaves out the processed input's content,
+    which list views don't show. Fetch /topics/<topic_id> for the full record.
+    """
+    return _list_topics(summary=True)
+
+
+def _list_topics(summary: bool):
+    """Sends a page of topics, or the whole archive when none is asked for."""
+    args = get_validated_args()
+    db = Database()
+    etag = _revision_etag(db.get_revision())
+    if request.if_none_match.contains_weak(etag):
+        return _not_modified(etag)
+
+    if "limit" in args or "cursor" in args:
+        limit = args.get("limit", TOPICS_PAGE_SIZE_DEFAULT)
+        response, cached = _get_topics_page(
+            db, etag, limit, args.get("cursor"), summary
+        )
+        response.headers.update(_etag_headers(etag))
+        if cached:
+            # Validated by rebar when it was rendered
+            _send_unvalidated(response)
+        return response
+
+    # Unpaginated requests get the whole archive, as older clients expect.
+    # It is streamed so memory stays flat however large the archive grows.
+    response = current_app.response_class(
+        stream_with_context(_stream_all_topics(db, summary)),
+        mimetype="application/json",
+        headers=_etag_headers(etag),
+    )
+    _send_unvalidated(response)
+
+
+def _stream_all_topics(db: Database, summary: bool = False):
+    """Emits a TopicListSchema (or TopicSummaryListSchema) document one topic
+    at a time."""
+    topic_schema = TopicSummarySchema() if summary else TopicSchema()
+    yield '{"topics": ['
+    for i, topic in enumerate(db.iter_all_topics(summary)):
+        if i:
+            yield ", "
+        yield topic_schema.dumps(topic.model_dump())
+    yield '], "next_cursor": null}'
+
+
+@registry.handles(
+    rule="/topics/<topic_id>",
+    method="GET",
+    response_body_schema={200: TopicSchema(), 304: None},
+)
+def get_topic(topic_id):
     db = Database()
-    topics = db.get_all_topics()
+    revision = db.get_revision()
+    etag = _revision_etag(revision)
+    if request.if_none_match.contains_weak(etag):
+        return _not_modified(etag)
+
+    topic = db.get_topic(topic_id, revision)
+    if not topic:
+        raise errors.NotFound()
+
+    return topic.model_dump(), 200, _etag_headers(etag)
+
+
+@registry.handles(
+    rule="/topics/events",
+    method="GET",
+    query_string_schema=TopicEventsQuerySchema(),
+)
+def get_topic_events():
+    """
+    Streams server-sent events as topics are stored: "topic-created" while a
+    topic has no audio yet and "playback-ready" once its playback content is
+    saved, each carrying the topic as TopicSchema JSON.
+
+    Event ids are database revisions, so a reconnecting EventSource resumes
+    where it left off through Last-Event-ID. Without one the stream starts
+    from `since`, or from now. Past TOPIC_EVENTS_MAX_STREAMS open streams,
+    the stream ends at once and asks the client to reconnect later.
+    """
+    args = get_validated_args()
+    db = Database()
+
+    since = request.headers.get("Last-Event-ID", args.get("since"))
+    if since is None:
+        since = db.get_revision()
+    else:
+        try:
+            since = int(since)
+        except ValueError:
+            raise errors.BadRequest(f"Invalid Last-Event-ID: {since}")
+        if not 0 <= since <= SQLITE_INTEGER_MAX:
+            raise errors.BadRequest(f"Invalid Last-Event-ID: {since}")
+
+    response = current_app.response_class(
+        stream_with_context(_stream_topic_events(db, since)),
+        mimetype="text/event-stream",
+    )
+    response.headers["Cache-Control"] = "no-cache"
+    # Stops nginx from buffering the stream, which would hold events back
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+
+def _stream_topic_events(db: Database, since: int):
+    """Emits the topic changes after revision `since` as they happen."""
+    # Taken here rather than in the handler, so it is only released by the
+    # generator's own cleanup once it has started
+    if not topic_event_streams.acquire(blocking=False):
+        yield _sse_message(retry=TOPIC_EVENTS_BUSY_RETRY_MS)
+        return
+
+    try:
+        yield from _topic_events(db, since)
+    finally:
+        topic_event_streams.release()
+
+
+def _topic_events(db: Database, since: int):
+    topic_schema = TopicSchema()
+    yield _sse_message(retry=TOPIC_EVENTS_RETRY_MS)
+
+    # Streams are closed now and then so each one holds a server thread for
+    # a bounded time; the client reconnects and resumes from its last id
+    deadline = time.monotonic() + TOPIC_EVENTS_MAX_DURATION
+    last_message = time.monotonic()
+    while time.monotonic() < deadline:
+        # Captured before checking, so a write made meanwhile still wakes us
+        generation = topic_changes.generation
+
+        # Read before the changes, so resuming from it can never skip a write
+        revision = db.get_revision()
+        if revision > since:
+            topics, last_revision = db.get_topic_changes(since, TOPICS_PAGE_SIZE_MAX)
+            since = last_revision if last_revision is not None else revision
+            for i, topic in enumerate(topics):
+                yield _sse_message(
+                    event="playback-ready"
+                    if topic.playback_content
+                    else "topic-created",
+                    data=topic_schema.dumps(topic.model_dump()),
+                    # Only the last event marks a point that is safe to resume from
+                    event_id=since if i == len(topics) - 1 else None,
+                )
+            last_message = time.monotonic()
+            if last_revision is not None:
+                continue
+        elif time.monotonic() - last_message >= TOPIC_EVENTS_KEEPALIVE:
+            # Comment lines keep proxies from closing an idle connection
+            yield ": keepalive\n\n"
+            last_message = time.monotonic()
+
+        # Writes by other server processes cannot notify this one, so wake
+        # up regularly to check the revision anyway
+        topic_changes.wait(generation, TOPIC_EVENTS_POLL_INTERVAL)
+
+
+def _sse_message(
+    event: Optional[str] = None,
+    data: Optional[str] = None,
+    event_id: Optional[int] = None,
+    retry: Optional[int] = None,
+) -> str:
+    """Formats one server-sent events message."""
+    lines = []
+    if event:
+        lines.append(f"event: {event}")
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if retry is not None:
+        lines.append(f"retry: {retry}")
+    if data is not None:
+        lines.append(f"data: {data}")
+    return "\n".join(lines) + "\n\n"
+
+
+@registry.handles(
+    rule="/topics/search",
+    method="GET",
+    query_string_schema=TopicSearchQuerySchema(),
+    response_body_schema=TopicListSchema(),
+)
+def search_topics():
+    args = get_validated_args()
+    limit = args["limit"]
+
+    # Ranked results page by offset; the cursor is the offset of the next page
+    offset = int(args.get("cursor", "0"))
+
+    db = Database()
+    topics, next_offset = db.search_topics(args["q"], limit, offset)
+    next_cursor = str(next_offset) if next_offset is not None else None
+
+    return {"topics": [t.model_dump() for t in topics], "next_cursor": next_cursor}
+
+
+@registry.handles(
+    rule="/topics/changes",
+    method="GET",
+    query_string_schema=TopicChangesQuerySchema(),
+    response_body_schema=TopicChangesSchema(),
+)
+def get_topic_changes():
+    args = get_validated_args()
+    db = Database()
+
+    # Read before the changes, so resuming from it can never skip a write
+    revision = db.get_revision()
+    topics, last_revision = db.get_topic_changes(args["since"], args["limit"])
+
+    return {
+        "topics": [t.model_dump() for t in topics],
+        "revision": last_revision if last_revision is not None else revision,
+        "has_more": last_revision is not None,
+    }
+
+
+@registry.handles(
+    rule="/queue/stats",
+    method="GET",
+    response_body_schema=QueueStatsSchema(),
+)
+def get_queue_stats():
+    return QueueService().stats().model_dump()
+
+
+# The /queue endpoints expose QueueService to workers on other hosts
+
+
+@registry.handles(
+    rule="/queue/lease",
+    method="POST",
+    request_body_schema=QueueLeaseRequestSchema(),
+    response_body_schema=QueueLeaseListSchema(),
+)
+def lease_queue_jobs():
+    """
+    Leases jobs to a remote worker, waiting up to wait_seconds for one.
+    Past QUEUE_HTTP_MAX_WAITS waiting requests in this process, answers at
+    once instead, so waits never take the threads kept for other requests.
+    """
+    body = rebar.validated_body
+
+    wait = body["wait_seconds"]
+    waiting = wait > 0 and queue_lease_waits.acquire(blocking=False)
+    queue = QueueService(worker_id=body["worker_id"])
+    try:
+        leases = queue.pop_many(
+            body["max_jobs"],
+            timeout=wait if waiting else 0,
+            stages=body.get("stages"),
+        )
+    finally:
+        if waiting:
+            queue_lease_waits.release()
+
+    return {"leases": [lease.model_dump() for lease in leases]}
+
+
+@registry.handles(
+    rule="/queue/ack",
+    method="POST",
+    request_body_schema=QueueLeaseSchema(),
+    response_body_schema=QueueLeaseResultSchema(),
+)
+def ack_queue_lease():
+    lease = QueueLease(**rebar.validated_body)
+    return {"ok": QueueService().ack(lease)}
+
+
+@registry.handles(
+    rule="/queue/nack",
+    method="POST",
+    request_body_schema=QueueNackSchema(),
+    response_body_schema=QueueLeaseResultSchema(),
+)
+def nack_queue_lease():
+    body = rebar.validated_body
+    lease = QueueLease(**body["lease"])
+    return {"ok": QueueService().nack(lease, error=body.get("error"))}
+
+
+@registry.handles(
+    rule="/queue/advance",
+    method="POST",
+    request_body_schema=QueueAdvanceSchema(),
+    response_body_schema=QueueLeaseResultSchema(),
+)
+def advance_queue_lease():
+    body = rebar.validated_body
+    lease = QueueLease(**body["lease"])
+    return {"ok": QueueService().advance(lease, body["stage"])}
+
+
+def _is_media(filename: str) -> bool:
+    """Whether a /data path is under media/<uuid>/, written once and never changed."""
+    media_prefix = os.path.relpath(MEDIA_DIR, DATA_DIR) + "/"
+    return os.path.normpath(filename).startswith(media_prefix)
+
+
+def _accel_redirect(filename: str, mimetype: str):
+    """Hands the file to nginx, which serves it (with ETag and Range) itself."""
+    path = safe_join(DATA_DIR, filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+
+    response = current_app.response_class()
+    response.headers["X-Accel-Redirect"] = DATA_ACCEL_PREFIX + quote(filename)
+    response.mimetype = mimetype
+    return response
+
+
+def _revision_etag(revision: int) -> str:
+    """
+    Builds the ETag for topic data. Read the revision before the data itself,
+    so a concurrent write can only make the tag older than the body, never
+    newer.
+    """
+    return f"rev-{revision}"
+
+
+def _etag_headers(etag: str) -> dict:
+    # no-cache lets clients keep a copy but revalidate it on every poll
+    return {"ETag": f'"{etag}"', "Cache-Control": "no-cache"}
+
+
+def _not_modified(etag: str):
+    return current_app.response_class(status=304, headers=_etag_headers(etag))
+
+
+def _send_unvalidated(response):
+    """
+    Sends a response without rebar's response validation, for the two kinds
+    of bodies that must skip it:
+
+    - Streamed bodies, which validation would read into memory whole. Each
+      item of the stream is serialized with the route's schema as it is
+      produced.
+    - Page cache hits, whose body rebar validated when it was rendered and
+      would otherwise parse again on every hit.
+
+    Raising the response is the only way past the validation, so return
+    everything else.
+    """
+    raise _UnvalidatedResponse(response)
+
+
+class _UnvalidatedResponse(Exception):
+    """Carries a response past rebar, see _send_unvalidated(). Unlike
+    abort(response), its handler hands Flask the Response itself, so the
+    after_request hooks (e.g. compression) see it as it is."""
+
+    def __init__(self, response):
+        super().__init__()
+        self.response = response
+
+
+def _get_topics_page(
+    db: Database, etag: str, limit: int, cursor, summary: bool = False
+):
+    """Serves a /topics page from the serialized page cache when possible.
+    Also returns whether it came from the cache."""
+    # Keying on the revision keeps pages coherent with writes made by
+    # other processes, which cannot invalidate this process's cache
+    key = (etag, limit, cursor, summary)
+    body = topic_page_cache.get(key)
+    cached = body is not None
+    if not cached:
+        generation = topic_page_cache.generation
+        try:
+            topics, next_cursor = db.get_topics_page(limit, cursor, summary)
+        except ValueError as e:
+            raise errors.BadRequest(str(e))
+
+        list_schema = TopicSummaryListSchema() if summary else TopicListSchema()
+        body = list_schema.dumps(
+            {"topics": [t.model_dump() for t in topics], "next_cursor": next_cursor}
+        )
+        topic_page_cache.set(key, body, generation)
 
-    # Convert Pydantic models to list of dicts for Marshmallow
-    return {"topics": [t.model_dump() for t in topics]}
+    return current_app.response_class(body, mimetype="application/json"), cached
 
 
 def main():
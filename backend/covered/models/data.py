@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 class Email(BaseModel):
@@ -35,6 +35,17 @@ class Topic(BaseModel):
     playback_content: Optional[PlaybackContent] = None
 
 
+class TopicSummary(BaseModel):
+    """The list view of a topic: everything but the processed input's content."""
+
+    id: str
+    timestamp: str
+    title: str
+    extracted_link: Optional[str] = None
+    sender: Optional[str] = None
+    playback_content: Optional[PlaybackContent] = None
+
+
 class TopicList(BaseModel):
     topics: List[Topic]
 
@@ -45,3 +56,44 @@ class ScriptOutput(BaseModel):
 
 class UrlExtraction(BaseModel):
     urls: List[str]
+
+
+class QueueLease(BaseModel):
+    id: int  # queue row id, used to ack or nack the lease
+    topic_id: str
+    stage: str
+    worker_id: str
+    attempts: int  # deliveries so far, including this one
+    leased_until: float  # unix timestamp
+    processed_input: Optional[ProcessedInput] = None  # carried by the job
+
+
+class PipelineState(BaseModel):
+    """What the processing stages of one topic have produced so far."""
+
+    processed_input: ProcessedInput
+    playback_id: str
+    snapshot_path: Optional[str] = None
+    thumbnail_path: Optional[str] = None
+    extracted_text: Optional[str] = None
+    script_text: Optional[str] = None
+    m4a_path: Optional[str] = None
+    script_path: Optional[str] = None
+
+
+class StageStats(BaseModel):
+    pending: int  # ready to be leased now
+    retrying: int  # waiting out a retry delay
+    leased: int
+    completed_per_minute: float
+
+
+class QueueStats(BaseModel):
+    pending: int
+    retrying: int
+    leased: int
+    dead_letter: int
+    # Longest any job ready to be leased has waited for its current stage
+    oldest_pending_age_seconds: Optional[float] = None
+    completed_per_minute: float  # topics through every stage
+    stages: Dict[str, StageStats]
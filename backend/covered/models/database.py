@@ -1,114 +1,621 @@
+import base64
 import sqlite3
 import json
 import os
-from typing import List, Optional
-from covered.models.data import Topic, ProcessedInput, PlaybackContent
-from covered.config import DATA_DIR
+from typing import (
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from urllib.parse import urlparse
+from covered.models.data import Topic, TopicSummary, ProcessedInput, PlaybackContent
+from covered.config import (
+    DATA_DIR,
+    QUEUE_IN_TOPICS_DB,
+    ROOT_DIR,
+    SEARCH_BACKFILL_BATCH_SIZE,
+    TOPIC_CACHE_SIZE,
+    TOPIC_PAGE_CACHE_SIZE,
+)
+from covered.utils.cache import LRUCache
+from covered.utils.db_pool import get_pool
+from covered.utils.migrations import run_migrations
+from covered.utils.queue import insert_jobs, notify_waiters
+
+PROCESSED_INPUT_COLUMNS = (
+    "id",
+    "timestamp",
+    "title",
+    "content",
+    "extracted_link",
+    "sender",
+)
+# Everything the topic list view needs; leaves out the (large) content column
+PROCESSED_INPUT_SUMMARY_COLUMNS = tuple(
+    c for c in PROCESSED_INPUT_COLUMNS if c != "content"
+)
+PLAYBACK_CONTENT_COLUMNS = (
+    "id",
+    "processed_input_id",
+    "page_snapshot_url",
+    "thumbnail_url",
+    "script_json_url",
+    "m4a_file_url",
+)
+
+# Process-wide read caches, invalidated by the Database upsert methods. When
+# several server processes share the database, writes made by the others are
+# caught by comparing revisions: page cache keys include the revision, and
+# the item caches are dropped whenever it moves (see _sync_item_caches).
+processed_input_cache = LRUCache(TOPIC_CACHE_SIZE)
+topic_cache = LRUCache(TOPIC_CACHE_SIZE)
+topic_page_cache = LRUCache(TOPIC_PAGE_CACHE_SIZE)
+_item_cache_revision: Optional[int] = None
+
+
+def _select_list(alias: str, columns: Sequence[str]) -> str:
+    return ", ".join(f"{alias}.{column}" for column in columns)
+
+
+def _upsert_sql(table: str, columns: Sequence[str]) -> str:
+    updates = ", ".join(f"{c} = excluded.{c}" for c in columns if c != "id")
+    return f"""
+        INSERT INTO {table} ({", ".join(columns)})
+        VALUES ({", ".join("?" for _ in columns)})
+        ON CONFLICT(id) DO UPDATE SET {updates}
+    """
+
+
+T = TypeVar("T")
+
+
+def _trim_page(
+    items: List[T], limit: int, key: Callable[[T], str] = lambda item: item.id
+) -> Tuple[List[T], bool]:
+    """
+    Cuts the rows of a query that fetched limit + 1 topics down to one page,
+    and returns it along with whether another page exists.
+
+    Several playback rows can join to one input, so topics are counted by
+    distinct id, and every row of the extra topic is dropped.
+    """
+    topic_ids = list(dict.fromkeys(key(item) for item in items))
+    if len(topic_ids) <= limit:
+        return items, False
+    return [item for item in items if key(item) != topic_ids[limit]], True
+
+
+def encode_cursor(timestamp: str, topic_id: str) -> str:
+    """Encodes a (timestamp, id) keyset position as an opaque page cursor."""
+    raw = json.dumps([timestamp, topic_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Inverse of encode_cursor. Raises ValueError for malformed cursors."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        timestamp, topic_id = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(timestamp, str) or not isinstance(topic_id, str):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return timestamp, topic_id
+
+
+def _row_to_processed_input(row: Sequence) -> ProcessedInput:
+    return ProcessedInput(**dict(zip(PROCESSED_INPUT_COLUMNS, row)))
+
+
+def _row_to_playback_content(row: Sequence) -> Optional[PlaybackContent]:
+    # LEFT JOINs yield a row of NULLs when there is no playback content
+    if row[0] is None:
+        return None
+    return PlaybackContent(**dict(zip(PLAYBACK_CONTENT_COLUMNS, row)))
+
+
+def _row_to_topic(row: Sequence) -> Topic:
+    """Builds a Topic from a processed_inputs row followed by playback_content columns."""
+    split = len(PROCESSED_INPUT_COLUMNS)
+    p_input = _row_to_processed_input(row[:split])
+    return Topic(
+        id=p_input.id,
+        timestamp=p_input.timestamp,
+        processed_input=p_input,
+        playback_content=_row_to_playback_content(row[split:]),
+    )
+
+
+def _row_to_topic_summary(row: Sequence) -> TopicSummary:
+    """Like _row_to_topic, for rows led by PROCESSED_INPUT_SUMMARY_COLUMNS."""
+    split = len(PROCESSED_INPUT_SUMMARY_COLUMNS)
+    return TopicSummary(
+        **dict(zip(PROCESSED_INPUT_SUMMARY_COLUMNS, row[:split])),
+        playback_content=_row_to_playback_content(row[split:]),
+    )
+
+
+def _topic_projection(
+    summary: bool,
+) -> Tuple[Sequence[str], Callable[[Sequence], Union[Topic, TopicSummary]]]:
+    """Returns the processed_inputs columns to select and the row mapper."""
+    if summary:
+        return PROCESSED_INPUT_SUMMARY_COLUMNS, _row_to_topic_summary
+    return PROCESSED_INPUT_COLUMNS, _row_to_topic
+
+
+def _create_tables(conn: sqlite3.Connection):
+    """Creates the typed topic tables, converting the old JSON blob tables."""
+    legacy_columns = {
+        row[1] for row in conn.execute("PRAGMA table_info(processed_inputs)")
+    }
+    if "data" in legacy_columns:
+        conn.execute("ALTER TABLE processed_inputs RENAME TO legacy_processed_inputs")
+        conn.execute("ALTER TABLE playback_content RENAME TO legacy_playback_content")
+
+    cursor = conn.cursor()
+
+    # Create processed_inputs table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS processed_inputs (
+            id TEXT PRIMARY KEY,
+            timestamp TEXT NOT NULL,
+            title TEXT NOT NULL,
+            content TEXT NOT NULL,
+            extracted_link TEXT,
+            sender TEXT
+        )
+    """)
+    # (timestamp, id) is the keyset used to paginate topics newest first
+    cursor.execute("DROP INDEX IF EXISTS idx_processed_inputs_timestamp")
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_processed_inputs_timestamp_id
+        ON processed_inputs (timestamp, id)
+    """)
+
+    # Create playback_content table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS playback_content (
+            id TEXT PRIMARY KEY,
+            processed_input_id TEXT NOT NULL,
+            page_snapshot_url TEXT NOT NULL,
+            thumbnail_url TEXT,
+            script_json_url TEXT NOT NULL,
+            m4a_file_url TEXT NOT NULL,
+            FOREIGN KEY(processed_input_id) REFERENCES processed_inputs(id)
+        )
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_playback_content_processed_input_id
+        ON playback_content (processed_input_id)
+    """)
+
+    if "data" in legacy_columns:
+        _migrate_legacy_tables(conn)
+
+
+def _migrate_legacy_tables(conn: sqlite3.Connection):
+    """Copies rows from the old JSON `data` blob tables into typed columns."""
+    rows = conn.execute("SELECT data FROM legacy_processed_inputs").fetchall()
+    input_rows = []
+    for (data,) in rows:
+        p_input = ProcessedInput(**json.loads(data))
+        input_rows.append([p_input.model_dump()[c] for c in PROCESSED_INPUT_COLUMNS])
+    conn.executemany(
+        _upsert_sql("processed_inputs", PROCESSED_INPUT_COLUMNS), input_rows
+    )
+
+    rows = conn.execute(
+        "SELECT processed_input_id, data FROM legacy_playback_content"
+    ).fetchall()
+    playback_rows = []
+    for processed_input_id, data in rows:
+        playback = PlaybackContent(**json.loads(data))
+        playback.processed_input_id = processed_input_id
+        playback_rows.append(
+            [playback.model_dump()[c] for c in PLAYBACK_CONTENT_COLUMNS]
+        )
+    conn.executemany(
+        _upsert_sql("playback_content", PLAYBACK_CONTENT_COLUMNS), playback_rows
+    )
+
+    conn.execute("DROP TABLE legacy_playback_content")
+    conn.execute("DROP TABLE legacy_processed_inputs")
+
+
+def _create_search_index(conn: sqlite3.Connection):
+    """Creates the full-text index over topics and fills it from existing rows."""
+    # rowid mirrors processed_inputs.rowid, which upserts never change
+    conn.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS topics_fts USING fts5(
+            title, content, sender, script, tokenize = 'porter unicode61'
+        )
+    """)
+    conn.execute("""
+        INSERT INTO topics_fts (rowid, title, content, sender, script)
+        SELECT rowid, title, content, COALESCE(sender, ''), ''
+        FROM processed_inputs
+    """)
+
+    # Reading every script.json here would hold the write lock for as long
+    # as that takes; Database.initialize() indexes them in batches instead
+    conn.execute("""
+        CREATE TABLE pending_script_index (topic_id TEXT PRIMARY KEY)
+    """)
+    conn.execute("""
+        INSERT OR IGNORE INTO pending_script_index (topic_id)
+        SELECT processed_input_id FROM playback_content
+    """)
+
+
+def _create_revision_counter(conn: sqlite3.Connection):
+    """Creates the single-row counter bumped by every topic write."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS revision (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            value INTEGER NOT NULL
+        )
+    """)
+    conn.execute("INSERT OR IGNORE INTO revision (id, value) VALUES (1, 0)")
+
+
+def _add_row_revisions(conn: sqlite3.Connection):
+    """
+    Records on each row the revision that last wrote it. Existing rows are
+    stamped with a fresh revision so a change feed from 0 includes them.
+    """
+    for table in ("processed_inputs", "playback_content"):
+        conn.execute(
+            f"ALTER TABLE {table} ADD COLUMN revision INTEGER NOT NULL DEFAULT 0"
+        )
+        conn.execute(f"CREATE INDEX idx_{table}_revision ON {table} (revision)")
+
+    revision = _bump_revision(conn)
+    conn.execute("UPDATE processed_inputs SET revision = ?", (revision,))
+    conn.execute("UPDATE playback_content SET revision = ?", (revision,))
+
+
+def _restamp_row_revisions(conn: sqlite3.Connection):
+    """
+    Gives every row a revision of its own. Rows used to share one when they
+    were written together (by a batch, or by _add_row_revisions), and a
+    change feed resuming from such a revision skipped the rest of the group.
+    """
+    inputs = conn.execute(
+        "SELECT COALESCE(MAX(rowid), 0) FROM processed_inputs"
+    ).fetchone()[0]
+    playbacks = conn.execute(
+        "SELECT COALESCE(MAX(rowid), 0) FROM playback_content"
+    ).fetchone()[0]
+    base = _bump_revision(conn, inputs + playbacks) - inputs - playbacks
+    conn.execute("UPDATE processed_inputs SET revision = ? + rowid", (base,))
+    conn.execute("UPDATE playback_content SET revision = ? + rowid", (base + inputs,))
+
+
+# Append only: the position of a migration in this list is its schema version
+MIGRATIONS = [
+    _create_tables,
+    _create_search_index,
+    _create_revision_counter,
+    _add_row_revisions,
+    _restamp_row_revisions,
+]
+
+
+def _bump_revision(conn: sqlite3.Connection, count: int = 1) -> int:
+    """
+    Advances the database revision by `count` inside the caller's write
+    transaction and returns the new value. Writers stamping several rows
+    reserve one revision per row, so no two rows share a revision.
+    """
+    conn.execute("UPDATE revision SET value = value + ? WHERE id = 1", (count,))
+    return conn.execute("SELECT value FROM revision WHERE id = 1").fetchone()[0]
+
+
+def _read_script_text(script_json_url: str) -> str:
+    """Returns the polished script text behind a script.json URL, if readable."""
+    relative_path = urlparse(script_json_url).path.lstrip("/")
+    path = os.path.normpath(os.path.join(ROOT_DIR, relative_path))
+    if not path.startswith(DATA_DIR + os.sep):
+        return ""
+
+    try:
+        with open(path, "r") as f:
+            return json.load(f).get("text", "")
+    except (OSError, ValueError):
+        return ""
+
+
+def _index_topic(conn: sqlite3.Connection, topic_id: str, script: Optional[str] = None):
+    """
+    Rewrites the search index row for a topic from processed_inputs.
+    When script is None the previously indexed script text is kept.
+    """
+    row = conn.execute(
+        "SELECT rowid, title, content, sender FROM processed_inputs WHERE id = ?",
+        (topic_id,),
+    ).fetchone()
+    if not row:
+        return
+
+    rowid, title, content, sender = row
+    if script is None:
+        existing = conn.execute(
+            "SELECT script FROM topics_fts WHERE rowid = ?", (rowid,)
+        ).fetchone()
+        script = existing[0] if existing else ""
+
+    conn.execute("DELETE FROM topics_fts WHERE rowid = ?", (rowid,))
+    conn.execute(
+        """
+        INSERT INTO topics_fts (rowid, title, content, sender, script)
+        VALUES (?, ?, ?, ?, ?)
+    """,
+        (rowid, title, content, sender or "", script),
+    )
+
+
+def _fts_query(query: str) -> str:
+    """Turns free text into an FTS5 query matching all of its words."""
+    terms = query.split()
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
 
 
 class Database:
     def __init__(self):
         self.db_path = os.path.join(DATA_DIR, "topics.db")
-        self._ensure_db()
-
-    def _ensure_db(self):
-        os.makedirs(DATA_DIR, exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Create processed_inputs table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS processed_inputs (
-                id TEXT PRIMARY KEY,
-                timestamp TEXT,
-                data TEXT
-            )
-        """)
-
-        # Create playback_content table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS playback_content (
-                id TEXT PRIMARY KEY,
-                processed_input_id TEXT,
-                data TEXT,
-                FOREIGN KEY(processed_input_id) REFERENCES processed_inputs(id)
-            )
-        """)
+        self._pool = get_pool(self.db_path)
+
+    def initialize(self):
+        """Brings the schema up to date. Run once at process startup."""
+        run_migrations(self._pool, MIGRATIONS)
+        self._index_pending_scripts()
+
+    def _index_pending_scripts(self):
+        """
+        Adds the scripts of topics listed in pending_script_index to the
+        search index, SEARCH_BACKFILL_BATCH_SIZE topics per transaction. The
+        files are read before taking the write lock.
+        """
+        while True:
+            with self._pool.reader() as conn:
+                pending = conn.execute("""
+                    SELECT 1 FROM sqlite_master
+                    WHERE type = 'table' AND name = 'pending_script_index'
+                """).fetchone()
+                if not pending:
+                    return
+                rows = conn.execute(
+                    """
+                    SELECT topic_id, (
+                        SELECT script_json_url FROM playback_content
+                        WHERE processed_input_id = topic_id
+                        ORDER BY rowid DESC LIMIT 1
+                    )
+                    FROM pending_script_index LIMIT ?
+                """,
+                    (SEARCH_BACKFILL_BATCH_SIZE,),
+                ).fetchall()
+
+            if not rows:
+                with self._pool.writer() as conn:
+                    conn.execute("DROP TABLE IF EXISTS pending_script_index")
+                return
 
-        conn.commit()
-        conn.close()
+            scripts = [
+                (topic_id, url, _read_script_text(url) if url else "")
+                for topic_id, url in rows
+            ]
+            with self._pool.writer() as conn:
+                for topic_id, url, script in scripts:
+                    # Playback stored meanwhile has indexed its own script
+                    current = conn.execute(
+                        """
+                        SELECT script_json_url FROM playback_content
+                        WHERE processed_input_id = ?
+                        ORDER BY rowid DESC LIMIT 1
+                    """,
+                        (topic_id,),
+                    ).fetchone()
+                    if current and current[0] == url:
+                        _index_topic(conn, topic_id, script)
+                conn.executemany(
+                    "DELETE FROM pending_script_index WHERE topic_id = ?",
+                    [(topic_id,) for topic_id, _, _ in scripts],
+                )
 
-    def _get_connection(self):
-        return sqlite3.connect(self.db_path)
+    def get_revision(self) -> int:
+        """
+        Returns the current database revision. It only ever increases and
+        changes whenever a processed input or playback content is stored.
+        """
+        with self._pool.reader() as conn:
+            return conn.execute("SELECT value FROM revision WHERE id = 1").fetchone()[0]
 
     def upsert_processed_input(self, p_input: ProcessedInput):
         """Stores a processed input record."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        self.upsert_processed_inputs_many([p_input])
 
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO processed_inputs (id, timestamp, data)
-            VALUES (?, ?, ?)
-        """,
-            (p_input.id, p_input.timestamp, json.dumps(p_input.model_dump())),
-        )
+    def upsert_processed_inputs_many(
+        self, p_inputs: List[ProcessedInput], enqueue: bool = False
+    ):
+        """Stores several processed input records in a single transaction.
+
+        With `enqueue`, the same transaction also queues the inputs that have
+        no playback content yet for processing. This requires the queue to
+        live in this database (QUEUE_IN_TOPICS_DB).
+        """
+        if enqueue and not QUEUE_IN_TOPICS_DB:
+            raise ValueError("enqueue requires QUEUE_IN_TOPICS_DB")
+
+        rows = []
+        for p_input in p_inputs:
+            values = p_input.model_dump()
+            rows.append([values[c] for c in PROCESSED_INPUT_COLUMNS])
+
+        with self._pool.writer() as conn:
+            first = _bump_revision(conn, len(rows)) - len(rows) + 1
+            conn.executemany(
+                _upsert_sql(
+                    "processed_inputs", PROCESSED_INPUT_COLUMNS + ("revision",)
+                ),
+                [row + [first + i] for i, row in enumerate(rows)],
+            )
+            for p_input in p_inputs:
+                _index_topic(conn, p_input.id)
 
-        conn.commit()
-        conn.close()
+            added = 0
+            if enqueue:
+                processed = self._topic_ids_with_playback(
+                    conn, [p_input.id for p_input in p_inputs]
+                )
+                added = insert_jobs(
+                    conn, [p for p in p_inputs if p.id not in processed]
+                )
+        self._invalidate([p_input.id for p_input in p_inputs])
+        if added:
+            notify_waiters(added)
+
+    def get_processed_input(
+        self, input_id: str, revision: Optional[int] = None
+    ) -> Optional[ProcessedInput]:
+        """Retrieves a processed input by ID.
+
+        Pass the current `revision` if already read (e.g. for an ETag), so a
+        cache hit does not have to read it again.
+        """
+        self._sync_item_caches(revision)
+        p_input = processed_input_cache.get(input_id)
+        if p_input:
+            return p_input
+
+        generation = processed_input_cache.generation
+        with self._pool.reader() as conn:
+            row = conn.execute(
+                f"""
+                SELECT {", ".join(PROCESSED_INPUT_COLUMNS)}
+                FROM processed_inputs WHERE id = ?
+            """,
+                (input_id,),
+            ).fetchone()
+
+        if row:
+            p_input = _row_to_processed_input(row)
+            processed_input_cache.set(input_id, p_input, generation)
+            return p_input
+        return None
 
-    def get_processed_input(self, input_id: str) -> Optional[ProcessedInput]:
-        """Retrieves a processed input by ID."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+    def get_topic(
+        self, topic_id: str, revision: Optional[int] = None
+    ) -> Optional[Topic]:
+        """Retrieves a topic, with its latest playback content, by ID.
+        `revision` is as in get_processed_input."""
+        self._sync_item_caches(revision)
+        topic = topic_cache.get(topic_id)
+        if topic:
+            return topic
 
-        cursor.execute("SELECT data FROM processed_inputs WHERE id = ?", (input_id,))
-        row = cursor.fetchone()
-        conn.close()
+        generation = topic_cache.generation
+        with self._pool.reader() as conn:
+            row = conn.execute(
+                f"""
+                SELECT {_select_list("pi", PROCESSED_INPUT_COLUMNS)},
+                       {_select_list("pc", PLAYBACK_CONTENT_COLUMNS)}
+                FROM processed_inputs pi
+                LEFT JOIN playback_content pc ON pi.id = pc.processed_input_id
+                WHERE pi.id = ?
+                ORDER BY pc.rowid DESC
+                LIMIT 1
+            """,
+                (topic_id,),
+            ).fetchone()
 
         if row:
-            data = json.loads(row[0])
-            return ProcessedInput(**data)
+            topic = _row_to_topic(row)
+            topic_cache.set(topic_id, topic, generation)
+            return topic
         return None
 
     def upsert_topic_playback(self, topic_id: str, playback: PlaybackContent):
         """Stores playback content for a topic."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        values = playback.model_dump()
+        values["processed_input_id"] = topic_id
+        # Read the script before taking the write lock
+        script = _read_script_text(playback.script_json_url)
+        with self._pool.writer() as conn:
+            values["revision"] = _bump_revision(conn)
+            conn.execute(
+                _upsert_sql(
+                    "playback_content", PLAYBACK_CONTENT_COLUMNS + ("revision",)
+                ),
+                [values[c] for c in PLAYBACK_CONTENT_COLUMNS + ("revision",)],
+            )
+            _index_topic(conn, topic_id, script)
+        self._invalidate([topic_id])
 
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO playback_content (id, processed_input_id, data)
-            VALUES (?, ?, ?)
-        """,
-            (playback.id, topic_id, json.dumps(playback.model_dump())),
-        )
+    def _sync_item_caches(self, revision: Optional[int] = None):
+        """Drops the item caches if any process has written since last time."""
+        global _item_cache_revision
+        if revision is None:
+            revision = self.get_revision()
+        # A request that read the revision before another one synced may pass
+        # an older value, which must not clear the caches again
+        if _item_cache_revision is None or revision > _item_cache_revision:
+            processed_input_cache.clear()
+            topic_cache.clear()
+            _item_cache_revision = revision
+
+    def _invalidate(self, topic_ids: List[str]):
+        """Drops cached reads affected by a write. Call after the commit."""
+        for topic_id in topic_ids:
+            processed_input_cache.delete(topic_id)
+            topic_cache.delete(topic_id)
+        topic_page_cache.clear()
+
+    def get_topic_ids_with_playback(self, topic_ids: List[str]) -> Set[str]:
+        """Returns the subset of topic_ids that already have playback content."""
+        with self._pool.reader() as conn:
+            return self._topic_ids_with_playback(conn, topic_ids)
+
+    @staticmethod
+    def _topic_ids_with_playback(
+        conn: sqlite3.Connection, topic_ids: List[str]
+    ) -> Set[str]:
+        if not topic_ids:
+            return set()
 
-        conn.commit()
-        conn.close()
+        placeholders = ", ".join("?" * len(topic_ids))
+        rows = conn.execute(
+            f"""
+            SELECT DISTINCT processed_input_id FROM playback_content
+            WHERE processed_input_id IN ({placeholders})
+        """,
+            topic_ids,
+        ).fetchall()
+        return {row[0] for row in rows}
 
     def get_topics_without_playback_content(self) -> List[Topic]:
         """Returns topics that don't have associated playback content."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        # Join to find inputs without playback
-        # We need to return Topic objects.
-        # Select processed_inputs where id not in playback_content.processed_input_id
-
-        cursor.execute("""
-            SELECT pi.data
-            FROM processed_inputs pi
-            LEFT JOIN playback_content pc ON pi.id = pc.processed_input_id
-            WHERE pc.id IS NULL
-            ORDER BY pi.timestamp ASC
-        """)
-
-        rows = cursor.fetchall()
+        with self._pool.reader() as conn:
+            rows = conn.execute(f"""
+                SELECT {_select_list("pi", PROCESSED_INPUT_COLUMNS)}
+                FROM processed_inputs pi
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM playback_content pc
+                    WHERE pc.processed_input_id = pi.id
+                )
+                ORDER BY pi.timestamp ASC
+            """).fetchall()
+
         topics = []
         for row in rows:
-            p_input_data = json.loads(row[0])
-            p_input = ProcessedInput(**p_input_data)
+            p_input = _row_to_processed_input(row)
             topics.append(
                 Topic(
                     id=p_input.id,
@@ -118,40 +625,155 @@ class Database:
                 )
             )
 
-        conn.close()
         return topics
 
     def get_all_topics(self) -> List[Topic]:
         """Returns all topics, joining with playback content if available."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return list(self.iter_all_topics())
 
-        cursor.execute("""
-            SELECT pi.data, pc.data
-            FROM processed_inputs pi
-            LEFT JOIN playback_content pc ON pi.id = pc.processed_input_id
-            ORDER BY pi.timestamp DESC
-        """)
+    def iter_all_topics(
+        self, summary: bool = False
+    ) -> Iterator[Union[Topic, TopicSummary]]:
+        """Yields every topic, newest first, without loading them all at once.
 
-        rows = cursor.fetchall()
-        topics = []
-        for row in rows:
-            p_input_data = json.loads(row[0])
-            p_input = ProcessedInput(**p_input_data)
+        With summary=True, TopicSummary items are yielded instead and the
+        content column is never read.
+        """
+        columns, to_topic = _topic_projection(summary)
+        with self._pool.dedicated_reader() as conn:
+            rows = conn.execute(f"""
+                SELECT {_select_list("pi", columns)},
+                       {_select_list("pc", PLAYBACK_CONTENT_COLUMNS)}
+                FROM processed_inputs pi
+                LEFT JOIN playback_content pc ON pi.id = pc.processed_input_id
+                ORDER BY pi.timestamp DESC, pi.id DESC
+            """)
+            for row in rows:
+                yield to_topic(row)
 
-            playback = None
-            if row[1]:
-                playback_data = json.loads(row[1])
-                playback = PlaybackContent(**playback_data)
+    def get_topics_page(
+        self, limit: int, cursor: Optional[str] = None, summary: bool = False
+    ) -> Tuple[List[Union[Topic, TopicSummary]], Optional[str]]:
+        """
+        Returns up to `limit` topics, newest first, starting after `cursor`,
+        along with the cursor for the next page (None on the last page).
+        With summary=True the topics are TopicSummary items, as in
+        iter_all_topics.
+        """
+        columns, to_topic = _topic_projection(summary)
+        where = ""
+        params: list = []
+        if cursor:
+            where = "WHERE (timestamp, id) < (?, ?)"
+            params.extend(decode_cursor(cursor))
+        # Fetch one extra row to find out whether another page exists
+        params.append(limit + 1)
 
-            topics.append(
-                Topic(
-                    id=p_input.id,
-                    timestamp=p_input.timestamp,
-                    processed_input=p_input,
-                    playback_content=playback,
+        with self._pool.reader() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT {_select_list("pi", columns)},
+                       {_select_list("pc", PLAYBACK_CONTENT_COLUMNS)}
+                FROM (
+                    SELECT {", ".join(columns)} FROM processed_inputs
+                    {where}
+                    ORDER BY timestamp DESC, id DESC
+                    LIMIT ?
+                ) pi
+                LEFT JOIN playback_content pc ON pi.id = pc.processed_input_id
+                ORDER BY pi.timestamp DESC, pi.id DESC
+            """,
+                params,
+            ).fetchall()
+
+        topics, has_more = _trim_page([to_topic(row) for row in rows], limit)
+        if not has_more:
+            return topics, None
+
+        last = topics[-1]
+        return topics, encode_cursor(last.timestamp, last.id)
+
+    def search_topics(
+        self, query: str, limit: int, offset: int = 0
+    ) -> Tuple[List[Topic], Optional[int]]:
+        """
+        Returns up to `limit` topics matching every word of `query`, best match
+        first, along with the offset of the next page (None on the last page).
+        Title matches weigh most, then the sender, the content and the script.
+        """
+        fts_query = _fts_query(query)
+        if not fts_query:
+            return [], None
+
+        with self._pool.reader() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT {_select_list("pi", PROCESSED_INPUT_COLUMNS)},
+                       {_select_list("pc", PLAYBACK_CONTENT_COLUMNS)}
+                FROM (
+                    SELECT rowid, bm25(topics_fts, 10.0, 1.0, 2.0, 1.0) AS rank
+                    FROM topics_fts
+                    WHERE topics_fts MATCH ?
+                    ORDER BY rank
+                    LIMIT ? OFFSET ?
+                ) hits
+                JOIN processed_inputs pi ON pi.rowid = hits.rowid
+                LEFT JOIN playback_content pc ON pi.id = pc.processed_input_id
+                ORDER BY hits.rank
+            """,
+                # Fetch one extra hit to find out whether another page exists
+                (fts_query, limit + 1, offset),
+            ).fetchall()
+
+        topics, has_more = _trim_page([_row_to_topic(row) for row in rows], limit)
+        return topics, offset + limit if has_more else None
+
+    def get_topic_changes(
+        self, since: int, limit: int
+    ) -> Tuple[List[Topic], Optional[int]]:
+        """
+        Returns up to `limit` topics whose processed input or playback content
+        was written after revision `since`, oldest change first.
+
+        When more changes remain, also returns the revision of the last
+        included change, to pass as `since` for the next call. Otherwise
+        returns None, and the caller can resume from the current revision.
+        Every row has a revision of its own, so resuming never skips a change.
+        """
+        with self._pool.reader() as conn:
+            rows = conn.execute(
+                f"""
+                WITH changed AS (
+                    SELECT id, revision FROM processed_inputs WHERE revision > ?
+                    UNION ALL
+                    SELECT processed_input_id, revision FROM playback_content
+                    WHERE revision > ?
+                ), latest AS (
+                    SELECT id, MAX(revision) AS revision FROM changed
+                    GROUP BY id
+                    ORDER BY revision
+                    LIMIT ?
                 )
-            )
+                SELECT {_select_list("pi", PROCESSED_INPUT_COLUMNS)},
+                       {_select_list("pc", PLAYBACK_CONTENT_COLUMNS)},
+                       latest.revision
+                FROM latest
+                JOIN processed_inputs pi ON pi.id = latest.id
+                -- Only the latest playback content, as in get_topic()
+                LEFT JOIN playback_content pc ON pc.rowid = (
+                    SELECT MAX(rowid) FROM playback_content
+                    WHERE processed_input_id = pi.id
+                )
+                ORDER BY latest.revision
+            """,
+                # Fetch one extra change to find out whether more remain
+                (since, since, limit + 1),
+            ).fetchall()
 
-        conn.close()
-        return topics
+        changes, has_more = _trim_page(
+            [(_row_to_topic(row[:-1]), row[-1]) for row in rows],
+            limit,
+            key=lambda change: change[0].id,
+        )
+        topics = [topic for topic, _ in changes]
+        return topics, changes[-1][1] if has_more else None
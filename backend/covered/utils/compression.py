@@ -0,0 +1,83 @@
+import gzip
+import os
+from typing import List, Optional
+
+try:
+    import brotli
+except ImportError:  # optional, install covered-backend[compression]
+    brotli = None
+
+from covered.config import (
+    COMPRESS_BROTLI_QUALITY,
+    COMPRESS_GZIP_LEVEL,
+    COMPRESS_MIN_SIZE,
+    PRECOMPRESS_BROTLI_QUALITY,
+)
+
+# File suffix of each Content-Encoding, in order of preference
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def supported_encodings() -> List[str]:
+    return [e for e in ENCODING_SUFFIXES if e != "br" or brotli is not None]
+
+
+def compress(data: bytes, encoding: str, quality: Optional[int] = None) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=quality or COMPRESS_BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=quality or COMPRESS_GZIP_LEVEL)
+
+
+def write_precompressed(path: str):
+    """
+    Writes .br and .gz siblings of a file that is served many times, at a
+    higher compression level than is affordable per request.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    for encoding in supported_encodings():
+        quality = PRECOMPRESS_BROTLI_QUALITY if encoding == "br" else 9
+        with open(path + ENCODING_SUFFIXES[encoding], "wb") as f:
+            f.write(compress(data, encoding, quality))
+
+
+def precompressed_encodings(path: str) -> List[str]:
+    """Returns the encodings that have a precompressed sibling of path."""
+    return [e for e in ENCODING_SUFFIXES if os.path.isfile(path + ENCODING_SUFFIXES[e])]
+
+
+def compress_response(response, accept_encodings):
+    """
+    Compresses a JSON response body for clients that accept it. Meant as an
+    after_request hook, given the request's accept_encodings.
+
+    Streamed and file responses are left alone: compressing them here would
+    buffer the whole body.
+    """
+    if (
+        response.status_code != 200
+        or response.mimetype != "application/json"
+        or response.is_streamed
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+
+    encoding = accept_encodings.best_match(supported_encodings())
+    if encoding is None:
+        return response
+
+    response.set_data(compress(data, encoding))
+    response.headers["Content-Encoding"] = encoding
+    # The compressed bytes differ, so a strong validator would be wrong.
+    # Conditional requests compare weakly and still match.
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
@@ -0,0 +1,118 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict
+
+from covered.config import (
+    SQLITE_BUSY_TIMEOUT,
+    SQLITE_CACHE_SIZE,
+    SQLITE_MMAP_SIZE,
+    SQLITE_SYNCHRONOUS,
+)
+
+
+class ConnectionPool:
+    """
+    Long-lived SQLite connections for a single database file.
+
+    There is one writer connection per process, serialized by a lock, and one
+    reader connection per thread. With the database in WAL mode readers never
+    block the writer (or each other), so API reads stay fast while a worker
+    is writing.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._writer = self._connect(check_same_thread=False)
+        self._writer.execute("PRAGMA journal_mode=WAL")
+
+    def _connect(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        # Autocommit mode: transactions are opened explicitly by writer()
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=SQLITE_BUSY_TIMEOUT,
+            isolation_level=None,
+            check_same_thread=check_same_thread,
+        )
+        conn.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+        conn.execute(f"PRAGMA cache_size={SQLITE_CACHE_SIZE}")
+        conn.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        return conn
+
+    @contextmanager
+    def reader(self):
+        """Yields this thread's read connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        yield conn
+
+    @contextmanager
+    def dedicated_reader(self):
+        """Yields a private read connection that is closed afterwards.
+
+        Use this for long-running reads such as streamed responses, so an
+        abandoned cursor cannot pin an old snapshot on the shared thread
+        connection.
+        """
+        conn = self._connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def writer(self):
+        """Yields the shared write connection inside an immediate transaction.
+
+        The transaction is committed when the block exits cleanly and rolled
+        back otherwise.
+        """
+        with self._write_lock:
+            conn = self._writer
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+
+    def close(self):
+        """Closes the writer and this thread's reader connection."""
+        with self._write_lock:
+            self._writer.close()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str) -> ConnectionPool:
+    """Returns the process-wide pool for db_path, creating it on first use."""
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None:
+            pool = ConnectionPool(db_path)
+            _pools[db_path] = pool
+        return pool
+
+
+def close_pools():
+    """Closes and forgets every pool, e.g. before forking worker processes,
+    which must not inherit open SQLite connections."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
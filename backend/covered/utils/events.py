@@ -0,0 +1,35 @@
+import threading
+from typing import Optional
+
+
+class ChangeSignal:
+    """
+    Wakes threads waiting for the topics database to change.
+
+    Writers call notify() after storing something. Waiters capture
+    `generation` before checking the database and pass it to wait(), so a
+    write that lands between the check and the wait is never missed. Only
+    threads of this process are woken; anyone who must also see writes made
+    by other processes should wait with a timeout and re-check.
+    """
+
+    def __init__(self):
+        self.generation = 0
+        self._condition = threading.Condition()
+
+    def notify(self):
+        with self._condition:
+            self.generation += 1
+            self._condition.notify_all()
+
+    def wait(self, generation: int, timeout: Optional[float] = None) -> bool:
+        """Blocks until notify() is called after `generation` was read, or
+        until the timeout passes. Returns whether it was notified."""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self.generation != generation, timeout
+            )
+
+
+# Notified by the API whenever a topic or its playback content is stored
+topic_changes = ChangeSignal()
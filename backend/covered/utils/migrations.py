@@ -0,0 +1,62 @@
+import logging
+import sqlite3
+from typing import Callable, List, Optional
+
+from covered.utils.db_pool import ConnectionPool
+
+logger = logging.getLogger("MIGRATIONS")
+
+Migration = Callable[[sqlite3.Connection], None]
+
+
+def _get_version(conn: sqlite3.Connection, name: Optional[str]) -> int:
+    if name is None:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL
+        )
+    """)
+    row = conn.execute(
+        "SELECT version FROM schema_versions WHERE name = ?", (name,)
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def _set_version(conn: sqlite3.Connection, name: Optional[str], version: int):
+    if name is None:
+        conn.execute(f"PRAGMA user_version = {version}")
+    else:
+        conn.execute(
+            """
+            INSERT INTO schema_versions (name, version) VALUES (?, ?)
+            ON CONFLICT(name) DO UPDATE SET version = excluded.version
+        """,
+            (name, version),
+        )
+
+
+def run_migrations(
+    pool: ConnectionPool, migrations: List[Migration], name: Optional[str] = None
+):
+    """
+    Applies the migrations a database has not seen yet.
+
+    PRAGMA user_version stores how many migrations have been applied. A
+    schema that shares its database file with another one passes a `name`,
+    and its version is kept in the schema_versions table instead. Each
+    migration runs in its own transaction together with the version bump, so
+    a failure leaves the database at the last fully applied version.
+    """
+    for version, migration in enumerate(migrations, start=1):
+        with pool.writer() as conn:
+            current = _get_version(conn, name)
+            if current >= version:
+                continue
+
+            label = f"{pool.db_path} ({name})" if name else pool.db_path
+            logger.info(f"Migrating {label} to version {version}...")
+            migration(conn)
+            _set_version(conn, name, version)
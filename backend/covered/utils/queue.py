@@ -1,68 +1,574 @@
+import json
+from collections import Counter
+import logging
+import select
 import sqlite3
 import os
-import json
-from covered.config import DATA_DIR
+import socket
+import time
+from typing import List, Optional, Sequence, Tuple
+from covered.config import (
+    DATA_DIR,
+    PIPELINE_STAGES,
+    QUEUE_IN_TOPICS_DB,
+    QUEUE_LEASE_SECONDS,
+    QUEUE_MAX_ATTEMPTS,
+    QUEUE_NOTIFY_ADDRESS,
+    QUEUE_RETRY_BASE_DELAY,
+    QUEUE_RETRY_MAX_DELAY,
+    QUEUE_STATS_WINDOW,
+)
+from covered.models.data import ProcessedInput, QueueLease, QueueStats, StageStats
+from covered.utils.db_pool import get_pool
+from covered.utils.migrations import run_migrations
+
+
+def _create_queue_table(conn: sqlite3.Connection):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS queue (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            topic_id TEXT,
+            status TEXT DEFAULT 'pending',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def _add_lease_columns(conn: sqlite3.Connection):
+    conn.execute("ALTER TABLE queue ADD COLUMN worker_id TEXT")
+    conn.execute("ALTER TABLE queue ADD COLUMN leased_until REAL")
+    conn.execute("ALTER TABLE queue ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0")
+    conn.execute("CREATE INDEX idx_queue_status_id ON queue (status, id)")
+
+
+def _dedupe_active_jobs(conn: sqlite3.Connection):
+    """Allows at most one pending or leased job per topic."""
+    conn.execute("""
+        DELETE FROM queue
+        WHERE status IN ('pending', 'leased')
+          AND id NOT IN (
+            SELECT MIN(id) FROM queue
+            WHERE status IN ('pending', 'leased')
+            GROUP BY topic_id
+          )
+    """)
+    conn.execute("""
+        CREATE UNIQUE INDEX idx_queue_active_topic_id ON queue (topic_id)
+        WHERE status IN ('pending', 'leased')
+    """)
+
+
+def _add_retry_scheduling(conn: sqlite3.Connection):
+    conn.execute("ALTER TABLE queue ADD COLUMN available_at REAL NOT NULL DEFAULT 0")
+    conn.execute("ALTER TABLE queue ADD COLUMN last_error TEXT")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS dead_letter (
+            id INTEGER PRIMARY KEY,
+            topic_id TEXT,
+            attempts INTEGER,
+            last_error TEXT,
+            created_at TIMESTAMP,
+            failed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def _add_stages(conn: sqlite3.Connection):
+    conn.execute("ALTER TABLE queue ADD COLUMN stage TEXT NOT NULL DEFAULT 'fetch'")
+    conn.execute("ALTER TABLE dead_letter ADD COLUMN stage TEXT")
+    conn.execute("CREATE INDEX idx_queue_stage_status_id ON queue (stage, status, id)")
+
+
+def _add_payload(conn: sqlite3.Connection):
+    conn.execute("ALTER TABLE queue ADD COLUMN payload TEXT")
+
+
+def _create_completions(conn: sqlite3.Connection):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS completions (
+            stage TEXT,
+            completed_at REAL
+        )
+    """)
+    conn.execute(
+        "CREATE INDEX idx_completions_completed_at ON completions (completed_at)"
+    )
+
+
+def _backfill_available_at(conn: sqlite3.Connection):
+    """
+    available_at now records when a job became ready for its current stage,
+    not only when a retry may start. Jobs queued before have 0 there.
+    """
+    conn.execute("""
+        UPDATE queue SET available_at = CAST(strftime('%s', created_at) AS REAL)
+        WHERE available_at = 0
+    """)
+
+
+# Append only: the position of a migration in this list is its schema version
+MIGRATIONS = [
+    _create_queue_table,
+    _add_lease_columns,
+    _dedupe_active_jobs,
+    _add_retry_scheduling,
+    _add_stages,
+    _add_payload,
+    _create_completions,
+    _backfill_available_at,
+]
+
+# Bump when the payload format changes. Workers ignore payloads of other
+# versions and fetch the ProcessedInput from the API instead.
+PAYLOAD_VERSION = 1
+
+# Matches the row of a lease that is still held, see _lease_params()
+_LEASE_FILTER = "id = ? AND status = 'leased' AND worker_id = ? AND leased_until = ?"
+
+
+def _lease_params(lease: QueueLease) -> tuple:
+    return (lease.id, lease.worker_id, lease.leased_until)
+
+
+logger = logging.getLogger("QUEUE")
+
+# Datagrams sent per push; each one wakes at most one waiting worker
+MAX_NOTIFICATIONS_PER_PUSH = 16
+
+
+def _notify_address(stage: str) -> Tuple[str, int]:
+    """The UDP address that wakes the workers waiting for `stage` jobs."""
+    host, port = QUEUE_NOTIFY_ADDRESS
+    return host, port + PIPELINE_STAGES.index(stage)
+
+
+def notify_waiters(count: int, stage: str = PIPELINE_STAGES[0]):
+    """Wakes up to `count` workers blocked in pop() for `stage`. Best effort."""
+    address = _notify_address(stage)
+    try:
+        for _ in range(min(count, MAX_NOTIFICATIONS_PER_PUSH)):
+            # The kernel picks the receiving socket by hashing the sender's
+            # address, so datagrams sent from one socket would all wake the
+            # same worker
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.sendto(b"1", address)
+    except OSError:
+        # Nobody is listening, or the network stack refused; waiters still
+        # recheck the queue on their timeout
+        pass
+
+
+def _listen_for_notifications(stages: Sequence[str]) -> List[socket.socket]:
+    """
+    Binds the notification ports of `stages`, each shared by every worker
+    waiting for that stage. Returns no sockets if any port can't be bound.
+    """
+    sockets = []
+    try:
+        for stage in stages:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sockets.append(sock)
+            if hasattr(socket, "SO_REUSEPORT"):
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            sock.bind(_notify_address(stage))
+            sock.setblocking(False)
+    except OSError as e:
+        logger.warning(f"Cannot listen for queue notifications, polling: {e}")
+        for sock in sockets:
+            sock.close()
+        return []
+    return sockets
+
+
+def _wait_for_push(notifications: List[socket.socket], timeout: float):
+    if not notifications:
+        time.sleep(min(timeout, 5))
+        return
+
+    readable, _, _ = select.select(notifications, [], [], timeout)
+    if readable:
+        # Take a single datagram: any others were meant for other waiters,
+        # and pop_many() passes them on once it leased its jobs
+        try:
+            readable[0].recv(16)
+        except BlockingIOError:
+            pass
+
+
+def retry_delay(attempts: int) -> float:
+    """Seconds to wait before redelivering a job that failed `attempts` times."""
+    return min(QUEUE_RETRY_BASE_DELAY * 2 ** (attempts - 1), QUEUE_RETRY_MAX_DELAY)
+
+
+def _dead_letter(conn: sqlite3.Connection, where: str, params: tuple) -> int:
+    """Moves the queue rows matching `where` to dead_letter."""
+    conn.execute(
+        f"""
+        INSERT INTO dead_letter
+            (id, topic_id, stage, attempts, last_error, created_at)
+        SELECT id, topic_id, stage, attempts, last_error, created_at FROM queue
+        WHERE {where}
+    """,
+        params,
+    )
+    return conn.execute(f"DELETE FROM queue WHERE {where}", params).rowcount
+
+
+def encode_payload(p_input: ProcessedInput) -> str:
+    return json.dumps(
+        {"version": PAYLOAD_VERSION, "processed_input": p_input.model_dump()}
+    )
+
+
+def decode_payload(payload: Optional[str]) -> Optional[ProcessedInput]:
+    """Returns the job's ProcessedInput, or None if it has no usable payload."""
+    if payload is None:
+        return None
+
+    data = json.loads(payload)
+    if data.get("version") != PAYLOAD_VERSION:
+        return None
+    return ProcessedInput.model_construct(**data["processed_input"])
+
+
+def insert_jobs(conn: sqlite3.Connection, p_inputs: List[ProcessedInput]) -> int:
+    """
+    Enqueues topics at the first pipeline stage on a connection to the
+    queue's database, as part of the caller's transaction. Each job carries
+    its ProcessedInput, so workers need not fetch it from the API.
+
+    Topics that already have a pending or leased job are not added again,
+    though a pending job picks up the newer payload. Returns the number of
+    jobs added; call notify_waiters with it once the transaction commits.
+    """
+    rows = [(p_input.id, encode_payload(p_input)) for p_input in p_inputs]
+    now = time.time()
+    added = conn.executemany(
+        """
+        INSERT OR IGNORE INTO queue (topic_id, payload, available_at)
+        VALUES (?, ?, ?)
+    """,
+        [row + (now,) for row in rows],
+    ).rowcount
+    conn.executemany(
+        """
+        UPDATE queue SET payload = ?2
+        WHERE topic_id = ?1 AND status = 'pending' AND stage = ?3
+    """,
+        [(topic_id, payload, PIPELINE_STAGES[0]) for topic_id, payload in rows],
+    )
+    return added
+
+
+def _record_completion(conn: sqlite3.Connection, stage: str):
+    """Logs a finished stage for throughput stats, forgetting old entries."""
+    now = time.time()
+    conn.execute(
+        "DELETE FROM completions WHERE completed_at < ?", (now - QUEUE_STATS_WINDOW,)
+    )
+    conn.execute(
+        "INSERT INTO completions (stage, completed_at) VALUES (?, ?)", (stage, now)
+    )
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
 
 
 class QueueService:
-    def __init__(self):
-        self.db_path = os.path.join(DATA_DIR, "queue.db")
-        self._ensure_db()
-
-    def _ensure_db(self):
-        os.makedirs(DATA_DIR, exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS queue (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                topic_id TEXT,
-                status TEXT DEFAULT 'pending',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+    """
+    Work queue of topics with at-least-once delivery.
 
-        conn.commit()
-        conn.close()
+    pop() leases a job to a worker rather than removing it. The worker acks
+    the lease once the job is done, or nacks it to hand the job back. A lease
+    that is neither acked nor nacked before it expires (e.g. because the
+    worker crashed) makes the job available to the next pop().
 
-    def _get_connection(self):
-        return sqlite3.connect(self.db_path)
+    A nacked job is retried after an exponentially growing delay. Once it
+    has been delivered QUEUE_MAX_ATTEMPTS times without an ack it is moved
+    to the dead_letter table instead.
 
-    def push(self, topic_id: str):
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("INSERT INTO queue (topic_id) VALUES (?)", (topic_id,))
-        conn.commit()
-        conn.close()
+    Jobs move through PIPELINE_STAGES: a worker that finishes a stage calls
+    advance() to queue the topic for the next one, and acks after the last.
+    Workers can restrict pop() to the stages they handle.
+    """
 
-    def pop(self):
-        """Returns the next pending topic_id or None."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+    def __init__(self, worker_id: Optional[str] = None):
+        # With QUEUE_IN_TOPICS_DB the tables live next to processed_inputs
+        self.db_path = os.path.join(
+            DATA_DIR, "topics.db" if QUEUE_IN_TOPICS_DB else "queue.db"
+        )
+        self.worker_id = worker_id or default_worker_id()
+        self._pool = get_pool(self.db_path)
 
-        # Simple transaction to get and mark as processing/done
-        # For this simple implementation, we just delete it when popped or we could have a status.
-        # Let's just select one and delete it for now to simulate a simple queue,
-        # or better, return it and let the worker delete it?
-        # The prompt says: "Receives messages from a pubsub queue".
-        # Let's just do a simple pop (select + delete).
+    def initialize(self):
+        """Brings the schema up to date. Run once at process startup."""
+        # Sharing topics.db, our schema version can't live in its user_version
+        run_migrations(
+            self._pool, MIGRATIONS, name="queue" if QUEUE_IN_TOPICS_DB else None
+        )
 
+    def push(self, p_input: ProcessedInput) -> bool:
+        return self.push_many([p_input]) > 0
+
+    def push_many(self, p_inputs: List[ProcessedInput]) -> int:
+        """Enqueues several topics in a single transaction.
+
+        Topics that already have a pending or leased job are skipped. Returns
+        the number of jobs added.
+        """
+        with self._pool.writer() as conn:
+            added = insert_jobs(conn, p_inputs)
+        if added:
+            notify_waiters(added)
+        return added
+
+    def pop(
+        self,
+        timeout: float = 0,
+        lease_seconds: float = QUEUE_LEASE_SECONDS,
+        stages: Optional[Sequence[str]] = None,
+    ) -> Optional[QueueLease]:
+        """Leases the next available job to this worker.
+
+        If the queue is empty, waits up to `timeout` seconds for a push
+        before returning None. `stages` limits the jobs to those stages.
+        """
+        leases = self.pop_many(1, timeout, lease_seconds, stages)
+        return leases[0] if leases else None
+
+    def pop_many(
+        self,
+        n: int,
+        timeout: float = 0,
+        lease_seconds: float = QUEUE_LEASE_SECONDS,
+        stages: Optional[Sequence[str]] = None,
+    ) -> List[QueueLease]:
+        """Leases up to n available jobs to this worker in one transaction.
+
+        If the queue is empty, waits up to `timeout` seconds for a push
+        before returning an empty list. Never waits once any job is leased.
+        `stages` limits the jobs to those stages.
+        """
+        stages = list(stages or PIPELINE_STAGES)
+        if timeout <= 0:
+            return self._try_pop_many(n, lease_seconds, stages)
+
+        # Listen before checking the queue, so a push that lands in between
+        # still wakes us. Only waiting workers listen, so notifications are
+        # never spent on busy ones.
+        notifications = _listen_for_notifications(stages)
         try:
-            cursor.execute("BEGIN IMMEDIATE")
-            cursor.execute("SELECT id, topic_id FROM queue ORDER BY id ASC LIMIT 1")
-            row = cursor.fetchone()
-
-            if row:
-                queue_id, topic_id = row
-                cursor.execute("DELETE FROM queue WHERE id = ?", (queue_id,))
-                conn.commit()
-                return topic_id
-            else:
-                conn.commit()
-                return None
-        except Exception:
-            conn.rollback()
-            raise
+            deadline = time.monotonic() + timeout
+            while True:
+                leases = self._try_pop_many(n, lease_seconds, stages)
+                remaining = deadline - time.monotonic()
+                if leases or remaining <= 0:
+                    break
+                _wait_for_push(notifications, remaining)
         finally:
-            conn.close()
+            for sock in notifications:
+                sock.close()
+
+        if leases:
+            # Our sockets may have taken notifications meant for other
+            # waiters, which closing them discarded
+            self._notify_ready(stages)
+        return leases
+
+    def _notify_ready(self, stages: List[str]):
+        """Wakes waiters for the jobs of `stages` that are ready to lease."""
+        now = time.time()
+        placeholders = ", ".join("?" * len(stages))
+        with self._pool.reader() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT stage FROM queue
+                WHERE stage IN ({placeholders})
+                  AND ((status = 'pending' AND available_at <= ?)
+                       OR (status = 'leased' AND leased_until <= ?))
+                LIMIT ?
+            """,
+                (*stages, now, now, MAX_NOTIFICATIONS_PER_PUSH),
+            ).fetchall()
+        for stage, count in Counter(row[0] for row in rows).items():
+            notify_waiters(count, stage)
+
+    def _try_pop_many(
+        self, n: int, lease_seconds: float, stages: List[str]
+    ) -> List[QueueLease]:
+        now = time.time()
+        leased_until = now + lease_seconds
+        with self._pool.writer() as conn:
+            # Expired leases that used up their attempts are not redelivered
+            _dead_letter(
+                conn,
+                "status = 'leased' AND leased_until <= ? AND attempts >= ?",
+                (now, QUEUE_MAX_ATTEMPTS),
+            )
+
+            placeholders = ", ".join("?" * len(stages))
+            rows = conn.execute(
+                f"""
+                SELECT id, topic_id, stage, attempts, payload FROM queue
+                WHERE stage IN ({placeholders})
+                  AND ((status = 'pending' AND available_at <= ?)
+                       OR (status = 'leased' AND leased_until <= ?))
+                ORDER BY id ASC
+                LIMIT ?
+            """,
+                (*stages, now, now, n),
+            ).fetchall()
+
+            conn.executemany(
+                """
+                UPDATE queue
+                SET status = 'leased', worker_id = ?, leased_until = ?,
+                    attempts = attempts + 1
+                WHERE id = ?
+            """,
+                [(self.worker_id, leased_until, row[0]) for row in rows],
+            )
+
+        return [
+            QueueLease(
+                id=queue_id,
+                topic_id=topic_id,
+                stage=stage,
+                worker_id=self.worker_id,
+                attempts=attempts + 1,
+                leased_until=leased_until,
+                processed_input=decode_payload(payload),
+            )
+            for queue_id, topic_id, stage, attempts, payload in rows
+        ]
+
+    def ack(self, lease: QueueLease) -> bool:
+        """Removes a finished job.
+
+        Returns False if the lease had expired and was taken over by another
+        worker, in which case the job is left alone.
+        """
+        with self._pool.writer() as conn:
+            cursor = conn.execute(
+                f"DELETE FROM queue WHERE {_LEASE_FILTER}", _lease_params(lease)
+            )
+            if cursor.rowcount == 0:
+                return False
+            _record_completion(conn, lease.stage)
+            return True
+
+    def advance(self, lease: QueueLease, stage: str) -> bool:
+        """Finishes the job's current stage and queues it for `stage`.
+
+        The job keeps its place in line and starts the new stage with a
+        fresh attempt count. Returns False if the lease had expired and was
+        taken over.
+        """
+        with self._pool.writer() as conn:
+            cursor = conn.execute(
+                f"""
+                UPDATE queue
+                SET stage = ?, status = 'pending', worker_id = NULL,
+                    leased_until = NULL, attempts = 0, available_at = ?,
+                    last_error = NULL
+                WHERE {_LEASE_FILTER}
+            """,
+                (stage, time.time(), *_lease_params(lease)),
+            )
+            advanced = cursor.rowcount > 0
+            if advanced:
+                _record_completion(conn, lease.stage)
+        if advanced:
+            notify_waiters(1, stage)
+        return advanced
+
+    def nack(self, lease: QueueLease, error: Optional[str] = None) -> bool:
+        """Hands a failed job back to be retried later.
+
+        The job becomes available again after retry_delay(attempts), or is
+        moved to dead_letter if it has no attempts left. Returns False if the
+        lease had expired and was taken over.
+        """
+        with self._pool.writer() as conn:
+            conn.execute(
+                f"UPDATE queue SET last_error = ? WHERE {_LEASE_FILTER}",
+                (error, *_lease_params(lease)),
+            )
+
+            if lease.attempts >= QUEUE_MAX_ATTEMPTS:
+                moved = _dead_letter(conn, _LEASE_FILTER, _lease_params(lease))
+                if moved:
+                    logger.warning(
+                        f"Topic {lease.topic_id} failed stage {lease.stage} "
+                        f"{lease.attempts} times, moved to dead_letter."
+                    )
+                return moved > 0
+
+            cursor = conn.execute(
+                f"""
+                UPDATE queue
+                SET status = 'pending', worker_id = NULL, leased_until = NULL,
+                    available_at = ?
+                WHERE {_LEASE_FILTER}
+            """,
+                (time.time() + retry_delay(lease.attempts), *_lease_params(lease)),
+            )
+            return cursor.rowcount > 0
+
+    def stats(self) -> QueueStats:
+        """Reports the backlog and throughput, overall and per stage."""
+        now = time.time()
+        with self._pool.reader() as conn:
+            counts = conn.execute(
+                """
+                SELECT stage,
+                       SUM(status = 'pending' AND available_at <= ?),
+                       SUM(status = 'pending' AND available_at > ?),
+                       SUM(status = 'leased')
+                FROM queue
+                GROUP BY stage
+            """,
+                (now, now),
+            ).fetchall()
+            completions = conn.execute(
+                """
+                SELECT stage, COUNT(*) FROM completions
+                WHERE completed_at >= ?
+                GROUP BY stage
+            """,
+                (now - QUEUE_STATS_WINDOW,),
+            ).fetchall()
+            # Retrying jobs are not waiting for a worker, so they don't count
+            oldest_pending_age = conn.execute(
+                """
+                SELECT ? - MIN(available_at) FROM queue
+                WHERE status = 'pending' AND available_at <= ?
+            """,
+                (now, now),
+            ).fetchone()[0]
+            dead_letter = conn.execute("SELECT COUNT(*) FROM dead_letter").fetchone()[0]
+
+        counts = {row[0]: row[1:] for row in counts}
+        rates = {
+            stage: count / (QUEUE_STATS_WINDOW / 60) for stage, count in completions
+        }
+        stages = {
+            stage: StageStats(
+                pending=counts.get(stage, (0, 0, 0))[0],
+                retrying=counts.get(stage, (0, 0, 0))[1],
+                leased=counts.get(stage, (0, 0, 0))[2],
+                completed_per_minute=rates.get(stage, 0.0),
+            )
+            for stage in PIPELINE_STAGES
+        }
+
+        return QueueStats(
+            pending=sum(s.pending for s in stages.values()),
+            retrying=sum(s.retrying for s in stages.values()),
+            leased=sum(s.leased for s in stages.values()),
+            dead_letter=dead_letter,
+            oldest_pending_age_seconds=oldest_pending_age,
+            completed_per_minute=stages[PIPELINE_STAGES[-1]].completed_per_minute,
+            stages=stages,
+        )
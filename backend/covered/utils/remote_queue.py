@@ -0,0 +1,80 @@
+import time
+from typing import List, Optional, Sequence
+
+from covered.autogenerated_client.api.default_api import DefaultApi
+from covered.autogenerated_client.models.queue_advance_schema import (
+    QueueAdvanceSchema,
+)
+from covered.autogenerated_client.models.queue_lease_request_schema import (
+    QueueLeaseRequestSchema,
+)
+from covered.autogenerated_client.models.queue_lease_schema import QueueLeaseSchema
+from covered.autogenerated_client.models.queue_nack_schema import QueueNackSchema
+from covered.config import QUEUE_HTTP_WAIT_MAX
+from covered.models.data import QueueLease
+from covered.utils.queue import default_worker_id
+
+
+class RemoteQueueService:
+    """
+    The worker side of QueueService, talking to the API's /queue endpoints
+    instead of opening the queue database. Lets processing workers run on
+    machines other than the API.
+    """
+
+    def __init__(self, api_instance: DefaultApi, worker_id: Optional[str] = None):
+        self.api_instance = api_instance
+        self.worker_id = worker_id or default_worker_id()
+
+    def initialize(self):
+        """The API owns the queue schema; nothing to do."""
+
+    def pop(
+        self, timeout: float = 0, stages: Optional[Sequence[str]] = None
+    ) -> Optional[QueueLease]:
+        leases = self.pop_many(1, timeout, stages)
+        return leases[0] if leases else None
+
+    def pop_many(
+        self, n: int, timeout: float = 0, stages: Optional[Sequence[str]] = None
+    ) -> List[QueueLease]:
+        # The API holds each request for at most QUEUE_HTTP_WAIT_MAX, so
+        # longer waits take several requests
+        deadline = time.monotonic() + timeout
+        while True:
+            wait = min(max(deadline - time.monotonic(), 0), QUEUE_HTTP_WAIT_MAX)
+            requested = time.monotonic()
+            response = self.api_instance.lease_queue_jobs(
+                queue_lease_request_schema=QueueLeaseRequestSchema(
+                    worker_id=self.worker_id,
+                    stages=list(stages) if stages else None,
+                    max_jobs=n,
+                    wait_seconds=wait,
+                )
+            )
+            if response.leases or time.monotonic() >= deadline:
+                return [QueueLease(**lease.to_dict()) for lease in response.leases]
+            # An API busy with other waits answers at once; wait out the rest
+            # here rather than asking again right away
+            time.sleep(max(requested + wait - time.monotonic(), 0))
+
+    def ack(self, lease: QueueLease) -> bool:
+        return self.api_instance.ack_queue_lease(
+            queue_lease_schema=_to_schema(lease)
+        ).ok
+
+    def advance(self, lease: QueueLease, stage: str) -> bool:
+        return self.api_instance.advance_queue_lease(
+            queue_advance_schema=QueueAdvanceSchema(
+                lease=_to_schema(lease), stage=stage
+            )
+        ).ok
+
+    def nack(self, lease: QueueLease, error: Optional[str] = None) -> bool:
+        return self.api_instance.nack_queue_lease(
+            queue_nack_schema=QueueNackSchema(lease=_to_schema(lease), error=error)
+        ).ok
+
+
+def _to_schema(lease: QueueLease) -> QueueLeaseSchema:
+    return QueueLeaseSchema.from_dict(lease.model_dump())
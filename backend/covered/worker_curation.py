@@ -8,6 +8,9 @@ from imap_tools import MailBox
 
 from covered.autogenerated_client import Configuration, ApiClient
 from covered.autogenerated_client.api.default_api import DefaultApi
+from covered.autogenerated_client.models.processed_input_batch_schema import (
+    ProcessedInputBatchSchema,
+)
 from covered.autogenerated_client.models.processed_input_schema import (
     ProcessedInputSchema,
 )
@@ -15,6 +18,7 @@ from covered.autogenerated_client.models.processed_input_schema import (
 from covered.config import (
     BASE_URL,
     DATA_DIR,
+    INGEST_BATCH_SIZE_MAX,
     configure_logging,
 )
 from covered.models.data import Email, ProcessedInput
@@ -148,14 +152,22 @@ def curate_step():
         with ApiClient(configuration) as api_client:
             api_instance = DefaultApi(api_client)
 
-            for p_input in new_inputs:
+            # Post in batches so a burst of emails is stored in one round trip
+            for start in range(0, len(new_inputs), INGEST_BATCH_SIZE_MAX):
+                batch = new_inputs[start : start + INGEST_BATCH_SIZE_MAX]
+
                 # Convert to Client Model
-                input_data = ProcessedInputSchema(**p_input.model_dump())
+                batch_data = ProcessedInputBatchSchema(
+                    processed_inputs=[
+                        ProcessedInputSchema(**p_input.model_dump())
+                        for p_input in batch
+                    ]
+                )
 
                 # Post to API
-                api_instance.create_processed_input(processed_input_schema=input_data)
-
-        logger.info(f"Processed {len(new_inputs)} new inputs.")
+                api_instance.create_processed_inputs_batch(
+                    processed_input_batch_schema=batch_data
+                )
 
         logger.info(f"Processed {len(new_inputs)} new inputs.")
     else:
@@ -1,13 +1,16 @@
+import argparse
 import asyncio
 import contextlib
 import json
 import logging
 import os
 import tempfile
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from functools import cache
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Union
 
 import requests
 
@@ -15,12 +18,24 @@ from covered.config import (
     BASE_URL,
     GEMINI_API_KEY,
     MEDIA_DIR,
+    PIPELINE_DIR,
+    PIPELINE_STAGES,
+    QUEUE_POP_TIMEOUT,
     ROOT_DIR,
+    SHARED_DATA_DIR,
     configure_logging,
 )
-from covered.models.data import PlaybackContent, ProcessedInput, ScriptOutput
+from covered.models.data import (
+    PipelineState,
+    PlaybackContent,
+    ProcessedInput,
+    QueueLease,
+    ScriptOutput,
+)
 from covered.utils.queue import QueueService
+from covered.utils.remote_queue import RemoteQueueService
 from covered.utils.audio import convert_to_m4a
+from covered.utils.compression import write_precompressed
 from covered.utils.gemini_tts import generate_audio_gemini
 from covered.utils.headless_browser import HeadlessBrowserService
 from covered.utils.llm import LLMService
@@ -51,12 +66,7 @@ def temporary_wav_file(suffix: str):
             os.remove(path)
 
 
-async def generate_audio_and_transcript(
-    transcription_service: TranscriptionService,
-    script_text: str,
-    topic_id: str,
-    output_dir: str,
-) -> Tuple[str, Dict]:
+async def generate_audio(script_text: str, topic_id: str, output_dir: str) -> str:
     m4a_filename = "audio.m4a"
     os.makedirs(output_dir, exist_ok=True)
     m4a_path = os.path.join(output_dir, m4a_filename)
@@ -67,9 +77,27 @@ async def generate_audio_and_transcript(
         )
         await asyncio.to_thread(convert_to_m4a, wav_path, m4a_path)
 
+    return m4a_path
+
+
+# The ASR model is CPU bound and not safe to share; scale it with processes
+_transcription_lock = threading.Lock()
+
+
+def _transcribe(transcription_service: TranscriptionService, audio_path: str) -> Dict:
+    with _transcription_lock:
+        return transcription_service.transcribe(audio_path)
+
+
+async def generate_transcript(
+    transcription_service: TranscriptionService,
+    script_text: str,
+    m4a_path: str,
+    output_dir: str,
+) -> str:
     # Generate Transcript JSON using WhisperX
     transcript_json = await asyncio.to_thread(
-        transcription_service.transcribe, m4a_path
+        _transcribe, transcription_service, m4a_path
     )
 
     script_content = {"transcript": transcript_json, "text": script_text}
@@ -77,8 +105,10 @@ async def generate_audio_and_transcript(
     script_path = os.path.join(output_dir, script_filename)
     with open(script_path, "w") as f:
         json.dump(script_content, f)
+    # Served to every listener, so compress once up front
+    write_precompressed(script_path)
 
-    return m4a_path, script_path
+    return script_path
 
 
 @cache
@@ -112,71 +142,201 @@ def polish_script(text: str) -> str:
     return result.script
 
 
-async def process_topic(
-    processed_input: ProcessedInput, services: Dict
-) -> PlaybackContent:
-    """Orchestrates the processing of a single topic."""
-    logger.info(f"Processing topic: {processed_input.title} ({processed_input.id})")
+def _playback_dir(state: PipelineState) -> str:
+    return os.path.join(MEDIA_DIR, state.playback_id)
 
-    headless_service = services["headless"]
-    transcription_service = services["transcription"]
 
-    # 1. Generate Playback ID and Directory
-    logger.info("1. Generating Playback ID and Directory...")
-    playback_id = str(uuid.uuid4())
-    playback_dir = os.path.join(MEDIA_DIR, playback_id)
-    os.makedirs(playback_dir, exist_ok=True)
+def _media_url(path: str) -> str:
+    return os.path.join(BASE_URL, os.path.relpath(path, ROOT_DIR))
+
 
-    # 2. Get snapshot and content
-    logger.info("2. Fetching snapshot and content...")
+async def fetch_stage(state: PipelineState, services: Dict):
+    logger.info("Fetching snapshot and content...")
     page_content = await asyncio.to_thread(
-        headless_service.get_snapshot_and_content,
-        processed_input.extracted_link,
-        processed_input.id,
-        output_dir=playback_dir,
+        services["headless"].get_snapshot_and_content,
+        state.processed_input.extracted_link,
+        state.processed_input.id,
+        output_dir=_playback_dir(state),
     )
 
-    snapshot_url = page_content.snapshot_path
-    raw_content = page_content.extracted_text
+    state.snapshot_path = page_content.snapshot_path
+    state.thumbnail_path = page_content.thumbnail_path
+    state.extracted_text = page_content.extracted_text
 
-    # 3. Make a script
-    logger.info("3. Polishing script...")
-    script_text = await asyncio.to_thread(polish_script, raw_content)
 
-    # 4. Convert to audio
-    logger.info("4. Generating audio and transcript...")
-    audio_url, script_json_url = await generate_audio_and_transcript(
-        transcription_service=transcription_service,
-        script_text=script_text,
-        topic_id=processed_input.id,
-        output_dir=playback_dir,
+async def script_stage(state: PipelineState, services: Dict):
+    logger.info("Polishing script...")
+    state.script_text = await asyncio.to_thread(polish_script, state.extracted_text)
+
+
+async def tts_stage(state: PipelineState, services: Dict):
+    logger.info("Generating audio...")
+    state.m4a_path = await generate_audio(
+        state.script_text, state.processed_input.id, _playback_dir(state)
     )
 
-    logger.info("5. Saving PlaybackContent...")
-    playback_content = PlaybackContent(
-        id=playback_id,
-        processed_input_id=processed_input.id,
-        page_snapshot_url=os.path.join(
-            BASE_URL, os.path.relpath(snapshot_url, ROOT_DIR)
-        ),
-        thumbnail_url=os.path.join(
-            BASE_URL, os.path.relpath(page_content.thumbnail_path, ROOT_DIR)
-        )
-        if page_content.thumbnail_path
+
+async def transcribe_stage(state: PipelineState, services: Dict):
+    logger.info("Generating transcript...")
+    state.script_path = await generate_transcript(
+        transcription_service=services["transcription"],
+        script_text=state.script_text,
+        m4a_path=state.m4a_path,
+        output_dir=_playback_dir(state),
+    )
+
+
+# Keyed by the names in PIPELINE_STAGES
+STAGE_HANDLERS = {
+    "fetch": fetch_stage,
+    "script": script_stage,
+    "tts": tts_stage,
+    "transcribe": transcribe_stage,
+}
+
+
+def new_pipeline_state(processed_input: ProcessedInput) -> PipelineState:
+    playback_id = str(uuid.uuid4())
+    os.makedirs(os.path.join(MEDIA_DIR, playback_id), exist_ok=True)
+    return PipelineState(processed_input=processed_input, playback_id=playback_id)
+
+
+def _state_path(topic_id: str) -> str:
+    return os.path.join(PIPELINE_DIR, f"{topic_id}.json")
+
+
+def load_pipeline_state(topic_id: str) -> Optional[PipelineState]:
+    try:
+        with open(_state_path(topic_id)) as f:
+            return PipelineState.model_validate_json(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def save_pipeline_state(state: PipelineState):
+    os.makedirs(PIPELINE_DIR, exist_ok=True)
+    path = _state_path(state.processed_input.id)
+    # Write then rename, so a crash never leaves a half written state
+    with open(path + ".tmp", "w") as f:
+        f.write(state.model_dump_json())
+    os.replace(path + ".tmp", path)
+
+
+def discard_pipeline_state(topic_id: str):
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(_state_path(topic_id))
+
+
+def to_playback_content(state: PipelineState) -> PlaybackContent:
+    return PlaybackContent(
+        id=state.playback_id,
+        processed_input_id=state.processed_input.id,
+        page_snapshot_url=_media_url(state.snapshot_path),
+        thumbnail_url=_media_url(state.thumbnail_path)
+        if state.thumbnail_path
         else None,
-        script_json_url=os.path.join(
-            BASE_URL, os.path.relpath(script_json_url, ROOT_DIR)
-        ),
-        m4a_file_url=os.path.join(BASE_URL, os.path.relpath(audio_url, ROOT_DIR)),
+        script_json_url=_media_url(state.script_path),
+        m4a_file_url=_media_url(state.m4a_path),
     )
 
-    logger.info(f"Completed processing for {processed_input.id}")
-    return playback_content
 
+async def run_stage(
+    queue: Union[QueueService, RemoteQueueService],
+    lease: QueueLease,
+    services: Dict,
+    api_instance: DefaultApi,
+):
+    """Runs the leased stage of a topic, then queues it for the next one."""
+    input_id = lease.topic_id
+    stage_index = PIPELINE_STAGES.index(lease.stage)
+
+    if stage_index == 0:
+        p_input = lease.processed_input
+        if p_input is None:
+            # Older jobs carry no payload, fetch ProcessedInput from API
+            try:
+                api_response = api_instance.get_processed_input(input_id)
+            except NotFoundException:
+                logger.error(f"Input {input_id} not found in API.")
+                queue.ack(lease)
+                return
+            p_input = ProcessedInput(**api_response.to_dict())
+
+        state = new_pipeline_state(p_input)
+    else:
+        state = load_pipeline_state(input_id)
+        if state is None:
+            # Retried like any failure, so a topic whose state is lost ends
+            # up in dead_letter rather than cycling through the pipeline
+            logger.error(f"No pipeline state for {input_id}.")
+            queue.nack(lease, error="No pipeline state")
+            return
+
+    await STAGE_HANDLERS[lease.stage](state, services)
+
+    if stage_index + 1 < len(PIPELINE_STAGES):
+        save_pipeline_state(state)
+        if not queue.advance(lease, PIPELINE_STAGES[stage_index + 1]):
+            logger.warning(f"Lease on {input_id} expired before advancing.")
+        return
+
+    # Post PlaybackContent to API
+    # Convert to client schema
+    playback_schema = PlaybackContentSchema(**to_playback_content(state).model_dump())
+    api_instance.create_playback_content(playback_content_schema=playback_schema)
+
+    if queue.ack(lease):
+        discard_pipeline_state(input_id)
+        logger.info(f"Completed processing for {input_id}")
+    else:
+        logger.warning(f"Lease on {input_id} expired before ack.")
+
+
+async def stage_loop(
+    stages: List[str], services: Dict, api_instance: DefaultApi, remote: bool
+):
+    if remote:
+        queue = RemoteQueueService(api_instance)
+    else:
+        # One QueueService per loop, so each waits on its own notification socket
+        queue = QueueService()
+
+    while True:
+        lease = None
+        try:
+            # Blocks until a topic is pushed, rather than polling
+            lease = await asyncio.to_thread(
+                queue.pop, timeout=QUEUE_POP_TIMEOUT, stages=stages
+            )
+
+            if not lease:
+                continue
+
+            logger.info(
+                f"Picked up {lease.stage} of input {lease.topic_id} from queue "
+                f"(attempt {lease.attempts})."
+            )
+            await run_stage(queue, lease, services, api_instance)
+
+        except Exception as e:
+            logger.error(f"Error in processing loop: {e}", exc_info=True)
+            if lease:
+                # The queue delays the retry, so move on to the next job
+                queue.nack(lease, error=repr(e))
+            else:
+                await asyncio.sleep(5)  # Backoff on error
 
-async def processing_loop():
-    logger.info("Starting Processing Loop...")
-    queue = QueueService()
+
+async def processing_loop(stages: List[str], concurrency: int, remote: bool):
+    logger.info(f"Starting Processing Loop for {', '.join(stages)}...")
+    # Every stage loop runs its blocking calls through asyncio.to_thread, one
+    # at a time. The default executor (min(32, cpus + 4) threads) would cap
+    # how many loops make progress at once below `concurrency`.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="stage")
+    )
+    if not remote:
+        QueueService().initialize()
 
     # Instantiate services once
     services = {
@@ -189,44 +349,49 @@ async def processing_loop():
 
     with ApiClient(configuration) as api_client:
         api_instance = DefaultApi(api_client)
-
-        while True:
-            try:
-                input_id = queue.pop()
-
-                if not input_id:
-                    await asyncio.sleep(5)
-                    continue
-
-                logger.info(f"Picked up input {input_id} from queue.")
-
-                # Fetch ProcessedInput from API
-                try:
-                    api_response = api_instance.get_processed_input(input_id)
-                except NotFoundException:
-                    logger.error(f"Input {input_id} not found in API.")
-                    continue
-
-                p_input = ProcessedInput(**api_response.to_dict())
-
-                playback_content = await process_topic(p_input, services)
-
-                # Post PlaybackContent to API
-                # Convert to client schema
-                playback_schema = PlaybackContentSchema(**playback_content.model_dump())
-                api_instance.create_playback_content(
-                    playback_content_schema=playback_schema
-                )
-
-            except Exception as e:
-                logger.error(f"Error in processing loop: {e}", exc_info=True)
-                await asyncio.sleep(5)  # Backoff on error
+        await asyncio.gather(
+            *(
+                stage_loop(stages, services, api_instance, remote)
+                for _ in range(concurrency)
+            )
+        )
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Covered processing worker")
+    parser.add_argument(
+        "--stage",
+        dest="stages",
+        action="append",
+        choices=PIPELINE_STAGES,
+        help="Pipeline stage to work on. Repeat for several; defaults to all.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of jobs to work on at once.",
+    )
+    parser.add_argument(
+        "--remote",
+        action="store_true",
+        help="Take jobs from the API at BASE_URL instead of the local queue.db, "
+        "for workers on other machines. Requires SHARED_DATA_DIR.",
+    )
+    args = parser.parse_args()
+    if args.remote and not SHARED_DATA_DIR:
+        parser.error(
+            "--remote needs DATA_DIR on storage shared with the API and the "
+            "other workers; set SHARED_DATA_DIR=true once it is"
+        )
+
     logger.info("Starting Processing Worker")
     try:
-        asyncio.run(processing_loop())
+        asyncio.run(
+            processing_loop(
+                args.stages or list(PIPELINE_STAGES), args.concurrency, args.remote
+            )
+        )
     except KeyboardInterrupt:
         logger.info("Processing Worker stopped by user.")
     except Exception as e:
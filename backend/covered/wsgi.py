@@ -0,0 +1,72 @@
+import logging
+
+from gunicorn.app.base import BaseApplication
+
+from covered.config import (
+    SERVER_HOST,
+    SERVER_KEEPALIVE,
+    SERVER_PORT,
+    SERVER_THREADS,
+    SERVER_TIMEOUT,
+    SERVER_WORKERS,
+    configure_logging,
+)
+from covered.main import create_app
+from covered.models.database import Database
+from covered.utils.db_pool import close_pools
+from covered.utils.queue import QueueService
+
+configure_logging()
+logger = logging.getLogger("MAIN_SERVICE")
+
+
+class ProductionServer(BaseApplication):
+    """
+    Runs the API under gunicorn: several worker processes, each serving
+    requests on a pool of threads, with HTTP keep-alive.
+
+    The app is created in each worker rather than once before forking, so
+    no SQLite connection is ever shared between processes. Migrations are
+    not run by the workers, see main().
+    """
+
+    def __init__(self, options: dict):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        return create_app(migrate=False)
+
+
+def main():
+    logger.info(
+        f"Starting Main Service (API) with {SERVER_WORKERS} workers "
+        f"x {SERVER_THREADS} threads..."
+    )
+    # Migrate once before forking. Workers migrating at the same time would
+    # wait on each other's write lock, and a long migration (e.g. building
+    # the search index of a large archive) fails them with "database is
+    # locked", which makes gunicorn halt.
+    Database().initialize()
+    QueueService().initialize()
+    close_pools()
+
+    ProductionServer(
+        {
+            "bind": f"{SERVER_HOST}:{SERVER_PORT}",
+            "workers": SERVER_WORKERS,
+            "threads": SERVER_THREADS,
+            "worker_class": "gthread",
+            "keepalive": SERVER_KEEPALIVE,
+            "timeout": SERVER_TIMEOUT,
+            "preload_app": False,
+        }
+    ).run()
+
+
+if __name__ == "__main__":
+    main()
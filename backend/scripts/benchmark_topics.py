@@ -0,0 +1,62 @@
+import argparse
+import statistics
+import threading
+import time
+
+import requests
+
+
+def worker(url: str, count: int, latencies: list, errors: list):
+    # One keep-alive session per thread, like a polling client
+    with requests.Session() as session:
+        for _ in range(count):
+            start = time.perf_counter()
+            try:
+                response = session.get(url)
+                response.raise_for_status()
+                response.content
+            except requests.RequestException as e:
+                errors.append(e)
+                continue
+            latencies.append(time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measures requests/sec against a running API server."
+    )
+    parser.add_argument("--url", default="http://127.0.0.1:8000/topics")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    per_thread = args.requests // args.concurrency
+    latencies, errors = [], []
+    threads = [
+        threading.Thread(target=worker, args=(args.url, per_thread, latencies, errors))
+        for _ in range(args.concurrency)
+    ]
+
+    print(
+        f"GET {args.url}: {per_thread * args.concurrency} requests, "
+        f"{args.concurrency} concurrent"
+    )
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(latencies) / elapsed:.1f} requests/sec, {len(errors)} errors")
+    if latencies:
+        latencies.sort()
+        print(
+            f"latency ms: median {statistics.median(latencies) * 1000:.1f}, "
+            f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:.1f}, "
+            f"max {latencies[-1] * 1000:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import covered.models.database as database
+import covered.utils.queue as queue
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Points the topic and queue databases at a fresh directory."""
+    for module in (database, queue):
+        monkeypatch.setattr(module, "DATA_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def db(data_dir):
+    return database.Database()
+
+
+@pytest.fixture
+def client(data_dir):
+    from covered.main import create_app
+
+    return create_app().test_client()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freezes the queue's wall clock; advance it through `.value`."""
+    now = SimpleNamespace(value=1000.0)
+    fake_time = SimpleNamespace(
+        time=lambda: now.value, monotonic=time.monotonic, sleep=time.sleep
+    )
+    monkeypatch.setattr(queue, "time", fake_time)
+    return now
@@ -0,0 +1,17 @@
+import pytest
+
+
+@pytest.mark.parametrize(
+    "path", ["/topics", "/topics?limit=10", "/topics/t0", "/processed-inputs/t0"]
+)
+def test_unchanged_topics_are_not_modified(client, path):
+    client.post(
+        "/processed-inputs",
+        json={"id": "t0", "timestamp": "2024", "title": "T", "content": "C"},
+    )
+    etag = client.get(path).headers["ETag"]
+
+    response = client.get(path, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
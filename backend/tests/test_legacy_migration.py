@@ -0,0 +1,76 @@
+import json
+import sqlite3
+
+from covered.models.data import PlaybackContent, ProcessedInput
+
+
+def _legacy_archive(db_path: str):
+    """Writes topics.db as the versions storing JSON `data` blobs did."""
+    p_inputs = [
+        ProcessedInput(
+            id=f"t{i}",
+            timestamp=f"2024-01-0{i + 1}",
+            title=f"zebra {i}",
+            content="C",
+            sender="alice",
+        )
+        for i in range(2)
+    ]
+    playback = PlaybackContent(
+        id="p0",
+        processed_input_id="t0",
+        page_snapshot_url="snapshot.png",
+        script_json_url="script.json",
+        m4a_file_url="audio.m4a",
+    )
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE processed_inputs (
+            id TEXT PRIMARY KEY,
+            timestamp TEXT,
+            data TEXT
+        );
+        CREATE TABLE playback_content (
+            id TEXT PRIMARY KEY,
+            processed_input_id TEXT,
+            data TEXT,
+            FOREIGN KEY(processed_input_id) REFERENCES processed_inputs(id)
+        );
+    """)
+    conn.executemany(
+        "INSERT INTO processed_inputs (id, timestamp, data) VALUES (?, ?, ?)",
+        [(p.id, p.timestamp, json.dumps(p.model_dump())) for p in p_inputs],
+    )
+    conn.execute(
+        "INSERT INTO playback_content (id, processed_input_id, data) VALUES (?, ?, ?)",
+        (playback.id, "t0", json.dumps(playback.model_dump())),
+    )
+    conn.commit()
+    conn.close()
+    return p_inputs, playback
+
+
+def test_converts_json_blob_tables_to_typed_columns(data_dir):
+    import covered.models.database as database
+
+    p_inputs, playback = _legacy_archive(str(data_dir / "topics.db"))
+    db = database.Database()
+
+    db.initialize()
+
+    topic = db.get_topic("t0")
+    assert topic.processed_input == p_inputs[0]
+    assert topic.playback_content == playback
+    assert db.get_topic("t1").processed_input == p_inputs[1]
+    assert db.get_topic("t1").playback_content is None
+    with db._pool.reader() as conn:
+        tables = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
+    assert not {"legacy_processed_inputs", "legacy_playback_content"} & tables
+    # The converted rows are searchable and in the change feed
+    assert [t.id for t in db.search_topics("zebra", limit=10)[0]] == ["t0", "t1"]
+    assert {t.id for t in db.get_topic_changes(0, 10)[0]} == {"t0", "t1"}
@@ -0,0 +1,26 @@
+import threading
+import time
+
+import covered.main as main
+
+
+def test_lease_waits_past_the_cap_return_at_once(client, monkeypatch):
+    monkeypatch.setattr(main, "queue_lease_waits", threading.BoundedSemaphore(1))
+    main.queue_lease_waits.acquire()
+
+    start = time.monotonic()
+    response = client.post("/queue/lease", json={"worker_id": "w", "wait_seconds": 5})
+
+    assert response.status_code == 200
+    assert response.get_json() == {"leases": []}
+    assert time.monotonic() - start < 1
+
+
+def test_lease_waits_under_the_cap_wait(client):
+    start = time.monotonic()
+    response = client.post("/queue/lease", json={"worker_id": "w", "wait_seconds": 0.5})
+
+    assert response.get_json() == {"leases": []}
+    assert time.monotonic() - start >= 0.5
+    assert main.queue_lease_waits.acquire(blocking=False)
+    main.queue_lease_waits.release()
@@ -0,0 +1,81 @@
+import pytest
+
+import covered.utils.queue as queue
+from covered.models.data import ProcessedInput
+
+
+@pytest.fixture
+def queue_service(data_dir, clock):
+    service = queue.QueueService(worker_id="w")
+    service.initialize()
+    service.push(ProcessedInput(id="t0", timestamp="2024", title="T", content="C"))
+    return service
+
+
+def _dead_letters(service: queue.QueueService):
+    with service._pool.reader() as conn:
+        return conn.execute(
+            "SELECT topic_id, stage, attempts, last_error FROM dead_letter"
+        ).fetchall()
+
+
+def test_nacked_job_is_retried_after_a_growing_delay(queue_service, clock):
+    lease = queue_service.pop()
+    assert lease.attempts == 1
+    assert queue_service.nack(lease, error="boom")
+
+    clock.value += queue.retry_delay(1) - 1
+    assert queue_service.pop() is None
+    assert queue_service.stats().retrying == 1
+    clock.value += 1
+    lease = queue_service.pop()
+    assert lease.attempts == 2
+    assert queue_service.nack(lease)
+
+    clock.value += queue.retry_delay(1)
+    assert queue_service.pop() is None
+    clock.value += queue.retry_delay(2) - queue.retry_delay(1)
+    assert queue_service.pop().attempts == 3
+
+
+def test_job_moves_to_dead_letter_after_max_attempts(queue_service, clock):
+    for attempt in range(1, queue.QUEUE_MAX_ATTEMPTS + 1):
+        lease = queue_service.pop()
+        assert lease.attempts == attempt
+        assert queue_service.nack(lease, error=f"error {attempt}")
+        clock.value += queue.QUEUE_RETRY_MAX_DELAY
+
+    assert queue_service.pop() is None
+    assert queue_service.stats().dead_letter == 1
+    assert _dead_letters(queue_service) == [
+        ("t0", "fetch", queue.QUEUE_MAX_ATTEMPTS, f"error {queue.QUEUE_MAX_ATTEMPTS}")
+    ]
+
+
+def test_expired_lease_without_attempts_left_is_not_redelivered(queue_service, clock):
+    for _ in range(queue.QUEUE_MAX_ATTEMPTS - 1):
+        queue_service.nack(queue_service.pop())
+        clock.value += queue.QUEUE_RETRY_MAX_DELAY
+    assert queue_service.pop(lease_seconds=10).attempts == queue.QUEUE_MAX_ATTEMPTS
+
+    clock.value += 10
+    assert queue_service.pop() is None
+    assert [row[:3] for row in _dead_letters(queue_service)] == [
+        ("t0", "fetch", queue.QUEUE_MAX_ATTEMPTS)
+    ]
+
+
+def test_expired_lease_taken_over_cannot_be_finished_by_its_old_worker(
+    queue_service, clock
+):
+    stale = queue_service.pop(lease_seconds=10)
+    clock.value += 10
+    other = queue.QueueService(worker_id="other")
+    lease = other.pop()
+    assert (lease.id, lease.attempts) == (stale.id, 2)
+
+    assert not queue_service.ack(stale)
+    assert not queue_service.nack(stale)
+    assert not queue_service.advance(stale, "script")
+    assert other.ack(lease)
+    assert other.pop() is None
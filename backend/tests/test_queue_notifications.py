@@ -0,0 +1,72 @@
+import threading
+import time
+
+import pytest
+
+from covered.models.data import ProcessedInput
+from covered.utils.queue import QueueService
+
+
+@pytest.fixture
+def queue_service(data_dir):
+    service = QueueService(worker_id="main")
+    service.initialize()
+    return service
+
+
+def _wait_in_thread(stage: str, results: dict):
+    def pop():
+        start = time.monotonic()
+        lease = QueueService(worker_id=stage).pop(timeout=2, stages=[stage])
+        results[stage] = (lease, time.monotonic() - start)
+
+    thread = threading.Thread(target=pop)
+    thread.start()
+    return thread
+
+
+def test_advance_wakes_a_worker_waiting_for_the_next_stage(queue_service):
+    queue_service.push(
+        ProcessedInput(id="t0", timestamp="2024", title="T", content="C")
+    )
+    lease = queue_service.pop()
+
+    results = {}
+    threads = [_wait_in_thread(stage, results) for stage in ("fetch", "script")]
+    time.sleep(0.2)
+    queue_service.advance(lease, "script")
+    threads[1].join()
+
+    script_lease, waited = results["script"]
+    assert script_lease.topic_id == "t0"
+    assert waited < 1
+    threads[0].join()
+
+
+def test_a_batch_wakes_every_waiting_worker(queue_service):
+    # Several datagrams can land on one waiter's socket; run a few rounds
+    for batch in range(5):
+        waited = []
+
+        def pop(worker_id: str):
+            start = time.monotonic()
+            if QueueService(worker_id=worker_id).pop(timeout=3, stages=["fetch"]):
+                waited.append(time.monotonic() - start)
+
+        threads = [threading.Thread(target=pop, args=(f"w{i}",)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        queue_service.push_many(
+            [
+                ProcessedInput(
+                    id=f"b{batch}t{i}", timestamp="2024", title="T", content="C"
+                )
+                for i in range(4)
+            ]
+        )
+        for thread in threads:
+            thread.join()
+
+        assert len(waited) == 4
+        assert max(waited) < 1
@@ -0,0 +1,36 @@
+import pytest
+
+import covered.utils.queue as queue
+from covered.models.data import ProcessedInput
+
+
+@pytest.fixture
+def queue_service(data_dir):
+    service = queue.QueueService(worker_id="w")
+    service.initialize()
+    return service
+
+
+def test_oldest_pending_age_restarts_when_a_job_advances(queue_service, clock):
+    queue_service.push(
+        ProcessedInput(id="t0", timestamp="2024", title="T", content="C")
+    )
+
+    clock.value += 4000
+    queue_service.advance(queue_service.pop(), "script")
+    clock.value += 10
+
+    assert queue_service.stats().oldest_pending_age_seconds == 10
+
+
+def test_oldest_pending_age_leaves_out_retrying_jobs(queue_service, clock):
+    queue_service.push(
+        ProcessedInput(id="t0", timestamp="2024", title="T", content="C")
+    )
+
+    queue_service.nack(queue_service.pop(), "boom")
+    clock.value += 1
+
+    stats = queue_service.stats()
+    assert stats.retrying == 1
+    assert stats.oldest_pending_age_seconds is None
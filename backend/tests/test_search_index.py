@@ -0,0 +1,70 @@
+import json
+
+import covered.models.database as database
+from covered.models.data import PlaybackContent, ProcessedInput
+from covered.utils.db_pool import get_pool
+from covered.utils.migrations import run_migrations
+
+
+def _archive_with_scripts(root, count: int) -> database.Database:
+    """Builds a version 1 archive (before the search index) whose topics each
+    have a script.json under DATA_DIR."""
+    pool = get_pool(database.Database().db_path)
+    run_migrations(pool, database.MIGRATIONS[:1])
+    for i in range(count):
+        script_dir = root / "data" / "playback-content" / f"p{i}"
+        script_dir.mkdir(parents=True)
+        (script_dir / "script.json").write_text(json.dumps({"text": f"zebra{i}"}))
+        p_input = ProcessedInput(
+            id=f"t{i}", timestamp="2024-01-01T00:00:00", title="T", content="C"
+        )
+        playback = PlaybackContent(
+            id=f"p{i}",
+            processed_input_id=f"t{i}",
+            page_snapshot_url="http://host/data/snapshot.png",
+            script_json_url=f"http://host/data/playback-content/p{i}/script.json",
+            m4a_file_url="http://host/data/audio.m4a",
+        )
+        with pool.writer() as conn:
+            conn.execute(
+                database._upsert_sql(
+                    "processed_inputs", database.PROCESSED_INPUT_COLUMNS
+                ),
+                [p_input.model_dump()[c] for c in database.PROCESSED_INPUT_COLUMNS],
+            )
+            conn.execute(
+                database._upsert_sql(
+                    "playback_content", database.PLAYBACK_CONTENT_COLUMNS
+                ),
+                [playback.model_dump()[c] for c in database.PLAYBACK_CONTENT_COLUMNS],
+            )
+    return database.Database()
+
+
+def test_indexes_scripts_of_an_existing_archive_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, "ROOT_DIR", str(tmp_path))
+    monkeypatch.setattr(database, "DATA_DIR", str(tmp_path / "data"))
+    monkeypatch.setattr(database, "SEARCH_BACKFILL_BATCH_SIZE", 2)
+    db = _archive_with_scripts(tmp_path, 5)
+
+    db.initialize()
+
+    for i in range(5):
+        topics, _ = db.search_topics(f"zebra{i}", limit=10)
+        assert [topic.id for topic in topics] == [f"t{i}"]
+    with get_pool(db.db_path).reader() as conn:
+        assert not conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'pending_script_index'"
+        ).fetchone()
+
+
+def test_search_index_migration_reads_no_scripts(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, "ROOT_DIR", str(tmp_path))
+    monkeypatch.setattr(database, "DATA_DIR", str(tmp_path / "data"))
+    db = _archive_with_scripts(tmp_path, 2)
+    reads = []
+    monkeypatch.setattr(database, "_read_script_text", reads.append)
+
+    run_migrations(get_pool(db.db_path), database.MIGRATIONS)
+
+    assert reads == []
@@ -0,0 +1,31 @@
+import pytest
+
+import covered.main as main
+
+
+@pytest.fixture
+def script(data_dir, monkeypatch):
+    monkeypatch.setattr(main, "DATA_DIR", str(data_dir))
+    (data_dir / "script.json").write_text('{"text": "T"}')
+    (data_dir / "script.json.br").write_bytes(b"compressed")
+    return "/data/script.json"
+
+
+def test_serves_the_accepted_precompressed_sibling(client, script):
+    response = client.get(script, headers={"Accept-Encoding": "br"})
+
+    assert response.headers["Content-Encoding"] == "br"
+    assert response.data == b"compressed"
+    assert "Accept-Encoding" in response.vary
+
+
+def test_accel_redirect_leaves_precompressed_siblings_to_nginx(
+    client, script, monkeypatch
+):
+    monkeypatch.setattr(main, "DATA_OFFLOAD", "x-accel-redirect")
+
+    response = client.get(script, headers={"Accept-Encoding": "br"})
+
+    assert response.headers["X-Accel-Redirect"] == "/protected-data/script.json"
+    assert "Content-Encoding" not in response.headers
+    assert response.mimetype == "application/json"
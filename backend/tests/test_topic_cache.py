@@ -0,0 +1,48 @@
+from covered.api.schemas import TopicListSchema
+from covered.models.data import ProcessedInput
+
+
+def test_cache_hits_with_a_known_revision_skip_sqlite(db):
+    db.initialize()
+    db.upsert_processed_input(
+        ProcessedInput(id="t0", timestamp="2024", title="T", content="C")
+    )
+    revision = db.get_revision()
+    db.get_topic("t0", revision)
+    db.get_processed_input("t0", revision)
+
+    statements = []
+    with db._pool.reader() as conn:
+        conn.set_trace_callback(statements.append)
+        try:
+            assert db.get_topic("t0", revision).id == "t0"
+            assert db.get_processed_input("t0", revision).id == "t0"
+        finally:
+            conn.set_trace_callback(None)
+
+    assert statements == []
+
+
+def test_page_cache_hits_are_not_validated_again(client, db, monkeypatch):
+    db.upsert_processed_input(
+        ProcessedInput(id="t0", timestamp="2024", title="T", content="C" * 2000)
+    )
+    validated = []
+    loads = TopicListSchema.loads
+
+    def counting_loads(self, *args, **kwargs):
+        validated.append(args)
+        return loads(self, *args, **kwargs)
+
+    monkeypatch.setattr(TopicListSchema, "loads", counting_loads)
+
+    headers = {"Accept-Encoding": "gzip"}
+    miss = client.get("/topics?limit=10", headers=headers)
+    hit = client.get("/topics?limit=10", headers=headers)
+
+    assert len(validated) == 1
+    assert hit.status_code == 200
+    assert hit.data == miss.data
+    assert hit.headers["ETag"] == miss.headers["ETag"]
+    # Sent past rebar, but still through the after_request hooks
+    assert hit.headers["Content-Encoding"] == "gzip"
@@ -0,0 +1,73 @@
+import covered.models.database as database
+from covered.models.data import PlaybackContent, ProcessedInput
+from covered.utils.db_pool import get_pool
+from covered.utils.migrations import run_migrations
+
+
+def _p_input(i: int) -> ProcessedInput:
+    return ProcessedInput(
+        id=f"t{i}", timestamp=f"2024-01-01T00:00:{i:02d}", title="T", content="C"
+    )
+
+
+def _all_changes(db: database.Database, since: int, limit: int):
+    topic_ids = []
+    while True:
+        topics, last_revision = db.get_topic_changes(since, limit)
+        topic_ids.extend(topic.id for topic in topics)
+        if last_revision is None:
+            return topic_ids
+        since = last_revision
+
+
+def test_pages_through_a_batch_larger_than_the_limit(db):
+    db.initialize()
+    db.upsert_processed_inputs_many([_p_input(i) for i in range(10)])
+
+    assert _all_changes(db, since=0, limit=3) == [f"t{i}" for i in range(10)]
+
+
+def test_pages_through_rows_stamped_by_the_revision_migration(db):
+    # An archive from before per-row revisions, upgraded in one go
+    pool = get_pool(db.db_path)
+    run_migrations(pool, database.MIGRATIONS[:3])
+    with pool.writer() as conn:
+        conn.executemany(
+            """
+            INSERT INTO processed_inputs (id, timestamp, title, content)
+            VALUES (?, ?, 'T', 'C')
+        """,
+            [(f"t{i}", f"2024-01-01T00:00:{i:02d}") for i in range(5)],
+        )
+    run_migrations(pool, database.MIGRATIONS[:4])
+
+    db.initialize()
+
+    assert _all_changes(db, since=0, limit=2) == [f"t{i}" for i in range(5)]
+
+
+def _playback(playback_id: str, topic_id: str) -> PlaybackContent:
+    return PlaybackContent(
+        id=playback_id,
+        processed_input_id=topic_id,
+        page_snapshot_url="snapshot.png",
+        script_json_url="script.json",
+        m4a_file_url="audio.m4a",
+    )
+
+
+def test_includes_only_the_latest_playback_content(db):
+    db.initialize()
+    db.upsert_processed_input(_p_input(0))
+    db.upsert_topic_playback("t0", _playback("p0", "t0"))
+    db.upsert_topic_playback("t0", _playback("p1", "t0"))
+
+    topics, _ = db.get_topic_changes(0, 10)
+
+    assert [(t.id, t.playback_content.id) for t in topics] == [("t0", "p1")]
+
+
+def test_rejects_a_revision_beyond_sqlite_integers(client):
+    response = client.get("/topics/changes?since=99999999999999999999")
+
+    assert response.status_code == 400
@@ -0,0 +1,52 @@
+import covered.main as main
+
+
+def _events(response):
+    """Returns the (event, data) pairs of a finished event stream."""
+    messages = response.get_data(as_text=True).split("\n\n")
+    events = []
+    for message in messages:
+        fields = dict(
+            line.split(": ", 1) for line in message.splitlines() if ": " in line
+        )
+        if "event" in fields:
+            events.append((fields["event"], fields["data"]))
+    return events
+
+
+def test_streams_every_topic_of_a_batch_larger_than_a_page(client, monkeypatch):
+    monkeypatch.setattr(main, "TOPIC_EVENTS_MAX_DURATION", 0.5)
+    monkeypatch.setattr(main, "TOPIC_EVENTS_POLL_INTERVAL", 0.05)
+    count = main.TOPICS_PAGE_SIZE_MAX + 50
+    client.post(
+        "/processed-inputs/batch",
+        json={
+            "processed_inputs": [
+                {"id": f"t{i}", "timestamp": "2024", "title": "T", "content": "C"}
+                for i in range(count)
+            ]
+        },
+    )
+
+    events = _events(client.get("/topics/events?since=0"))
+
+    assert len(events) == count
+    assert {event for event, _ in events} == {"topic-created"}
+
+
+def test_asks_clients_past_the_stream_limit_to_retry_later(client, monkeypatch):
+    streams = main.threading.BoundedSemaphore(1)
+    monkeypatch.setattr(main, "topic_event_streams", streams)
+    streams.acquire()
+
+    body = client.get("/topics/events").get_data(as_text=True)
+
+    assert body == f"retry: {main.TOPIC_EVENTS_BUSY_RETRY_MS}\n\n"
+
+
+def test_rejects_a_last_event_id_beyond_sqlite_integers(client):
+    response = client.get(
+        "/topics/events", headers={"Last-Event-ID": "99999999999999999999"}
+    )
+
+    assert response.status_code == 400
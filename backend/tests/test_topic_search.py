@@ -0,0 +1,28 @@
+import pytest
+
+from covered.models.data import ProcessedInput
+
+
+@pytest.mark.parametrize("cursor", ["²", "99999999999999999999", "-1", "1\n", "x"])
+def test_rejects_invalid_cursors(client, cursor):
+    response = client.get("/topics/search", query_string={"q": "x", "cursor": cursor})
+
+    assert response.status_code == 400
+
+
+def test_pages_through_results(client, db):
+    db.upsert_processed_inputs_many(
+        [
+            ProcessedInput(id=f"t{i}", timestamp="2024", title="zebra", content="C")
+            for i in range(3)
+        ]
+    )
+
+    first = client.get("/topics/search?q=zebra&limit=2").get_json()
+    second = client.get(
+        "/topics/search", query_string={"q": "zebra", "cursor": first["next_cursor"]}
+    ).get_json()
+
+    assert first["next_cursor"] == "2"
+    assert len(second["topics"]) == 1
+    assert second["next_cursor"] is None
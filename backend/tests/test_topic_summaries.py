@@ -0,0 +1,36 @@
+from flask_rebar import SwaggerV3Generator
+
+from covered.main import registry
+
+
+def _post_topic(client, topic_id: str):
+    client.post(
+        "/processed-inputs",
+        json={"id": topic_id, "timestamp": "2024", "title": "T", "content": "C"},
+    )
+
+
+def test_summaries_leave_out_the_content(client):
+    _post_topic(client, "t0")
+
+    for query in ("", "?limit=10"):
+        response = client.get(f"/topics/summaries{query}")
+        assert response.status_code == 200
+        [summary] = response.get_json()["topics"]
+        assert summary["id"] == "t0"
+        assert "content" not in summary and "processed_input" not in summary
+
+
+def test_full_record_is_served_by_id(client):
+    _post_topic(client, "t0")
+
+    assert client.get("/topics/t0").get_json()["processed_input"]["content"] == "C"
+    assert client.get("/topics/missing").status_code == 404
+
+
+def test_spec_declares_the_summary_schema(client):
+    spec = SwaggerV3Generator().generate(registry)
+
+    response = spec["paths"]["/topics/summaries"]["get"]["responses"]["200"]
+    schema = response["content"]["application/json"]["schema"]["$ref"]
+    assert schema.endswith("/TopicSummaryListSchema")